@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 GIS OPS UG
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+#
+"""
+Compares formatting the locations of big matrix requests coordinate by coordinate with
+:func:`routingpy.convert.format_float` to :func:`routingpy.convert.format_locations`, for lists and,
+if NumPy is installed, arrays. Run it from the repository root:
+
+    PYTHONPATH=. python benchmarks/format_locations.py --locations 10000
+"""
+import argparse
+import random
+import timeit
+
+from routingpy import convert
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+def format_nested(locations):
+    return convert.delimit_list(
+        [convert.delimit_list([convert.format_float(f) for f in pair]) for pair in locations], ";"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--locations", type=int, default=10000, help="number of locations")
+    parser.add_argument("--runs", type=int, default=20, help="number of runs per variant")
+    args = parser.parse_args()
+
+    locations = [[random.uniform(-180, 180), random.uniform(-90, 90)] for _ in range(args.locations)]
+    variants = [
+        ("format_float", format_nested, locations),
+        ("format_locations (list)", convert.format_locations, locations),
+    ]
+    if np is not None:
+        variants.append(("format_locations (array)", convert.format_locations, np.array(locations)))
+
+    expected = format_nested(locations)
+    print("{:<28} {:>10} {:>8}".format("variant", "ms", "speedup"))
+    baseline = None
+    for name, function, arg in variants:
+        assert function(arg) == expected
+        ms = min(timeit.repeat(lambda: function(arg), number=1, repeat=args.runs)) * 1000
+        baseline = baseline or ms
+        print("{:<28} {:>10.2f} {:>8.2f}".format(name, ms, baseline / ms))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 GIS OPS UG
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+#
+"""
+Measures the cold import time of routingpy in fresh interpreters, with Python's ``-X importtime``,
+for importing the package, a single router and all routers. Run it from the repository root:
+
+    PYTHONPATH=. python benchmarks/import_time.py --runs 20
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = [
+    "import routingpy",
+    "from routingpy import OSRM",
+    "from routingpy import Valhalla",
+    "from routingpy.routers import *",
+]
+
+
+def import_time(statement):
+    """Returns the cumulative import time of the statement in microseconds."""
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        env=dict(os.environ, PYTHONDONTWRITEBYTECODE="1"),
+    ).stderr.decode("utf-8")
+
+    total = 0
+    for line in output.splitlines():
+        # "import time: self [us] | cumulative | imported package", top level imports aren't indented
+        _, _, rest = line.partition(":")
+        parts = rest.split("|")
+        if len(parts) == 3 and parts[0].strip().isdigit() and not parts[2].startswith("  "):
+            total += int(parts[1])
+
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument(
+        "--runs", type=int, default=10, help="number of fresh interpreters per statement"
+    )
+    args = parser.parse_args()
+
+    print("{:<36} {:>12} {:>12}".format("statement", "median (ms)", "min (ms)"))
+    for statement in STATEMENTS:
+        times = [import_time(statement) / 1000 for _ in range(args.runs)]
+        print("{:<36} {:>12.1f} {:>12.1f}".format(statement, statistics.median(times), min(times)))
+
+
+if __name__ == "__main__":
+    main()
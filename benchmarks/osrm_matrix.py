@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 GIS OPS UG
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+#
+"""
+Compares the response size, the time to decode and parse and the memory of the parsed matrix of OSRM's JSON
+and FlatBuffers table responses, for square matrices of increasing size. Run it from the repository root:
+
+    PYTHONPATH=. python benchmarks/osrm_matrix.py --sizes 100 500 1000
+"""
+import argparse
+import json
+import random
+import struct
+import timeit
+import tracemalloc
+
+from routingpy.routers import OSRM
+
+
+def make_bodies(size):
+    durations = [round(random.uniform(0, 10000), 1) for _ in range(size * size)]
+    distances = [round(random.uniform(0, 200000), 1) for _ in range(size * size)]
+
+    rows = [slice(i * size, (i + 1) * size) for i in range(size)]
+    body = {
+        "code": "Ok",
+        "durations": [durations[row] for row in rows],
+        "distances": [distances[row] for row in rows],
+    }
+
+    # FBResult with only the table (field 5) set, at byte 20 after the root offset and its vtable, and
+    # the Table with durations (0), rows (1), cols (2) and distances (3) at byte 40 after its vtable
+    n = size * size
+    fbresult = struct.pack("<I", 20)
+    fbresult += struct.pack("<HH6H", 16, 8, 0, 0, 0, 0, 0, 4) + struct.pack("<iI", 16, 16)
+    fbresult += struct.pack("<HH4H", 12, 16, 4, 8, 10, 12) + struct.pack(
+        "<iIHHI", 12, 12, size, size, 8 + 4 * n
+    )
+    fbresult += struct.pack("<I{}f".format(n), n, *durations) + struct.pack(
+        "<I{}f".format(n), n, *distances
+    )
+    return json.dumps(body).encode("utf-8"), fbresult
+
+
+def parse_json(body):
+    return OSRM.parse_matrix_json(json.loads(body))
+
+
+def parse_flatbuffers(body):
+    return OSRM.parse_matrix_flatbuffers(body)
+
+
+def parsed_size(parse, body):
+    """Returns the memory allocated for the parsed matrix in MB."""
+    tracemalloc.start()
+    matrix = parse(body)  # noqa: F841
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size / 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 500, 1000], help="matrix sizes")
+    parser.add_argument("--runs", type=int, default=5, help="number of runs per format")
+    args = parser.parse_args()
+
+    print(
+        "{:>6} {:>9} {:>9} {:>9} {:>9} {:>11} {:>11}".format(
+            "size", "json MB", "fb MB", "json ms", "fb ms", "json mem MB", "fb mem MB"
+        )
+    )
+    for size in args.sizes:
+        bodies = make_bodies(size)
+        parsers = (parse_json, parse_flatbuffers)
+        durations = [parse(body).durations for parse, body in zip(parsers, bodies)]
+        assert all(abs(a - b) < 0.01 for a, b in zip(durations[0][-1], durations[1][-1]))
+        times = [
+            min(timeit.repeat(lambda: parse(body), number=1, repeat=args.runs)) * 1000
+            for parse, body in zip(parsers, bodies)
+        ]
+        memory = [parsed_size(parse, body) for parse, body in zip(parsers, bodies)]
+        print(
+            "{:>6} {:>9.1f} {:>9.1f} {:>9.1f} {:>9.1f} {:>11.1f} {:>11.1f}".format(
+                size, len(bodies[0]) / 1e6, len(bodies[1]) / 1e6, *times, *memory
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
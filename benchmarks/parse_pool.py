@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 GIS OPS UG
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+#
+"""
+Measures the throughput of decoding and parsing big Valhalla /expansion responses from several threads,
+once in the threads themselves and once offloaded to a :class:`routingpy.parse_pool.ParsePool` with
+increasing numbers of worker processes. Run it from the repository root:
+
+    PYTHONPATH=. python benchmarks/parse_pool.py --responses 64 --edges 50000
+"""
+import argparse
+import json
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from routingpy.parse_pool import ParsePool
+from routingpy.routers import Valhalla
+
+PROPERTIES = ["durations", "distances", "costs"]
+
+
+def make_body(n_edges):
+    lines, durations, distances, costs = [], [], [], []
+    for _ in range(n_edges):
+        lon, lat = random.uniform(8, 9), random.uniform(49, 50)
+        lines.append([[lon, lat], [lon + 0.0001, lat + 0.0001]])
+        durations.append(random.randint(0, 1000))
+        distances.append(random.randint(0, 10000))
+        costs.append(random.randint(0, 1000))
+
+    response = {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "geometry": {"type": "MultiLineString", "coordinates": lines},
+                "properties": {"durations": durations, "distances": distances, "costs": costs},
+            }
+        ],
+    }
+    return json.dumps(response).encode("utf-8")
+
+
+def parse_in_thread(body):
+    return Valhalla.parse_expansion_json(json.loads(body), [8.5, 49.5], PROPERTIES, "time")
+
+
+def run(bodies, threads, pool=None):
+    def work(body):
+        if pool is None:
+            return parse_in_thread(body)
+        return pool.parse(Valhalla.parse_expansion_json, body, [8.5, 49.5], PROPERTIES, "time")
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as executor:
+        list(executor.map(work, bodies))
+    return len(bodies) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--responses", type=int, default=32, help="number of responses to parse")
+    parser.add_argument("--edges", type=int, default=20000, help="number of edges per response")
+    parser.add_argument("--threads", type=int, default=16, help="number of requesting threads")
+    args = parser.parse_args()
+
+    body = make_body(args.edges)
+    bodies = [body] * args.responses
+    print("response size: {:.1f} MB".format(len(body) / 1e6))
+
+    baseline = run(bodies, args.threads)
+    print("{:>12} {:>12} {:>8}".format("workers", "responses/s", "speedup"))
+    print("{:>12} {:>12.2f} {:>8.2f}".format("threads", baseline, 1))
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        with ParsePool(max_workers=workers) as pool:
+            # warm up the worker processes
+            run(bodies[:workers], workers, pool)
+            throughput = run(bodies, args.threads, pool)
+        print("{:>12} {:>12.2f} {:>8.2f}".format(workers, throughput, throughput / baseline))
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 GIS OPS UG
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+#
+"""
+Compares the latency of OSRM /table requests to a local stand-in server over TCP loopback and over a
+Unix domain socket with :class:`routingpy.client_unix.UnixSocketClient`. Run it from the repository root:
+
+    PYTHONPATH=. python benchmarks/unix_socket.py --requests 2000 --locations 10
+"""
+import argparse
+import json
+import os
+import socketserver
+import statistics
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+
+from routingpy.client_default import Client
+from routingpy.client_unix import UnixSocketClient
+from routingpy.routers import OSRM
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = self.server.body
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self):
+        return "local"
+
+    def log_message(self, *args):
+        pass
+
+
+class TCPHandler(Handler):
+    # headers and body are written separately, avoid delayed ACK stalls on loopback
+    disable_nagle_algorithm = True
+
+
+class TCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def serve(server, body):
+    server.body = body
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run(router, locations, n_requests):
+    # warm up the connection pool
+    router.matrix(locations)
+
+    latencies = []
+    for _ in range(n_requests):
+        start = time.perf_counter()
+        router.matrix(locations)
+        latencies.append(time.perf_counter() - start)
+
+    latencies.sort()
+    return (
+        statistics.mean(latencies) * 1e6,
+        latencies[len(latencies) // 2] * 1e6,
+        latencies[int(len(latencies) * 0.99)] * 1e6,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--requests", type=int, default=1000, help="number of requests per transport")
+    parser.add_argument("--locations", type=int, default=10, help="number of matrix locations")
+    args = parser.parse_args()
+
+    n = args.locations
+    locations = [[8.68 + i * 0.001, 49.42 + i * 0.001] for i in range(n)]
+    body = json.dumps(
+        {"code": "Ok", "durations": [[60.0] * n] * n, "distances": [[1000.0] * n] * n}
+    ).encode("utf-8")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        socket_path = os.path.join(tmpdir, "osrm.sock")
+        tcp = serve(TCPServer(("127.0.0.1", 0), TCPHandler), body)
+        unix = serve(UnixServer(socket_path, Handler), body)
+
+        routers = [
+            ("tcp", OSRM(base_url="http://127.0.0.1:{}".format(tcp.server_address[1]), client=Client)),
+            ("unix", OSRM(base_url="unix://" + socket_path, client=UnixSocketClient)),
+        ]
+
+        print("{:>8} {:>10} {:>10} {:>10}".format("", "mean (us)", "p50 (us)", "p99 (us)"))
+        for name, router in routers:
+            print(
+                "{:>8} {:>10.1f} {:>10.1f} {:>10.1f}".format(
+                    name, *run(router, locations, args.requests)
+                )
+            )
+
+        for server in (tcp, unix):
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == "__main__":
+    main()
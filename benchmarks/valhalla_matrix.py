@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 GIS OPS UG
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+#
+"""
+Compares the response size and the time to decode and parse Valhalla's verbose matrix format with the
+concise format of ``verbose=False``, for square matrices of increasing size. Run it from the repository
+root:
+
+    PYTHONPATH=. python benchmarks/valhalla_matrix.py --sizes 100 500 1000
+"""
+import argparse
+import json
+import random
+import timeit
+
+from routingpy.routers import Valhalla
+
+
+def make_bodies(size):
+    durations = [[random.randint(0, 10000) for _ in range(size)] for _ in range(size)]
+    distances = [[round(random.uniform(0, 200), 3) for _ in range(size)] for _ in range(size)]
+
+    verbose = {
+        "sources_to_targets": [
+            [
+                {"distance": distances[i][j], "time": durations[i][j], "to_index": j, "from_index": i}
+                for j in range(size)
+            ]
+            for i in range(size)
+        ],
+        "units": "kilometers",
+    }
+    concise = {
+        "sources_to_targets": {"durations": durations, "distances": distances},
+        "units": "kilometers",
+    }
+    return json.dumps(verbose).encode("utf-8"), json.dumps(concise).encode("utf-8")
+
+
+def parse(body):
+    return Valhalla.parse_matrix_json(json.loads(body), "km")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 500, 1000], help="matrix sizes")
+    parser.add_argument("--runs", type=int, default=5, help="number of runs per format")
+    args = parser.parse_args()
+
+    print(
+        "{:>6} {:>12} {:>12} {:>12} {:>12} {:>8}".format(
+            "size", "verbose MB", "concise MB", "verbose ms", "concise ms", "speedup"
+        )
+    )
+    for size in args.sizes:
+        verbose, concise = make_bodies(size)
+        assert parse(verbose).distances == parse(concise).distances
+        times = [
+            min(timeit.repeat(lambda: parse(body), number=1, repeat=args.runs)) * 1000
+            for body in (verbose, concise)
+        ]
+        print(
+            "{:>6} {:>12.1f} {:>12.1f} {:>12.1f} {:>12.1f} {:>8.1f}".format(
+                size, len(verbose) / 1e6, len(concise) / 1e6, times[0], times[1], times[0] / times[1]
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
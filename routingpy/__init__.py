@@ -29,7 +29,20 @@ Take a look at our `Examples`_ to see how simple you can compare routes from dif
 .. _`Examples`: https://github.com/gis-ops/routing-py#examples
 """
 
-from .routers import *  # noqa: F401
+from . import routers as _routers
+from .exceptions import RouterNotFound  # noqa: F401
+from .routers import get_router_by_name  # noqa: F401
 
-# Delete so options is only available over routingpy.routers.options
-del options  # noqa: F821
+__all__ = list(_routers._ROUTER_MODULES) + ["get_router_by_name", "RouterNotFound"]
+
+
+def __getattr__(name):
+    # Routers are imported lazily by routingpy.routers,
+    # options is only available over routingpy.routers.options
+    if name in _routers._ROUTER_MODULES:
+        return getattr(_routers, name)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_routers._ROUTER_MODULES))
@@ -0,0 +1,317 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 GIS OPS UG
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+#
+"""
+:func:`batch` runs many requests against a router method with bounded concurrency, :class:`Journal` makes
+such a batch resumable.
+"""
+import hashlib
+import json
+import os
+import pickle
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from . import exceptions
+
+# Errors which are carried on the individual result instead of aborting the whole batch
+_CARRIED_ERRORS = (
+    exceptions.RouterError,
+    exceptions.Timeout,
+    exceptions.JSONParseError,
+    exceptions.RetriableRequest,
+)
+
+
+class BatchResult(object):
+    """
+    Contains the outcome of a single batch item. Access via properties ``index``, ``request``, ``result``
+    and ``error``.
+    """
+
+    def __init__(self, index, request, result=None, error=None):
+        self._index = index
+        self._request = request
+        self._result = result
+        self._error = error
+
+    @property
+    def index(self) -> int:
+        """
+        The position of the request in the input iterable.
+
+        :rtype: int
+        """
+        return self._index
+
+    @property
+    def request(self) -> dict:
+        """
+        The keyword arguments the router method was called with.
+
+        :rtype: dict
+        """
+        return self._request
+
+    @property
+    def result(self) -> Optional[Any]:
+        """
+        The parsed router response, e.g. a :class:`routingpy.direction.Direction`. None if the request failed.
+
+        :rtype: object or None
+        """
+        return self._result
+
+    @property
+    def error(self) -> Optional[Exception]:
+        """
+        The exception raised while requesting, None if the request succeeded.
+
+        :rtype: Exception or None
+        """
+        return self._error
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether the request succeeded.
+
+        :rtype: bool
+        """
+        return self._error is None
+
+    def __repr__(self):  # pragma: no cover
+        return "BatchResult({}, {}, {})".format(self.index, self.result, self.error)
+
+
+class Journal(object):
+    """
+    Append-only record of completed batch requests. Pass it to :func:`batch` to skip requests which already
+    succeeded in a previous run, so a crashed job only repeats the requests which were in flight.
+
+    Each successful result is pickled and appended to ``path`` together with the key of its request. Failed
+    requests are not recorded and will be retried on the next run. A record truncated by a crash is discarded
+    when the journal is opened again.
+
+    Only open journals you created yourself, since loading unpickles the file's content.
+
+    >>> from routingpy.batch import Journal, batch
+    >>> with Journal("directions.journal") as journal:
+    ...     for res in batch(router.directions, requests, journal=journal):
+    ...         print(res.index, res.result)
+    """
+
+    def __init__(self, path: str, key: Optional[Callable[[dict], str]] = None):
+        """
+        :param path: Path of the journal file. Will be created if it doesn't exist.
+        :type path: str
+
+        :param key: Function returning a unique string for a request's keyword arguments. Defaults to a hash
+            of the request's JSON representation with sorted keys. Pass your own for requests containing values
+            without a stable JSON representation, e.g. :class:`routingpy.routers.Valhalla.Waypoint`.
+        :type key: callable
+        """
+        self._path = path
+        self._key = key or _request_key
+        self._lock = threading.Lock()
+        self._results = dict()
+
+        self._load()
+        self._file = open(path, "ab")
+
+    def _load(self):
+        if not os.path.exists(self._path):
+            return
+
+        valid_size = 0
+        with open(self._path, "rb") as f:
+            while True:
+                try:
+                    key, result = pickle.load(f)
+                except EOFError:
+                    break
+                except (pickle.UnpicklingError, ValueError, TypeError, AttributeError):
+                    # Partially written record from an interrupted run
+                    break
+                self._results[key] = result
+                valid_size = f.tell()
+
+        if os.path.getsize(self._path) != valid_size:
+            os.truncate(self._path, valid_size)
+
+    def key(self, request: dict) -> str:
+        """
+        Returns the key the request is recorded under.
+
+        :param request: The keyword arguments of the router method.
+        :type request: dict
+
+        :rtype: str
+        """
+        return self._key(request)
+
+    def __contains__(self, request):
+        return self.key(request) in self._results
+
+    def __len__(self):
+        return len(self._results)
+
+    def get(self, request: dict) -> Optional[Any]:
+        """
+        Returns the recorded result of a request, None if it wasn't completed yet.
+
+        :param request: The keyword arguments of the router method.
+        :type request: dict
+
+        :rtype: object or None
+        """
+        return self._results.get(self.key(request))
+
+    def record(self, request: dict, result: Any):
+        """
+        Appends the result of a completed request to the journal.
+
+        :param request: The keyword arguments of the router method.
+        :type request: dict
+
+        :param result: The router method's return value.
+        :type result: object
+        """
+        key = self.key(request)
+        record = pickle.dumps((key, result), protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._file.write(record)
+            self._file.flush()
+            self._results[key] = result
+
+    def close(self):
+        """Closes the journal file."""
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def _request_key(request):
+    serialized = json.dumps(request, sort_keys=True, default=repr)
+    return hashlib.sha1(serialized.encode("utf-8")).hexdigest()
+
+
+def _execute(method, index, request, journal=None):
+    try:
+        result = method(**request)
+    except _CARRIED_ERRORS as e:
+        return BatchResult(index, request, error=e)
+
+    if journal is not None:
+        journal.record(request, result)
+
+    return BatchResult(index, request, result=result)
+
+
+def _completed(result):
+    future = Future()
+    future.set_result(result)
+    return future
+
+
+def batch(
+    method: Callable,
+    requests: Iterable[dict],
+    max_workers: int = 4,
+    ordered: bool = True,
+    max_pending: Optional[int] = None,
+    journal: Optional[Journal] = None,
+) -> Iterator[BatchResult]:
+    """
+    Calls a router method, e.g. ``router.directions``, for every set of keyword arguments in ``requests``
+    and yields a :class:`BatchResult` per request.
+
+    Errors raised by the router (see :class:`routingpy.exceptions.RouterError`, :class:`routingpy.exceptions.Timeout`
+    etc.) don't abort the batch, but are carried on the respective result's ``error`` property.
+
+    The input iterable is consumed lazily: at most ``max_pending`` requests are submitted but not yet yielded,
+    so arbitrarily large (or infinite) generators can be processed in constant memory.
+
+    >>> from routingpy import OSRM
+    >>> from routingpy.batch import batch
+    >>> router = OSRM()
+    >>> requests = ({"locations": pair, "profile": "bike"} for pair in od_pairs)
+    >>> for res in batch(router.directions, requests, max_workers=8):
+    ...     print(res.index, res.result.duration if res.ok else res.error)
+
+    :param method: A bound router method, e.g. ``router.directions`` or ``router.matrix``.
+    :type method: callable
+
+    :param requests: Keyword arguments for each call of ``method``.
+    :type requests: iterable of dict
+
+    :param max_workers: Number of requests executed concurrently. Default 4.
+    :type max_workers: int
+
+    :param ordered: If True, results are yielded in input order, else as they complete. Default True.
+    :type ordered: bool
+
+    :param max_pending: Maximum number of requests pulled from ``requests`` which were not yet yielded.
+        Default ``2 * max_workers``.
+    :type max_pending: int
+
+    :param journal: Records successful results and skips requests which already have a record, so an
+        interrupted batch can be resumed.
+    :type journal: :class:`Journal`
+
+    :returns: A generator of results.
+    :rtype: Iterator[:class:`BatchResult`]
+    """
+    max_pending = max_pending or 2 * max_workers
+    if max_pending < max_workers:
+        raise ValueError("max_pending must not be smaller than max_workers.")
+
+    items = enumerate(requests)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending = deque()
+
+    def _fill(limit):
+        while len(pending) < limit:
+            try:
+                index, request = next(items)
+            except StopIteration:
+                return
+            if journal is not None and request in journal:
+                pending.append(_completed(BatchResult(index, request, result=journal.get(request))))
+            else:
+                pending.append(executor.submit(_execute, method, index, request, journal))
+
+    try:
+        _fill(max_pending)
+        while pending:
+            if ordered:
+                yield pending.popleft().result()
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+                    yield future.result()
+            _fill(max_pending)
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
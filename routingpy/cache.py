@@ -0,0 +1,569 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 GIS OPS UG
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+#
+"""
+Caches which avoid requesting results routingpy already received.
+"""
+import json
+import math
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Dict, List, Optional, Sequence, Union
+
+from . import exceptions
+from .isochrone import Isochrones
+from .matrix import Matrix
+
+
+class _LRUDict(object):
+    """Thread-safe mapping which evicts the least recently used entries beyond ``maxsize``."""
+
+    def __init__(self, maxsize=None):
+        self._data = OrderedDict()
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return default
+            return self._data[key]
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if self._maxsize is not None and len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+def _router_key(router):
+    return type(router).__name__, getattr(router.client, "base_url", None)
+
+
+def _options_key(options):
+    return json.dumps(options, sort_keys=True, default=repr)
+
+
+class MatrixCache(object):
+    """
+    Caches matrix results per cell, i.e. per origin-destination pair, instead of per request. A request for
+    a matrix only asks the router for the cells which aren't cached yet, which matters most for providers
+    billing per matrix element, like Google or HERE.
+
+    Cells are keyed by router, profile, the remaining request options and the origin's and destination's
+    coordinates rounded to ``precision`` decimals.
+
+    The missing cells are grouped by rows which miss the same set of destinations, and each group is requested
+    as one sub-matrix. So already cached cells are never requested again, while the common cases, e.g. a few
+    new locations in an otherwise cached matrix, need no more than two requests.
+
+    >>> from routingpy import Google
+    >>> from routingpy.cache import MatrixCache
+    >>> cache = MatrixCache(Google(api_key=key))
+    >>> matrix = cache.matrix(locations, profile="driving")
+    >>> matrix = cache.matrix(locations + [[13.38, 52.51]], profile="driving")  # only requests the new cells
+    """
+
+    def __init__(self, router, precision: int = 6, maxsize: Optional[int] = None):
+        """
+        :param router: A router instance whose ``matrix`` method supports ``sources`` and ``destinations``.
+
+        :param precision: Number of decimals the coordinates are rounded to for the cache key. Default 6.
+        :type precision: int
+
+        :param maxsize: Maximum number of cached cells, the least recently used are evicted first. Default unlimited.
+        :type maxsize: int
+        """
+        self._router = router
+        self._precision = precision
+        self._cells = _LRUDict(maxsize)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _cell_key(self, profile, options, origin, destination):
+        return (
+            _router_key(self._router),
+            profile,
+            options,
+            tuple(round(float(c), self._precision) for c in origin[:2]),
+            tuple(round(float(c), self._precision) for c in destination[:2]),
+        )
+
+    def matrix(
+        self,
+        locations: List[List[float]],
+        profile: str,
+        sources: Optional[List[int]] = None,
+        destinations: Optional[List[int]] = None,
+        **matrix_kwargs
+    ) -> Matrix:
+        """
+        Gets the matrix from the cache and the router. Takes the same arguments as the router's ``matrix`` method.
+
+        :param locations: The locations as [[lon, lat], ...].
+        :type locations: list of list
+
+        :param profile: The router's profile.
+        :type profile: str
+
+        :param sources: A list of indices that refer to the list of locations
+            (starting with 0). If not passed, all indices are considered.
+        :type sources: list of int
+
+        :param destinations: A list of indices that refer to the list of locations
+            (starting with 0). If not passed, all indices are considered.
+        :type destinations: list of int
+
+        :param matrix_kwargs: Any other arguments of the router's ``matrix`` method.
+
+        :returns: A matrix from the specified sources and destinations. Its ``raw`` property is None.
+        :rtype: :class:`routingpy.matrix.Matrix`
+        """
+        sources = list(range(len(locations))) if sources is None else list(sources)
+        destinations = list(range(len(locations))) if destinations is None else list(destinations)
+        options = _options_key(matrix_kwargs)
+
+        keys = [
+            [self._cell_key(profile, options, locations[s], locations[d]) for d in destinations]
+            for s in sources
+        ]
+        cells = [[self._cells.get(key) for key in row] for row in keys]
+
+        # Group the rows by the set of destinations they miss
+        missing = defaultdict(list)
+        for row, row_cells in enumerate(cells):
+            cols = tuple(col for col, cell in enumerate(row_cells) if cell is None)
+            if cols:
+                missing[cols].append(row)
+
+        misses = sum(len(cols) * len(rows) for cols, rows in missing.items())
+        with self._lock:
+            self.hits += len(sources) * len(destinations) - misses
+            self.misses += misses
+
+        for cols, rows in missing.items():
+            fetched = self._fetch(
+                locations,
+                profile,
+                [sources[row] for row in rows],
+                [destinations[col] for col in cols],
+                matrix_kwargs,
+            )
+            for i, row in enumerate(rows):
+                for j, col in enumerate(cols):
+                    cells[row][col] = fetched[i][j] if fetched else (None, None)
+                    if fetched:
+                        self._cells[keys[row][col]] = fetched[i][j]
+
+        has_durations = any(cell[0] is not None for row in cells for cell in row)
+        has_distances = any(cell[1] is not None for row in cells for cell in row)
+        return Matrix(
+            durations=[[cell[0] for cell in row] for row in cells] if has_durations else None,
+            distances=[[cell[1] for cell in row] for row in cells] if has_distances else None,
+        )
+
+    def _fetch(self, locations, profile, sources, destinations, matrix_kwargs):
+        """
+        Requests a sub-matrix with only the needed locations and returns its cells as (duration, distance).
+        Returns None if the router returned an empty matrix, e.g. for a skipped API error.
+        """
+        sub_locations, positions = [], {}
+        for idx in sources + destinations:
+            if idx not in positions:
+                positions[idx] = len(sub_locations)
+                sub_locations.append(locations[idx])
+
+        matrix = self._router.matrix(
+            sub_locations,
+            profile,
+            sources=[positions[idx] for idx in sources],
+            destinations=[positions[idx] for idx in destinations],
+            **matrix_kwargs
+        )
+        durations, distances = matrix.durations, matrix.distances
+        if durations is None and distances is None:
+            return
+
+        return [
+            [
+                (
+                    durations[i][j] if durations is not None else None,
+                    distances[i][j] if distances is not None else None,
+                )
+                for j in range(len(destinations))
+            ]
+            for i in range(len(sources))
+        ]
+
+    def __len__(self):
+        return len(self._cells)
+
+    def clear(self):
+        """Removes all cached cells."""
+        self._cells.clear()
+
+
+class NegativeCache(object):
+    """
+    Remembers API errors which will occur again for the same request, e.g. a location which can't be snapped
+    to the road network, for a short time. Pass it to a router, which will raise the remembered error
+    (or return an empty result with ``skip_api_error``) without sending the request again.
+
+    Only :class:`routingpy.exceptions.RouterApiError` with a status in ``statuses`` are cached, so rate limits,
+    server errors and timeouts are never remembered.
+
+    >>> from routingpy import Valhalla
+    >>> from routingpy.cache import NegativeCache
+    >>> negative_cache = NegativeCache(ttl=600)
+    >>> router = Valhalla(negative_cache=negative_cache, skip_api_error=True)
+    >>> for locations in od_pairs:
+    ...     router.directions(locations, "auto")
+    >>> print(negative_cache.avoided)
+    """
+
+    def __init__(
+        self, ttl: float = 300, statuses: Sequence[int] = (400, 404, 422), maxsize: Optional[int] = 10000
+    ):
+        """
+        :param ttl: Seconds an error is remembered. Default 300.
+        :type ttl: float
+
+        :param statuses: HTTP status codes of errors which are deterministic for the router. Default (400, 404, 422).
+        :type statuses: list of int
+
+        :param maxsize: Maximum number of remembered errors, the least recently used are evicted first.
+            Default 10000.
+        :type maxsize: int
+        """
+        self._ttl = ttl
+        self._statuses = set(statuses)
+        self._errors = _LRUDict(maxsize)
+        self._lock = threading.Lock()
+        self.avoided = 0
+
+    @staticmethod
+    def key(base_url, url, get_params=None, post_params=None):
+        """
+        Returns the canonical key of a request.
+
+        :rtype: tuple
+        """
+        if isinstance(get_params, dict):
+            get_params = sorted(get_params.items())
+        return (
+            base_url,
+            url,
+            _options_key(list(get_params) if get_params else None),
+            _options_key(post_params),
+        )
+
+    def get(self, key) -> Optional[exceptions.RouterApiError]:
+        """
+        Returns a new instance of the error remembered for the request key and counts the avoided request.
+        None if there's no error remembered or it expired.
+
+        :rtype: :class:`routingpy.exceptions.RouterApiError` or None
+        """
+        entry = self._errors.get(key)
+        if entry is None:
+            return None
+
+        expires, error = entry
+        if time.monotonic() > expires:
+            return None
+
+        with self._lock:
+            self.avoided += 1
+        return type(error)(error.status, error.message)
+
+    def add(self, key, error: exceptions.RouterApiError):
+        """
+        Remembers the error for the request key, if its status is one of the cached statuses.
+
+        :param error: The error raised for the request.
+        :type error: :class:`routingpy.exceptions.RouterApiError`
+        """
+        if error.status in self._statuses:
+            self._errors[key] = (time.monotonic() + self._ttl, error)
+
+    def __len__(self):
+        return len(self._errors)
+
+    def clear(self):
+        """Forgets all errors."""
+        self._errors.clear()
+
+
+class IsochroneCache(object):
+    """
+    Caches the isochrones of a router per interval. Requests for intervals which were all received before,
+    e.g. [600] after [600, 1200, 1800] for the same center, profile and options, don't send a request.
+    Otherwise only the missing intervals are requested.
+
+    Works with routers which return one isochrone per interval, like :class:`routingpy.routers.Valhalla`,
+    :class:`routingpy.routers.ORS` and :class:`routingpy.routers.MapboxOSRM`. Options which apply per interval,
+    like ``colors``, are part of the cache key as a whole.
+
+    >>> from routingpy import Valhalla
+    >>> from routingpy.cache import IsochroneCache
+    >>> cache = IsochroneCache(Valhalla())
+    >>> isochrones = cache.isochrones([8.68, 49.41], "auto", [600, 1200, 1800])
+    >>> isochrones = cache.isochrones([8.68, 49.41], "auto", [600])  # no request
+    """
+
+    def __init__(self, router, maxsize: Optional[int] = 10000):
+        """
+        :param router: A router instance.
+
+        :param maxsize: Maximum number of cached isochrones, the least recently used are evicted first.
+            Default 10000.
+        :type maxsize: int
+        """
+        self._router = router
+        self._isochrones = _LRUDict(maxsize)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def isochrones(
+        self, locations: List[float], profile: str, intervals: List[int], **isochrones_kwargs
+    ):
+        """
+        Gets isochrones from the cache and the router. Takes the same arguments as the router's ``isochrones``.
+
+        :returns: The isochrones in the order of ``intervals``. Its ``raw`` property is None.
+        :rtype: :class:`routingpy.isochrone.Isochrones`
+        """
+        base_key = (
+            _router_key(self._router),
+            profile,
+            _options_key(isochrones_kwargs),
+            _options_key(locations),
+        )
+        isochrones = {
+            int(interval): self._isochrones.get(base_key + (int(interval),)) for interval in intervals
+        }
+
+        missing = [interval for interval in intervals if isochrones[int(interval)] is None]
+        with self._lock:
+            self.hits += len(intervals) - len(missing)
+            self.misses += len(missing)
+
+        if missing:
+            # Routers label the returned polygons assuming ascending intervals
+            fetched = self._router.isochrones(locations, profile, sorted(missing), **isochrones_kwargs)
+            # Empty for skipped API errors
+            for isochrone in fetched:
+                isochrones[isochrone.interval] = isochrone
+                self._isochrones[base_key + (isochrone.interval,)] = isochrone
+
+        return Isochrones(
+            [
+                isochrones[int(interval)]
+                for interval in intervals
+                if isochrones.get(int(interval)) is not None
+            ]
+        )
+
+    def __len__(self):
+        return len(self._isochrones)
+
+    def clear(self):
+        """Removes all cached isochrones."""
+        self._isochrones.clear()
+
+
+_GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def _geohash(lon, lat, length):
+    """Encodes a coordinate as geohash of ``length`` characters."""
+    lon_range, lat_range = [-180.0, 180.0], [-90.0, 90.0]
+    chars, bits, ch, even = [], 0, 0, True
+    while len(chars) < length:
+        rng, value = (lon_range, lon) if even else (lat_range, lat)
+        mid = (rng[0] + rng[1]) / 2
+        ch <<= 1
+        if value >= mid:
+            ch |= 1
+            rng[0] = mid
+        else:
+            rng[1] = mid
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(_GEOHASH_ALPHABET[ch])
+            bits, ch = 0, 0
+
+    return "".join(chars)
+
+
+def _haversine(a, b):
+    """Distance in meters between two [lon, lat] coordinates."""
+    lon1, lat1, lon2, lat2 = map(math.radians, (a[0], a[1], b[0], b[1]))
+    h = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * 6371008.8 * math.asin(math.sqrt(h))
+
+
+class ApproximateCache(object):
+    """
+    Caches ``directions`` and ``matrix`` results of a router by locations snapped to a grid, so that requests
+    with locations a few meters apart, e.g. from GPS, share a result. A cache hit returns the result of the
+    first request in the same grid cells, so the returned geometry starts and ends at that request's locations.
+
+    The grid either rounds coordinates to ``precision`` decimals (5 decimals are ~1 m) or uses geohash cells
+    of ``precision`` characters (7 characters are ~150 m). The precision can be set per profile.
+
+    ``hits``, ``misses``, :attr:`hit_rate` and :attr:`max_error`, the largest distance between a requested location
+    and the location the returned result was computed for, show the trade-off of the chosen precision.
+
+    >>> from routingpy import OSRM
+    >>> from routingpy.cache import ApproximateCache
+    >>> cache = ApproximateCache(OSRM(), precision={"driving": 4, "walking": 5})
+    >>> route = cache.directions([[13.38, 52.51], [13.42, 52.52]], profile="driving")
+    >>> print(cache.hit_rate, cache.max_error)
+    """
+
+    def __init__(
+        self,
+        router,
+        precision: Union[int, Dict[str, int]] = 5,
+        grid: str = "decimal",
+        maxsize: Optional[int] = 10000,
+    ):
+        """
+        :param router: A router instance.
+
+        :param precision: Number of decimals or geohash characters, or a dict mapping profiles to those.
+            Profiles not in the dict are cached by exact locations. Default 5.
+        :type precision: int or dict
+
+        :param grid: One of "decimal" or "geohash". Default "decimal".
+        :type grid: str
+
+        :param maxsize: Maximum number of cached results, the least recently used are evicted first.
+            Default 10000.
+        :type maxsize: int
+        """
+        if grid not in ("decimal", "geohash"):
+            raise ValueError("grid must be either 'decimal' or 'geohash', not {}.".format(grid))
+
+        self._router = router
+        self._precision = precision
+        self._grid = grid
+        self._results = _LRUDict(maxsize)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.max_error = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        The share of requests answered from the cache.
+
+        :rtype: float
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def _snap(self, location, profile):
+        if isinstance(self._precision, dict):
+            precision = self._precision.get(profile)
+        else:
+            precision = self._precision
+
+        if precision is None or not isinstance(location, (list, tuple)):
+            return _options_key(location)
+
+        lon, lat = float(location[0]), float(location[1])
+        if self._grid == "geohash":
+            return _geohash(lon, lat, precision)
+        return round(lon, precision), round(lat, precision)
+
+    def _cached(self, method, locations, profile, kwargs):
+        key = (
+            _router_key(self._router),
+            method,
+            profile,
+            _options_key(kwargs),
+            tuple(self._snap(location, profile) for location in locations),
+        )
+
+        entry = self._results.get(key)
+        if entry is not None:
+            cached_locations, result = entry
+            error = max(
+                (
+                    _haversine(a, b)
+                    for a, b in zip(locations, cached_locations)
+                    if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple))
+                ),
+                default=0.0,
+            )
+            with self._lock:
+                self.hits += 1
+                self.max_error = max(self.max_error, error)
+            return result
+
+        result = getattr(self._router, method)(locations, profile, **kwargs)
+        self._results[key] = (list(locations), result)
+        with self._lock:
+            self.misses += 1
+        return result
+
+    def directions(self, locations: List[List[float]], profile: str, **directions_kwargs):
+        """
+        Gets directions from the cache or the router. Takes the same arguments as the router's ``directions``.
+
+        :rtype: :class:`routingpy.direction.Direction` or :class:`routingpy.direction.Directions`
+        """
+        return self._cached("directions", locations, profile, directions_kwargs)
+
+    def matrix(self, locations: List[List[float]], profile: str, **matrix_kwargs):
+        """
+        Gets a matrix from the cache or the router. Takes the same arguments as the router's ``matrix``.
+
+        :rtype: :class:`routingpy.matrix.Matrix`
+        """
+        return self._cached("matrix", locations, profile, matrix_kwargs)
+
+    def __len__(self):
+        return len(self._results)
+
+    def clear(self):
+        """Removes all cached results and resets the statistics."""
+        self._results.clear()
+        self.hits, self.misses, self.max_error = 0, 0, 0.0
@@ -24,12 +24,11 @@ try:
 except (ModuleNotFoundError, ImportError):
     __version__ = "None"
 
+import time
 from abc import ABCMeta, abstractmethod
 from datetime import timedelta
 from urllib.parse import urlencode
 
-import requests
-
 _DEFAULT_USER_AGENT = "routingpy/v{}".format(__version__)
 _RETRIABLE_STATUSES = set([503])
 
@@ -88,6 +87,84 @@ class options(object):
 DEFAULT = type("object", (object,), {"__repr__": lambda self: "DEFAULT"})()
 
 
+class Deadline(object):
+    """
+    Time budget of a single router call. Unlike the client's ``timeout`` it separates connect and read timeouts
+    and, with ``total``, bounds the whole call including retries and the sleeps between them, measured with a
+    monotonic clock. Every attempt only gets the budget that remains, and a retry which couldn't finish in time
+    raises :class:`routingpy.exceptions.Timeout` right away instead of sleeping.
+
+    Router methods take a ``deadline`` argument, either a Deadline or the total budget in seconds:
+
+    >>> from routingpy import Valhalla
+    >>> from routingpy.client_base import Deadline
+    >>> router = Valhalla()
+    >>> route = router.directions(locations, "auto", deadline=Deadline(total=2, connect=0.3))
+    >>> route = router.directions(locations, "auto", deadline=2)
+    """
+
+    def __init__(self, total=None, connect=None, read=None):
+        """
+        :param total: Seconds the whole call may take, including retries. None for no limit.
+        :type total: float
+
+        :param connect: Seconds each attempt may take to connect. Defaults to the client's ``timeout``.
+        :type connect: float
+
+        :param read: Seconds each attempt may wait for the server to send data. Defaults to the client's ``timeout``.
+        :type read: float
+        """
+        self.total = total
+        self.connect = connect
+        self.read = read
+        self._expires = None
+
+    @classmethod
+    def of(cls, deadline):
+        """Returns ``deadline`` if it's a Deadline, otherwise a Deadline with ``deadline`` seconds total."""
+        return deadline if isinstance(deadline, cls) else cls(total=deadline)
+
+    def start(self):
+        """Returns a copy whose total budget starts now, or the deadline itself if it's already started."""
+        if self._expires is not None:
+            return self
+
+        started = Deadline(self.total, self.connect, self.read)
+        if self.total is not None:
+            started._expires = time.monotonic() + self.total
+        return started
+
+    def remaining(self):
+        """
+        Seconds left of the total budget of a started deadline, None if there's no total.
+
+        :rtype: float or None
+        """
+        if self._expires is None:
+            return None
+        return max(0.0, self._expires - time.monotonic())
+
+    def timeout(self, default=None):
+        """
+        Returns the ``(connect, read)`` timeout for the next attempt, capped by the remaining budget.
+
+        :param default: The client's timeout, used if ``connect`` or ``read`` are not set. A number or
+            ``(connect, read)`` tuple.
+
+        :rtype: tuple
+        """
+        default_connect, default_read = default if isinstance(default, tuple) else (default, default)
+        connect = default_connect if self.connect is None else self.connect
+        read = default_read if self.read is None else self.read
+
+        remaining = self.remaining()
+        if remaining is not None:
+            connect = remaining if connect is None else min(connect, remaining)
+            read = remaining if read is None else min(read, remaining)
+
+        return connect, read
+
+
 class BaseClient(metaclass=ABCMeta):
     """Abstract base class every client inherits from. Authentication is handled in each subclass."""
 
@@ -161,6 +238,8 @@ class BaseClient(metaclass=ABCMeta):
         first_request_time=None,
         retry_counter=0,
         dry_run=None,
+        decode=True,
+        deadline=None,
     ):
         """Performs HTTP GET/POST with credentials, returning the body as
         JSON.
@@ -184,6 +263,12 @@ class BaseClient(metaclass=ABCMeta):
         :param dry_run: If true, only prints URL and parameters. true or false.
         :type dry_run: bool
 
+        :param decode: If false, returns the successful response's body as bytes instead of decoding it.
+        :type decode: bool
+
+        :param deadline: Time budget of the call including retries, in seconds or as :class:`Deadline`.
+        :type deadline: float or :class:`Deadline`
+
         :raises routingpy.exceptions.RouterApiError: when the API returns an error due to faulty configuration.
         :raises routingpy.exceptions.RouterServerError: when the API returns a server error.
         :raises routingpy.exceptions.RouterError: when anything else happened while requesting.
@@ -220,4 +305,7 @@ class BaseClient(metaclass=ABCMeta):
         elif isinstance(params, (list, tuple)):
             params = params
 
-        return path + "?" + requests.utils.unquote_unreserved(urlencode(params))
+        # requests is only imported once a request is built, to keep importing routingpy fast
+        from requests.utils import unquote_unreserved
+
+        return path + "?" + unquote_unreserved(urlencode(params))
@@ -17,7 +17,9 @@
 
 import copy
 import json
+import os
 import random
+import threading
 import time
 import warnings
 from datetime import datetime
@@ -25,12 +27,33 @@ from datetime import datetime
 import requests
 
 from . import exceptions
-from .client_base import _RETRIABLE_STATUSES, DEFAULT, BaseClient, options
+from .client_base import _RETRIABLE_STATUSES, DEFAULT, BaseClient, Deadline, options
 from .utils import get_ordinal
 
+# Guards creating a client's session. Replaced in forked children, since it might be held by a thread which
+# doesn't exist there.
+_session_lock = threading.Lock()
+
+
+def _reset_session_lock():
+    global _session_lock
+    _session_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_session_lock)
+
 
 class Client(BaseClient):
-    """Default client class for requests handling, which is passed to each router. Uses the requests package."""
+    """
+    Default client class for requests handling, which is passed to each router. Uses the requests package.
+
+    The client is fork-safe: a process forked from the one which created the client, e.g. by a
+    :mod:`multiprocessing` pool, transparently gets its own :class:`requests.Session` instead of sharing
+    the parent's pooled connections. The child never closes the inherited session, as that would shut down
+    the parent's sockets. To release the pooled connections, call :meth:`close` or use the client as context
+    manager; it opens new connections if it's used again afterwards.
+    """
 
     def __init__(
         self,
@@ -40,6 +63,10 @@ class Client(BaseClient):
         retry_timeout=None,
         retry_over_query_limit=None,
         skip_api_error=None,
+        negative_cache=None,
+        hedge_policy=None,
+        concurrency_limiter=None,
+        scheduler=None,
         **kwargs
     ):
         """
@@ -68,11 +95,27 @@ class Client(BaseClient):
             encountered (e.g. no route found). If False, processing will discontinue and raise an error. Default False.
         :type skip_api_error: bool
 
+        :param negative_cache: Remembers deterministic API errors, so identical requests fail without
+            being sent again.
+        :type negative_cache: :class:`routingpy.cache.NegativeCache`
+
+        :param hedge_policy: Sends a duplicate of slow requests to another replica and returns the first response.
+        :type hedge_policy: :class:`routingpy.hedge.HedgePolicy`
+
+        :param concurrency_limiter: Limits the number of concurrent requests, adapting to overload signalled by
+            the router. A request and its hedge share one slot.
+        :type concurrency_limiter: :class:`routingpy.limiter.AIMDLimiter`
+
+        :param scheduler: Queues requests by priority class and deadline, e.g. to let interactive requests
+            overtake queued batch requests of routers sharing the scheduler.
+        :type scheduler: :class:`routingpy.scheduler.PriorityScheduler`
+
         :param kwargs: Additional arguments, such as headers or proxies.
         :type kwargs: dict
         """
 
-        self._session = requests.Session()
+        self._requests_session = None
+        self._session_pid = None
         super(Client, self).__init__(
             base_url,
             user_agent=user_agent,
@@ -92,6 +135,11 @@ class Client(BaseClient):
         self.kwargs["headers"] = self.headers
         self.kwargs["timeout"] = self.timeout
 
+        self.negative_cache = negative_cache
+        self.hedge_policy = hedge_policy
+        self.concurrency_limiter = concurrency_limiter
+        self.scheduler = scheduler
+
         self.proxies = self.kwargs.get("proxies") or options.default_proxies
         if self.proxies:
             self.kwargs["proxies"] = self.proxies
@@ -104,6 +152,8 @@ class Client(BaseClient):
         first_request_time=None,
         retry_counter=0,
         dry_run=None,
+        decode=True,
+        deadline=None,
     ):
         """Performs HTTP GET/POST with credentials, returning the body as
         JSON.
@@ -127,6 +177,14 @@ class Client(BaseClient):
         :param dry_run: If true, only prints URL and parameters. true or false.
         :type dry_run: bool
 
+        :param decode: If false, returns the successful response's body as bytes instead of decoding it.
+        :type decode: bool
+
+        :param deadline: Time budget of the call including retries, in seconds or as
+            :class:`routingpy.client_base.Deadline`. Each attempt's connect and read timeouts are capped by
+            the remaining budget and retries which wouldn't finish in time raise right away.
+        :type deadline: float or :class:`routingpy.client_base.Deadline`
+
         :raises routingpy.exceptions.RouterApiError: when the API returns an error due to faulty configuration.
         :raises routingpy.exceptions.RouterServerError: when the API returns a server error.
         :raises routingpy.exceptions.RouterError: when anything else happened while requesting.
@@ -139,6 +197,22 @@ class Client(BaseClient):
         :rtype: dict or bytes
         """
 
+        cache_key = None
+        if self.negative_cache is not None and not dry_run:
+            cache_key = self.negative_cache.key(self.base_url, url, get_params, post_params)
+            error = self.negative_cache.get(cache_key)
+            if error is not None:
+                if self.skip_api_error:
+                    warnings.warn(
+                        "Router {} returned a cached API error with "
+                        "the following message:\n{}".format(self.__class__.__name__, error.message)
+                    )
+                    return
+                raise error
+
+        if deadline is not None and retry_counter == 0:
+            deadline = Deadline.of(deadline).start()
+
         if not first_request_time:
             first_request_time = datetime.now()
 
@@ -153,11 +227,22 @@ class Client(BaseClient):
             delay_seconds = 1.5 ** (retry_counter - 1)
 
             # Jitter this value by 50% and pause.
-            time.sleep(delay_seconds * (random.random() + 0.5))
+            delay_seconds *= random.random() + 0.5
+
+            # Don't sleep if there's no time left for the request afterwards
+            remaining = deadline.remaining() if deadline is not None else None
+            if remaining is not None and delay_seconds >= remaining:
+                raise exceptions.Timeout()
+
+            time.sleep(delay_seconds)
 
         authed_url = self._generate_auth_url(url, get_params)
 
         final_requests_kwargs = copy.copy(self.kwargs)
+        if deadline is not None:
+            if deadline.remaining() == 0:
+                raise exceptions.Timeout()
+            final_requests_kwargs["timeout"] = deadline.timeout(self.timeout)
 
         # Determine GET/POST.
         requests_method = self._session.get
@@ -179,7 +264,7 @@ class Client(BaseClient):
             return
 
         try:
-            response = requests_method(self.base_url + authed_url, **final_requests_kwargs)
+            response = self._send(requests_method, authed_url, final_requests_kwargs, deadline)
             self._req = response.request
 
         except requests.exceptions.Timeout:
@@ -193,12 +278,23 @@ class Client(BaseClient):
                 "Server down.\nRetrying for the {}{} time.".format(tried, get_ordinal(tried)),
                 UserWarning,
             )
-            return self._request(url, get_params, post_params, first_request_time, retry_counter + 1)
+            return self._request(
+                url,
+                get_params,
+                post_params,
+                first_request_time,
+                retry_counter + 1,
+                decode=decode,
+                deadline=deadline,
+            )
 
         try:
-            return self._get_body(response)
+            return self._get_body(response, decode)
+
+        except exceptions.RouterApiError as e:
+            if cache_key is not None:
+                self.negative_cache.add(cache_key, e)
 
-        except exceptions.RouterApiError:
             if self.skip_api_error:
                 warnings.warn(
                     "Router {} returned an API error with "
@@ -217,7 +313,89 @@ class Client(BaseClient):
                 UserWarning,
             )
             # Retry request.
-            return self._request(url, get_params, post_params, first_request_time, retry_counter + 1)
+            return self._request(
+                url,
+                get_params,
+                post_params,
+                first_request_time,
+                retry_counter + 1,
+                decode=decode,
+                deadline=deadline,
+            )
+
+    def _send(self, requests_method, authed_url, requests_kwargs, deadline=None):
+        """
+        Sends a single request, scheduled, within the concurrency limit and hedged if configured. Waiting for
+        the scheduler and limiter counts towards the deadline, so the attempt's timeouts are set afterwards.
+        """
+        ticket = start = None
+        overloaded = False
+        try:
+            if self.scheduler is not None:
+                ticket = self.scheduler.acquire(
+                    authed_url, deadline.remaining() if deadline is not None else None
+                )
+            if self.concurrency_limiter is not None:
+                start = self.concurrency_limiter.acquire(
+                    deadline.remaining() if deadline is not None else None
+                )
+
+            if deadline is not None:
+                if deadline.remaining() == 0:
+                    raise exceptions.Timeout()
+                requests_kwargs["timeout"] = deadline.timeout(self.timeout)
+
+            if self.hedge_policy is not None:
+                response = self.hedge_policy.send(
+                    requests_method, self.base_url, authed_url, requests_kwargs
+                )
+            else:
+                response = requests_method(self.base_url + authed_url, **requests_kwargs)
+
+            overloaded = response.status_code == 429 or response.status_code in _RETRIABLE_STATUSES
+            return response
+
+        except requests.exceptions.Timeout:
+            overloaded = True
+            raise
+
+        finally:
+            if start is not None:
+                self.concurrency_limiter.release(start, overloaded)
+            if ticket is not None:
+                self.scheduler.release(ticket)
+
+    @property
+    def _session(self):
+        """The process' :class:`requests.Session`, created on first use and again after a fork."""
+        pid = os.getpid()
+        if self._session_pid != pid:
+            with _session_lock:
+                # Another thread may have created it while this one waited for the lock
+                if self._session_pid != pid:
+                    self._requests_session = self._new_session()
+                    self._session_pid = pid
+
+        return self._requests_session
+
+    def _new_session(self):
+        """Creates the session, subclasses may override it to e.g. mount transport adapters."""
+        return requests.Session()
+
+    def close(self):
+        """Closes the pooled connections of the current process' session."""
+        with _session_lock:
+            if self._requests_session is not None and self._session_pid == os.getpid():
+                self._requests_session.close()
+
+            self._requests_session = None
+            self._session_pid = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
 
     @property
     def req(self):
@@ -225,12 +403,17 @@ class Client(BaseClient):
         return self._req
 
     @staticmethod
-    def _get_body(response):
+    def _get_body(response, decode=True):
         status_code = response.status_code
         content_type = response.headers["content-type"]
 
         if status_code == 200:
-            if content_type == "image/tiff":
+            # FlatBuffers responses have the schema as parameter, e.g. ";schema=osrm.engine.api.fbresult"
+            if (
+                content_type in ("image/tiff", "application/x-protobuf")
+                or content_type.startswith("application/x-flatbuffers")
+                or not decode
+            ):
                 return response.content
 
             else:
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 GIS OPS UG
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+#
+"""
+:class:`UnixSocketClient` sends HTTP requests over Unix domain sockets.
+"""
+import socket
+import threading
+from urllib.parse import quote, unquote, urlparse
+
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool
+from urllib3.exceptions import NewConnectionError
+
+from .client_base import DEFAULT
+from .client_default import Client
+
+_SCHEME = "http+unix"
+
+
+class UnixSocketClient(Client):
+    """
+    Client class for routing engines listening on a Unix domain socket on the same host, e.g. OSRM or
+    Valhalla sidecars. Saves the TCP overhead of the loopback interface, while keeping the HTTP API,
+    so it can be passed to every router:
+
+    >>> from routingpy import OSRM
+    >>> from routingpy.client_unix import UnixSocketClient
+    >>> router = OSRM(base_url="unix:///run/osrm.sock", client=UnixSocketClient)
+    """
+
+    def __init__(
+        self,
+        base_url,
+        user_agent=None,
+        timeout=DEFAULT,
+        retry_timeout=None,
+        retry_over_query_limit=None,
+        skip_api_error=None,
+        negative_cache=None,
+        hedge_policy=None,
+        concurrency_limiter=None,
+        scheduler=None,
+        **kwargs
+    ):
+        """
+        :param base_url: The path of the socket as ``unix://`` URL, e.g. ``unix:///run/osrm.sock``.
+            Alternatively the URL encoded path as host of a ``http+unix://`` URL, which allows a path prefix,
+            e.g. ``http+unix://%2Frun%2Fvalhalla.sock/valhalla``.
+        :type base_url: string
+
+        See :class:`routingpy.client_default.Client` for the other parameters.
+        """
+        self.socket_path = _socket_path(base_url)
+
+        super(UnixSocketClient, self).__init__(
+            _to_http_url(base_url),
+            user_agent=user_agent,
+            timeout=timeout,
+            retry_timeout=retry_timeout,
+            retry_over_query_limit=retry_over_query_limit,
+            skip_api_error=skip_api_error,
+            negative_cache=negative_cache,
+            hedge_policy=hedge_policy,
+            concurrency_limiter=concurrency_limiter,
+            scheduler=scheduler,
+            **kwargs
+        )
+
+    def _new_session(self):
+        session = super(UnixSocketClient, self)._new_session()
+        session.mount(_SCHEME + "://", UnixSocketAdapter())
+        return session
+
+
+class UnixSocketAdapter(HTTPAdapter):
+    """
+    A :class:`requests.adapters.HTTPAdapter` for ``http+unix://`` URLs, whose host is the URL encoded path of the
+    socket. Keeps a pool of connections per socket.
+    """
+
+    def __init__(self, pool_maxsize=DEFAULT_POOLSIZE, **kwargs):
+        self._unix_pool_maxsize = pool_maxsize
+        self._unix_pools = {}
+        self._unix_pools_lock = threading.Lock()
+        super(UnixSocketAdapter, self).__init__(pool_maxsize=pool_maxsize, **kwargs)
+
+    def get_connection_with_tls_context(self, request, verify, proxies=None, cert=None):
+        return self.get_connection(request.url, proxies)
+
+    def get_connection(self, url, proxies=None):
+        path = unquote(urlparse(url).netloc)
+        with self._unix_pools_lock:
+            pool = self._unix_pools.get(path)
+            if pool is None:
+                pool = _UnixHTTPConnectionPool(path, maxsize=self._unix_pool_maxsize)
+                self._unix_pools[path] = pool
+
+        return pool
+
+    def request_url(self, request, proxies):
+        return request.path_url
+
+    def close(self):
+        with self._unix_pools_lock:
+            for pool in self._unix_pools.values():
+                pool.close()
+            self._unix_pools.clear()
+
+        super(UnixSocketAdapter, self).close()
+
+
+class _UnixHTTPConnection(HTTPConnection):
+    def __init__(self, host, port=None, socket_path=None, **kwargs):
+        self.socket_path = socket_path
+        super(_UnixHTTPConnection, self).__init__(host, port, **kwargs)
+
+    def _new_conn(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if isinstance(self.timeout, (int, float)):
+            sock.settimeout(self.timeout)
+
+        try:
+            sock.connect(self.socket_path)
+        except OSError as e:
+            sock.close()
+            raise NewConnectionError(
+                self, "Failed to connect to {}: {}".format(self.socket_path, e)
+            ) from e
+
+        return sock
+
+
+class _UnixHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _UnixHTTPConnection
+
+    def __init__(self, socket_path, **kwargs):
+        super(_UnixHTTPConnectionPool, self).__init__("localhost", socket_path=socket_path, **kwargs)
+
+
+def _socket_path(base_url):
+    parsed = urlparse(base_url)
+    if parsed.scheme == "unix":
+        return parsed.path
+    if parsed.scheme == _SCHEME:
+        return unquote(parsed.netloc)
+
+    raise ValueError(
+        "Unix socket URLs need to start with unix:// or {}://, got {}".format(_SCHEME, base_url)
+    )
+
+
+def _to_http_url(base_url):
+    parsed = urlparse(base_url)
+    if parsed.scheme == _SCHEME:
+        return base_url
+
+    return "{}://{}".format(_SCHEME, quote(parsed.path, safe=""))
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 GIS OPS UG
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+#
+"""
+:class:`ValhallaActorClient` passes Valhalla requests to the Python bindings in the same process.
+"""
+import json
+import warnings
+
+from . import exceptions
+from .client_base import DEFAULT, BaseClient
+
+# Valhalla endpoints whose Actor method has a different name, all others are named like the endpoint
+_ACTOR_METHODS = {"sources_to_targets": "matrix"}
+
+
+class ValhallaActorClient(BaseClient):
+    """
+    Client class which dispatches the requests of :class:`routingpy.routers.Valhalla` to an in-process
+    ``Actor`` of Valhalla's Python bindings instead of sending them over HTTP. The request JSON is handed
+    to the actor as string and its response is parsed by the router as usual:
+
+    >>> from valhalla import Actor
+    >>> from routingpy import Valhalla
+    >>> from routingpy.client_valhalla import ValhallaActorClient
+    >>> router = Valhalla(client=ValhallaActorClient, actor=Actor("valhalla.json"))
+    >>> route = router.directions(locations=[[8.68, 49.42], [8.69, 49.41]], profile="auto")
+
+    Note, that ``timeout``, deadlines and retries don't apply to in-process requests.
+    """
+
+    def __init__(
+        self,
+        base_url,
+        user_agent=None,
+        timeout=DEFAULT,
+        retry_timeout=None,
+        retry_over_query_limit=None,
+        skip_api_error=None,
+        actor=None,
+        **kwargs
+    ):
+        """
+        :param base_url: Not used for requests, only printed for ``dry_run``.
+        :type base_url: string
+
+        :param actor: An object with a method per Valhalla endpoint, taking the request's JSON string and
+            returning the response's JSON string, e.g. ``valhalla.Actor``. ``/sources_to_targets`` is
+            dispatched to its ``matrix`` method.
+        :type actor: valhalla.Actor
+
+        See :class:`routingpy.client_default.Client` for the other parameters.
+        """
+        if actor is None:
+            raise ValueError("ValhallaActorClient needs an actor.")
+
+        super(ValhallaActorClient, self).__init__(
+            base_url,
+            user_agent=user_agent,
+            timeout=timeout,
+            retry_timeout=retry_timeout,
+            retry_over_query_limit=retry_over_query_limit,
+            skip_api_error=skip_api_error,
+            **kwargs
+        )
+        self.actor = actor
+
+    def _request(
+        self,
+        url,
+        get_params={},
+        post_params=None,
+        first_request_time=None,
+        retry_counter=0,
+        dry_run=None,
+        decode=True,
+        deadline=None,
+    ):
+        """Passes the request's JSON to the actor method of the endpoint, returning the response as JSON.
+
+        See :meth:`routingpy.client_base.BaseClient._request` for the parameters.
+
+        :raises routingpy.exceptions.RouterApiError: when the actor raises an error with a 4xx status code,
+            or doesn't support the endpoint.
+        :raises routingpy.exceptions.RouterServerError: when the actor raises an error with a 5xx status code.
+        :raises routingpy.exceptions.RouterError: when the actor raises any other error.
+        :raises routingpy.exceptions.JSONParseError: when the actor's response can't be parsed.
+
+        :returns: raw JSON response
+        :rtype: dict or bytes
+        """
+        endpoint = url.strip("/")
+        method_name = _ACTOR_METHODS.get(endpoint, endpoint)
+        request = json.dumps(post_params if post_params is not None else dict(get_params))
+
+        if dry_run:
+            print("actor method:\n{}\nRequest:\n{}".format(method_name, request))
+            return
+
+        method = getattr(self.actor, method_name, None)
+        if method is None:
+            raise exceptions.RouterApiError(
+                404, "The actor doesn't support the {} endpoint.".format(url)
+            )
+
+        try:
+            response = method(request)
+        except (RuntimeError, ValueError) as e:
+            error = _to_router_error(e)
+            if isinstance(error, exceptions.RouterApiError) and self.skip_api_error:
+                warnings.warn(
+                    "Router {} returned an API error with "
+                    "the following message:\n{}".format(self.__class__.__name__, error.message)
+                )
+                return
+
+            raise error from e
+
+        if isinstance(response, dict):
+            return response if decode else json.dumps(response).encode("utf-8")
+
+        # protobuf responses of format "pbf" are returned as bytes
+        if not decode or isinstance(response, bytes) and (post_params or {}).get("format") == "pbf":
+            return response.encode("utf-8") if isinstance(response, str) else response
+
+        try:
+            return json.loads(response)
+        except json.decoder.JSONDecodeError:
+            raise exceptions.JSONParseError("Can't decode JSON response:{}".format(response))
+
+
+def _to_router_error(error):
+    """The bindings raise errors with Valhalla's JSON error response as message."""
+    message = str(error)
+    try:
+        status = int(json.loads(message)["status_code"])
+    except (ValueError, KeyError, TypeError):
+        return exceptions.RouterError(None, message)
+
+    if 400 <= status < 500:
+        return exceptions.RouterApiError(status, message)
+    if 500 <= status:
+        return exceptions.RouterServerError(status, message)
+
+    return exceptions.RouterError(status, message)
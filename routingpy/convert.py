@@ -17,6 +17,10 @@
 """Converts Python types to string representations suitable for GET queries.
 """
 import datetime
+import numbers
+import re
+import sys
+from collections.abc import Sequence
 
 
 def delimit_list(arg, delimiter=","):
@@ -55,8 +59,170 @@ def format_float(arg):
     return "{}".format(round(float(arg), 6)).rstrip("0").rstrip(".")
 
 
+def format_locations(locations, delimiter=";", coordinate_delimiter=",", order="lnglat"):
+    """Formats many locations at once, e.g. for matrix requests. The result is the same as formatting every
+    coordinate with :func:`format_float`:
+
+    delimit_list([delimit_list([format_float(c) for c in location], coordinate_delimiter) for location in locations], delimiter)
+
+    All coordinates are formatted with a single format operation. If NumPy is imported, many locations
+    given as (N, 2) array or list of equally long locations are formatted with array operations instead.
+
+    For example:
+
+    format_locations([[8.68, 49.42], [8.6809, 49.4158]]) -> "8.68,49.42;8.6809,49.4158"
+    format_locations([[8.68, 49.42]], order="latlng") -> "49.42,8.68"
+
+    :param locations: The locations as [[lon, lat], ...], a NumPy array, a 2D memoryview or any sequence of
+        sequences.
+    :type locations: list of list or numpy.ndarray or memoryview
+
+    :param delimiter: The string between two locations. Default ";".
+    :type delimiter: str
+
+    :param coordinate_delimiter: The string between the coordinates of a location. Default ",".
+    :type coordinate_delimiter: str
+
+    :param order: "lnglat" keeps the coordinates' order, "latlng" reverses every location. Default "lnglat".
+    :type order: str
+
+    :rtype: string
+    """
+    if order not in ("lnglat", "latlng"):
+        raise ValueError(f"order must be either 'latlng' or 'lnglat', not {order}.")
+    reverse = order == "latlng"
+
+    # Only use NumPy if it's in use anyways, importing it would take longer than formatting. Below a few dozen
+    # locations the array setup takes longer than formatting in Python.
+    np = sys.modules.get("numpy")
+    if np is not None and hasattr(locations, "__len__") and len(locations) >= 32:
+        formatted = _format_locations_numpy(np, locations, delimiter, coordinate_delimiter, reverse)
+        if formatted is not None:
+            return formatted
+
+    locations = as_locations(locations)
+    formats, values = [], []
+    for location in locations:
+        coordinates = [float(c) for c in location]
+        if reverse:
+            coordinates.reverse()
+        formats.append(coordinate_delimiter.replace("%", "%%").join(["%.6f"] * len(coordinates)))
+        values.extend(coordinates)
+
+    # "%.6f" rounds like round(x, 6), but doesn't switch to scientific notation like format_float
+    if any((0 < abs(v) < 1e-4 or not abs(v) < 1e16) for v in values):
+        return _format_locations_exact(locations, delimiter, coordinate_delimiter, reverse)
+
+    formatted = delimiter.replace("%", "%%").join(formats) % tuple(values)
+    return _trailing_zeros(delimiter, coordinate_delimiter).sub(r"\1", formatted)
+
+
+def _format_locations_exact(locations, delimiter, coordinate_delimiter, reverse):
+    return delimit_list(
+        [
+            delimit_list(
+                [format_float(c) for c in (reversed(location) if reverse else location)],
+                coordinate_delimiter,
+            )
+            for location in locations
+        ],
+        delimiter,
+    )
+
+
+_TRAILING_ZEROS = {}
+
+
+def _trailing_zeros(delimiter, coordinate_delimiter):
+    """Returns a pattern matching the trailing zeros of "%.6f" formatted numbers, and the dot if all are zeros."""
+    key = (delimiter, coordinate_delimiter)
+    if key not in _TRAILING_ZEROS:
+        end = "(?={}|{}|$)".format(re.escape(delimiter), re.escape(coordinate_delimiter))
+        _TRAILING_ZEROS[key] = re.compile(r"(\.\d*[1-9])0+{end}|\.0+{end}".format(end=end))
+    return _TRAILING_ZEROS[key]
+
+
+def _format_locations_numpy(np, locations, delimiter, coordinate_delimiter, reverse):
+    """
+    Formats the locations like :func:`format_float` with array operations: every coordinate is written as
+    fixed width bytes, from which the leading zeros, trailing zeros and unused delimiter bytes are masked out.
+
+    Returns None if the locations aren't a non-empty 2D array of floats, or contain coordinates for which
+    :func:`format_float` uses scientific notation. Those are formatted by :func:`format_locations` instead.
+    """
+    try:
+        values = np.asarray(locations, dtype=np.float64)
+    except (TypeError, ValueError):
+        return None
+    if values.ndim != 2 or values.size == 0:
+        return None
+    if reverse:
+        values = values[:, ::-1]
+
+    if not (np.abs(values) < 1e6).all():
+        return None
+
+    flat = values.ravel()
+    scaled = flat * 1e6
+    rounded = np.rint(scaled)
+    # Near ties the product's rounding error may decide, so those are rounded exactly like format_float does
+    ties = np.abs(scaled - np.floor(scaled) - 0.5) <= 4 * np.spacing(np.abs(scaled))
+    if ties.any():
+        indices = np.flatnonzero(ties)
+        rounded[indices] = [round(v, 6) * 1e6 for v in flat[indices].tolist()]
+        rounded[indices] = np.rint(rounded[indices])
+    if ((rounded != 0) & (np.abs(rounded) < 100)).any():
+        return None
+
+    n_rows, n_cols = values.shape
+    magnitude = np.abs(rounded).astype(np.int64)
+    integer, fraction = magnitude // 10**6, magnitude % 10**6
+    int_width = len(str(int(integer.max())))
+
+    coordinate_delimiter_bytes = coordinate_delimiter.encode("utf-8")
+    delimiter_bytes = delimiter.encode("utf-8")
+    delimiter_width = max(len(coordinate_delimiter_bytes), len(delimiter_bytes))
+
+    width = 1 + int_width + 1 + 6 + delimiter_width
+    chars = np.zeros((len(magnitude), width), dtype=np.uint8)
+    keep = np.zeros((len(magnitude), width), dtype=bool)
+
+    chars[:, 0] = ord("-")
+    keep[:, 0] = np.signbit(rounded)
+
+    for k in range(int_width):
+        power = 10 ** (int_width - 1 - k)
+        chars[:, 1 + k] = (integer // power) % 10 + ord("0")
+        keep[:, 1 + k] = integer >= power if k < int_width - 1 else True
+
+    dot = 1 + int_width
+    chars[:, dot] = ord(".")
+    keep[:, dot] = fraction != 0
+
+    for k in range(6):
+        chars[:, dot + 1 + k] = (fraction // 10 ** (5 - k)) % 10 + ord("0")
+        keep[:, dot + 1 + k] = fraction % 10 ** (6 - k) != 0
+
+    # The coordinate delimiter follows all but the last coordinate of a location, the delimiter all but the
+    # last location
+    start = dot + 7
+    last_column = np.tile(np.arange(n_cols) == n_cols - 1, n_rows)
+    for column, delimiter_bytes_ in (
+        (~last_column, coordinate_delimiter_bytes),
+        (last_column, delimiter_bytes),
+    ):
+        for k, byte in enumerate(delimiter_bytes_):
+            chars[column, start + k] = byte
+            keep[column, start + k] = True
+    keep[-1, start:] = False
+
+    return chars[keep].tobytes().decode("utf-8")
+
+
 def is_list(arg):
     """Checks if arg is list-like."""
+    if isinstance(arg, (list, tuple)):
+        return True
     if isinstance(arg, dict):
         return False
     if isinstance(arg, str):  # Python 3-only, as str has __iter__
@@ -66,6 +232,110 @@ def is_list(arg):
     )
 
 
+def is_empty(arg):
+    """Checks if arg is None or an empty list-like. Unlike ``not arg``, this works for NumPy arrays."""
+    return arg is None or is_list(arg) and len(arg) == 0
+
+
+def is_location(arg):
+    """Checks if arg is a single location like [lon, lat], i.e. list-like with numbers, such as a tuple or
+    a row of a NumPy array."""
+    if not is_list(arg):
+        return False
+    try:
+        first = arg[0]
+    except (IndexError, KeyError, TypeError, NotImplementedError):
+        # NotImplementedError is raised by multi-dimensional memoryviews
+        return False
+    return isinstance(first, numbers.Real) and not isinstance(first, bool)
+
+
+def as_locations(arg):
+    """Returns a sequence of locations for arg without copying the coordinates.
+
+    Lists, tuples, NumPy arrays and other sequences are returned as they are. Two-dimensional objects
+    supporting the buffer protocol which can't be indexed by row, such as memoryviews, are wrapped in
+    a sequence of one-dimensional memoryviews.
+
+    :param arg: The locations.
+    :type arg: list of list or numpy.ndarray or memoryview
+
+    :rtype: list of list or numpy.ndarray or collections.abc.Sequence
+    """
+    if isinstance(arg, (list, tuple)):
+        return arg
+    if isinstance(arg, memoryview) or not _has_method(arg, "__getitem__"):
+        try:
+            view = memoryview(arg)
+        except TypeError:
+            return arg
+        if view.ndim == 2:
+            try:
+                return _LocationsView(view)
+            except (TypeError, ValueError):
+                # Formats like "<d" can't be cast
+                return view.tolist()
+    return arg
+
+
+def to_list(arg):
+    """Returns list-like arg as list of Python objects, e.g. for JSON bodies. Lists and tuples are returned
+    as they are, NumPy arrays and memoryviews are converted with their ``tolist`` method. None is returned
+    as None.
+
+    :param arg: A list-like object, e.g. source indices.
+    :type arg: list or tuple or numpy.ndarray
+
+    :rtype: list or tuple
+    """
+    if arg is None or isinstance(arg, (list, tuple)):
+        return arg
+    if _has_method(arg, "tolist"):
+        return arg.tolist()
+    return list(arg)
+
+
+def locations_to_list(arg):
+    """Returns the locations as list of lists of Python numbers, e.g. for JSON bodies. Locations which
+    are lists or tuples already are not copied.
+
+    :param arg: The locations.
+    :type arg: list of list or numpy.ndarray or memoryview
+
+    :rtype: list of list
+    """
+    if not isinstance(arg, (list, tuple)) and _has_method(arg, "tolist"):
+        return arg.tolist()
+    return [to_list(location) for location in as_locations(arg)]
+
+
+class _LocationsView(Sequence):
+    """Sequence of the rows of a two-dimensional memoryview, which memoryviews can't be indexed by."""
+
+    def __init__(self, view):
+        self._view = view
+        self._width = view.shape[1]
+        if view.c_contiguous:
+            self._flat = view.cast("B").cast(view.format)
+        else:
+            self._flat = memoryview(view.tobytes()).cast(view.format)
+
+    def __len__(self):
+        return self._view.shape[0]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("location index out of range")
+        return self._flat[index * self._width : (index + 1) * self._width]
+
+    def tolist(self):
+        return self._view.tolist()
+
+
 def _has_method(arg, method):
     """Returns true if the given object has a method with the given name.
 
@@ -57,6 +57,18 @@ class JSONParseError(Exception):  # pragma: no cover
     pass
 
 
+class ProtobufParseError(Exception):  # pragma: no cover
+    """The protobuf response can't be parsed."""
+
+    pass
+
+
+class FlatBuffersParseError(Exception):  # pragma: no cover
+    """The FlatBuffers response can't be parsed."""
+
+    pass
+
+
 class RetriableRequest(Exception):  # pragma: no cover
     """Signifies that the request can be retried."""
 
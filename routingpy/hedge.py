@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 GIS OPS UG
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+#
+"""
+:class:`HedgePolicy` sends duplicates of slow requests to other replicas.
+"""
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Optional, Sequence
+
+
+class HedgePolicy(object):
+    """
+    Hedges requests against replicated routing engines: if a request didn't complete within a percentile of
+    the recently observed latencies, a duplicate is sent to another endpoint and whichever response arrives
+    first is returned. The other request is cancelled if it didn't start yet, otherwise its response is
+    discarded and its connection released as soon as it arrives.
+
+    Hedges are capped at ``max_hedge_ratio`` of all requests, so a slow backend can't double the load.
+    Primary requests each get their own thread while they can still be hedged, so the policy doesn't limit the
+    client's concurrency; only the hedges share a pool of ``max_workers`` threads.
+
+    >>> from routingpy import Valhalla
+    >>> from routingpy.hedge import HedgePolicy
+    >>> hedge_policy = HedgePolicy(["http://valhalla-2:8002", "http://valhalla-3:8002"], percentile=95)
+    >>> router = Valhalla("http://valhalla-1:8002", hedge_policy=hedge_policy)
+    >>> route = router.directions(locations, "auto")
+    >>> print(hedge_policy.hedges, hedge_policy.hedge_wins)
+    """
+
+    def __init__(
+        self,
+        endpoints: Optional[Sequence[str]] = None,
+        percentile: float = 95,
+        max_hedge_ratio: float = 0.05,
+        window: int = 1000,
+        min_samples: int = 20,
+        max_workers: int = 16,
+    ):
+        """
+        :param endpoints: Base URLs of the replicas hedges are sent to, in round robin. Endpoints equal to the
+            client's base URL are skipped. If None, hedges go to the client's base URL, e.g. behind a load balancer.
+        :type endpoints: list of str
+
+        :param percentile: Percentile of recent latencies after which a request is hedged. Default 95.
+        :type percentile: float
+
+        :param max_hedge_ratio: Maximum fraction of requests which are hedged. Default 0.05.
+        :type max_hedge_ratio: float
+
+        :param window: Number of recent latencies the percentile is computed from. Default 1000.
+        :type window: int
+
+        :param min_samples: Number of latencies observed before requests are hedged. Default 20.
+        :type min_samples: int
+
+        :param max_workers: Maximum number of concurrently sent hedges. Default 16.
+        :type max_workers: int
+        """
+        if not 0 < percentile <= 100:
+            raise ValueError("percentile must be in (0, 100], got {}".format(percentile))
+
+        self.endpoints = list(endpoints or [])
+        self.percentile = percentile
+        self.max_hedge_ratio = max_hedge_ratio
+        self.min_samples = min_samples
+
+        self._latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._threads = set()
+        self._endpoint_counter = 0
+
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    @property
+    def delay(self) -> Optional[float]:
+        """
+        Seconds after which a request is hedged. None while fewer than ``min_samples`` latencies were observed.
+
+        :rtype: float or None
+        """
+        with self._lock:
+            if len(self._latencies) < max(self.min_samples, 1):
+                return None
+            latencies = sorted(self._latencies)
+
+        index = math.ceil(self.percentile / 100 * len(latencies)) - 1
+        return latencies[max(index, 0)]
+
+    def send(self, method, base_url, url, kwargs):
+        """
+        Sends a request with ``method(base_url + url, **kwargs)`` and hedges it if it's slow.
+
+        :param method: The function sending the request, e.g. :meth:`requests.Session.get`.
+        :type method: callable
+
+        :param base_url: The client's base URL.
+        :type base_url: str
+
+        :param url: The request's path and query, appended to the base URLs.
+        :type url: str
+
+        :param kwargs: Keyword arguments for ``method``.
+        :type kwargs: dict
+
+        :returns: The first response, or raises the error of the request if all requests failed.
+        """
+        delay = self.delay
+        with self._lock:
+            self.requests += 1
+
+        if delay is None:
+            # nothing to hedge against yet, so there's no need to leave the calling thread
+            future = Future()
+            self._run(method, base_url + url, kwargs, future)
+            return future.result()
+
+        primary = self._start(method, base_url + url, kwargs)
+        if wait([primary], timeout=delay).done or not self._allow_hedge():
+            return primary.result()
+
+        hedge = Future()
+        self._executor.submit(self._run, method, self._hedge_endpoint(base_url) + url, kwargs, hedge)
+
+        error = None
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for loser in pending:
+                        _cancel(loser)
+                    if future is hedge:
+                        with self._lock:
+                            self.hedge_wins += 1
+                    return future.result()
+
+                error = error or future.exception()
+
+        raise error
+
+    def _start(self, method, url, kwargs):
+        """Sends the request in a new thread, so the caller can hedge it while waiting."""
+        future = Future()
+        thread = threading.Thread(target=self._run, args=(method, url, kwargs, future), daemon=True)
+        with self._lock:
+            self._threads.add(thread)
+        thread.start()
+        return future
+
+    def _run(self, method, url, kwargs, future):
+        """Sends the request into ``future``, recording its latency from when it actually starts."""
+        try:
+            if not future.set_running_or_notify_cancel():
+                return
+
+            start = time.monotonic()
+            try:
+                result = method(url, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+                return
+
+            with self._lock:
+                self._latencies.append(time.monotonic() - start)
+            future.set_result(result)
+
+        finally:
+            with self._lock:
+                self._threads.discard(threading.current_thread())
+
+    def _allow_hedge(self):
+        with self._lock:
+            if self.hedges + 1 > self.max_hedge_ratio * self.requests:
+                return False
+            self.hedges += 1
+            return True
+
+    def _hedge_endpoint(self, base_url):
+        candidates = [endpoint for endpoint in self.endpoints if endpoint != base_url] or [base_url]
+        with self._lock:
+            self._endpoint_counter += 1
+            return candidates[self._endpoint_counter % len(candidates)]
+
+    def close(self):
+        """Waits for requests still in flight, e.g. hedging losers, and shuts down the threads sending them."""
+        with self._lock:
+            threads = list(self._threads)
+        for thread in threads:
+            thread.join()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def _cancel(future):
+    """Cancels a request which didn't start, or closes its response to release the connection."""
+    if future.cancel():
+        return
+
+    def close(future):
+        if future.exception() is None and hasattr(future.result(), "close"):
+            future.result().close()
+
+    future.add_done_callback(close)
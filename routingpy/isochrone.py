@@ -46,10 +46,10 @@ class Isochrones(object):
         return self._isochrones[item]
 
     def __iter__(self):
-        return iter(self._isochrones)
+        return iter(self._isochrones or [])
 
     def __len__(self):
-        return len(self._isochrones)
+        return len(self._isochrones or [])
 
 
 class Isochrone(object):
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 GIS OPS UG
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+#
+"""
+:class:`AIMDLimiter` adapts the number of concurrent requests to the router's feedback.
+"""
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+from . import exceptions
+
+
+class AIMDLimiter(object):
+    """
+    Limits the number of requests in flight with additive increase, multiplicative decrease (AIMD):
+    the limit grows by about one request per round trip while latency stays stable and is cut by
+    ``backoff_ratio`` when the router answers 429 or 503, or a request times out.
+
+    Pass it to a router, which holds every request, including retries, within the limit. That way the
+    concurrency of :func:`routingpy.batch.batch` finds the router's capacity by itself, with ``max_workers``
+    only as upper bound. With a :class:`routingpy.hedge.HedgePolicy`, a request and its hedge share one slot,
+    so :attr:`in_flight` doesn't count hedges and the limit adapts to the response which arrives first:
+
+    >>> from routingpy import Valhalla
+    >>> from routingpy.batch import batch
+    >>> from routingpy.limiter import AIMDLimiter
+    >>> limiter = AIMDLimiter(initial_limit=4, max_limit=64)
+    >>> router = Valhalla(concurrency_limiter=limiter)
+    >>> for result in batch(router.directions, requests, max_workers=64):
+    ...     print(result.index, limiter.limit)
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        backoff_ratio: float = 0.5,
+        latency_tolerance: float = 2.0,
+        window: int = 100,
+    ):
+        """
+        :param initial_limit: Number of concurrent requests to start with. Default 4.
+        :type initial_limit: int
+
+        :param min_limit: Lower bound of the limit. Default 1.
+        :type min_limit: int
+
+        :param max_limit: Upper bound of the limit. Default 64.
+        :type max_limit: int
+
+        :param backoff_ratio: Factor the limit is multiplied with on overload. Default 0.5.
+        :type backoff_ratio: float
+
+        :param latency_tolerance: The limit only grows while a request's latency is at most this multiple of
+            the minimum recent latency. Default 2.
+        :type latency_tolerance: float
+
+        :param window: Number of recent latencies the minimum is taken from. Default 100.
+        :type window: int
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Limits need to satisfy 1 <= min_limit <= initial_limit <= max_limit.")
+        if not 0 < backoff_ratio < 1:
+            raise ValueError("backoff_ratio must be in (0, 1), got {}".format(backoff_ratio))
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._latencies = deque(maxlen=window)
+        self._last_backoff = float("-inf")
+        self._condition = threading.Condition()
+
+        self.backoffs = 0
+
+    @property
+    def limit(self) -> int:
+        """The current number of allowed concurrent requests."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """The number of requests currently holding a slot."""
+        return self._in_flight
+
+    def acquire(self, timeout: Optional[float] = None) -> float:
+        """
+        Blocks until a request may be sent.
+
+        :param timeout: Seconds to wait for a slot at most, e.g. the remaining budget of the call's deadline.
+            None to wait until a slot is free.
+        :type timeout: float
+
+        :raises routingpy.exceptions.Timeout: if no slot became free within ``timeout``.
+
+        :returns: The start time to pass to :meth:`release`.
+        :rtype: float
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._in_flight < int(self._limit), timeout):
+                raise exceptions.Timeout()
+            self._in_flight += 1
+
+        return time.monotonic()
+
+    def release(self, start: float, overloaded: bool = False):
+        """
+        Frees the slot of a finished request and adapts the limit.
+
+        :param start: The time returned by :meth:`acquire`.
+        :type start: float
+
+        :param overloaded: Whether the router signalled overload, i.e. with HTTP 429 or 503 or a timeout.
+        :type overloaded: bool
+        """
+        now = time.monotonic()
+        with self._condition:
+            self._in_flight -= 1
+
+            if overloaded:
+                # requests sent before the last backoff don't reflect the reduced limit yet
+                if start >= self._last_backoff:
+                    self._limit = max(self.min_limit, self._limit * self.backoff_ratio)
+                    self._last_backoff = now
+                    self.backoffs += 1
+            else:
+                latency = now - start
+                self._latencies.append(latency)
+                if latency <= self.latency_tolerance * min(self._latencies):
+                    self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+
+            self._condition.notify_all()
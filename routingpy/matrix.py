@@ -15,10 +15,13 @@
 # the License.
 #
 """
-:class:`Matrix` returns matrix results.
+:class:`Matrix` returns matrix results, :class:`IncrementalMatrix` keeps a matrix for a changing set of locations.
 """
+from collections.abc import Sequence
 from typing import List, Optional
 
+_TABLES = ("durations", "distances")
+
 
 class Matrix(object):
     """
@@ -91,3 +94,262 @@ class Matrix(object):
 
     def __repr__(self):  # pragma: no cover
         return "Matrix({}, {})".format(self.durations, self.distances)
+
+
+class IncrementalMatrix(Matrix):
+    """
+    A :class:`Matrix` for a changing set of locations. Adding locations only requests the new rows and columns
+    from the router via its ``sources`` and ``destinations`` parameters, removing locations doesn't request anything.
+
+    ``durations`` and ``distances`` are read-only, list-like views on the current locations' cells, which
+    are cheap to create after a removal. Use :meth:`to_matrix` for a plain :class:`Matrix` copy. ``raw`` is always None.
+
+    >>> from routingpy import OSRM
+    >>> from routingpy.matrix import IncrementalMatrix
+    >>> fleet = IncrementalMatrix(OSRM(), locations, profile="driving")
+    >>> fleet.add([[13.38, 52.51]])  # requests 1 row and N columns
+    >>> fleet.remove([0])  # no request
+    >>> print(fleet.durations[0][-1])
+    """
+
+    def __init__(self, router, locations, matrix: Optional[Matrix] = None, **matrix_kwargs):
+        """
+        :param router: A router instance whose ``matrix`` method supports ``sources`` and ``destinations``,
+            e.g. :class:`routingpy.routers.Valhalla` or :class:`routingpy.routers.OSRM`.
+
+        :param locations: The initial locations as [[lon, lat], ...].
+        :type locations: list of list
+
+        :param matrix: An existing matrix for ``locations``. If not given, it will be requested from the router.
+        :type matrix: :class:`Matrix`
+
+        :param matrix_kwargs: Keyword arguments for each call of the router's ``matrix`` method,
+            e.g. ``profile``.
+        """
+        super(IncrementalMatrix, self).__init__()
+        self._router = router
+        self._matrix_kwargs = matrix_kwargs
+        self._locations = []
+        self._index = []
+        self._tables = {name: None for name in _TABLES}
+
+        if matrix is None:
+            self.add(locations)
+            return
+
+        self._locations = list(locations)
+        self._index = list(range(len(self._locations)))
+        for name in _TABLES:
+            table = getattr(matrix, name)
+            if table is not None:
+                self._tables[name] = [list(row) for row in table]
+
+    @property
+    def locations(self) -> List[List[float]]:
+        """
+        The current locations in matrix order.
+
+        :rtype: list of list
+        """
+        return [self._locations[idx] for idx in self._index]
+
+    @property
+    def durations(self) -> Optional[Sequence]:
+        """
+        A view on the durations matrix of the current locations, see :attr:`Matrix.durations`.
+
+        :rtype: list-like or None
+        """
+        return self._view("durations")
+
+    @property
+    def distances(self) -> Optional[Sequence]:
+        """
+        A view on the distances matrix of the current locations, see :attr:`Matrix.distances`.
+
+        :rtype: list-like or None
+        """
+        return self._view("distances")
+
+    def _view(self, name):
+        table = self._tables[name]
+        return None if table is None else _TableView(table, self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def add(self, locations: List[List[float]]):
+        """
+        Appends locations to the matrix. Requests the new rows for all locations and, if there were
+        locations before, the new columns for the previous locations.
+
+        :param locations: The new locations as [[lon, lat], ...].
+        :type locations: list of list
+        """
+        locations = list(locations)
+        if not locations:
+            return
+
+        self._compact()
+        n_old, n_new = len(self._locations), len(locations)
+        all_locations = self._locations + locations
+        new_indices = list(range(n_old, n_old + n_new))
+
+        rows = self._router.matrix(
+            all_locations,
+            sources=new_indices,
+            destinations=list(range(n_old + n_new)),
+            **self._matrix_kwargs,
+        )
+        columns = None
+        if n_old:
+            columns = self._router.matrix(
+                all_locations,
+                sources=list(range(n_old)),
+                destinations=new_indices,
+                **self._matrix_kwargs,
+            )
+
+        for name in _TABLES:
+            new_rows = getattr(rows, name)
+            if new_rows is None:
+                self._tables[name] = None
+                continue
+
+            table = self._tables[name]
+            if table is None:
+                if n_old:
+                    # Not available in the existing matrix, so it can't be completed
+                    continue
+                table = self._tables[name] = []
+
+            if columns is not None:
+                for row, new_cells in zip(table, getattr(columns, name)):
+                    row.extend(new_cells)
+            table.extend(list(row) for row in new_rows)
+
+        self._locations = all_locations
+        self._index = list(range(len(all_locations)))
+
+    def remove(self, indices: List[int]):
+        """
+        Removes locations from the matrix without sending a request.
+
+        :param indices: The current positions of the locations to remove.
+        :type indices: list of int
+        """
+        drop = set(indices)
+        self._index = [idx for pos, idx in enumerate(self._index) if pos not in drop]
+
+    def to_matrix(self) -> Matrix:
+        """
+        Returns a copy of the current state as a plain :class:`Matrix`.
+
+        :rtype: :class:`Matrix`
+        """
+        tables = {name: self._materialize(name) for name in _TABLES}
+        return Matrix(durations=tables["durations"], distances=tables["distances"])
+
+    def _materialize(self, name):
+        view = self._view(name)
+        return None if view is None else [list(row) for row in view]
+
+    def _compact(self):
+        """Drops the storage of removed locations."""
+        if len(self._index) == len(self._locations):
+            return
+
+        self._tables = {name: self._materialize(name) for name in _TABLES}
+        self._locations = self.locations
+        self._index = list(range(len(self._locations)))
+
+    def __repr__(self):  # pragma: no cover
+        return "IncrementalMatrix({}, {})".format(
+            self._materialize("durations"), self._materialize("distances")
+        )
+
+
+class _RowView(Sequence):
+    """Read-only view on the cells of one matrix row."""
+
+    def __init__(self, row, index):
+        self._row = row
+        self._index = index
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self._row[idx] for idx in self._index[item]]
+        return self._row[self._index[item]]
+
+    def __len__(self):
+        return len(self._index)
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):  # pragma: no cover
+        return repr(list(self))
+
+
+class _TableView(_RowView):
+    """Read-only view on the rows of a matrix."""
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [_RowView(self._row[idx], self._index) for idx in self._index[item]]
+        return _RowView(self._row[self._index[item]], self._index)
+
+    def __eq__(self, other):
+        return [list(row) for row in self] == [list(row) for row in other]
+
+
+class _FlatTable(Sequence):
+    """
+    Read-only rows of a matrix whose cells are stored row by row in one flat sequence, e.g. an
+    ``array("f")`` with 4 bytes per cell instead of a Python float object per cell.
+    """
+
+    def __init__(self, cells, cols):
+        self._cells = cells
+        self._cols = cols
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self[idx] for idx in range(len(self))[item]]
+        start = range(0, len(self._cells), self._cols)[item]
+        return _FlatRow(self._cells, start, self._cols)
+
+    def __len__(self):
+        return len(self._cells) // self._cols if self._cols else 0
+
+    def __eq__(self, other):
+        return [list(row) for row in self] == [list(row) for row in other]
+
+    def __repr__(self):  # pragma: no cover
+        return repr([list(row) for row in self])
+
+
+class _FlatRow(Sequence):
+    """Read-only view on the cells of one row of a :class:`_FlatTable`."""
+
+    def __init__(self, cells, start, cols):
+        self._cells = cells
+        self._start = start
+        self._cols = cols
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self._cells[self._start + idx] for idx in range(self._cols)[item]]
+        return self._cells[self._start + range(self._cols)[item]]
+
+    def __iter__(self):
+        return iter(self._cells[self._start : self._start + self._cols])
+
+    def __len__(self):
+        return self._cols
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):  # pragma: no cover
+        return repr(list(self))
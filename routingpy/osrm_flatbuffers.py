@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 GIS OPS UG
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+#
+"""
+Minimal reader for OSRM's FlatBuffers responses of the ``flatbuffers`` format, which only reads the fields of
+``/route`` and ``/table`` responses that routingpy's results need. Field ids are the ones of OSRM's
+``fbresult.fbs``, ``route.fbs`` and ``table.fbs`` schemas. Fields added by newer OSRM versions are ignored.
+"""
+import struct
+import sys
+from array import array
+
+from . import exceptions
+
+# Field ids of the FBResult table
+_RESULT_ERROR = 0
+_RESULT_CODE = 1
+_RESULT_ROUTES = 4
+_RESULT_TABLE = 5
+
+# Field ids of the Error table
+_ERROR_CODE = 0
+_ERROR_MESSAGE = 1
+
+# Field ids of the RouteObject table
+_ROUTE_DISTANCE = 0
+_ROUTE_DURATION = 1
+_ROUTE_POLYLINE = 5
+_ROUTE_COORDINATES = 6
+
+# Field ids of the Table table
+_TABLE_DURATIONS = 0
+_TABLE_ROWS = 1
+_TABLE_COLS = 2
+_TABLE_DISTANCES = 3
+
+
+class _Table(object):
+    """A FlatBuffers table at an offset of the buffer, with access to its fields by id."""
+
+    def __init__(self, buf, pos):
+        self._buf = buf
+        self._pos = pos
+        vtable = pos - _unpack("<i", buf, pos)
+        vtable_size = _unpack("<H", buf, vtable)
+        self._vtable = vtable
+        self._fields = (vtable_size - 4) // 2
+
+    def _offset(self, field):
+        """Returns the field's offset in the table, or 0 if it's not set."""
+        if field >= self._fields:
+            return 0
+        return _unpack("<H", self._buf, self._vtable + 4 + 2 * field)
+
+    def scalar(self, field, fmt, default=0):
+        offset = self._offset(field)
+        return _unpack(fmt, self._buf, self._pos + offset) if offset else default
+
+    def _target(self, field):
+        """Returns the position an offset field refers to, or None if it's not set."""
+        offset = self._offset(field)
+        if not offset:
+            return None
+        pos = self._pos + offset
+        return pos + _unpack("<I", self._buf, pos)
+
+    def table(self, field):
+        pos = self._target(field)
+        return None if pos is None else _Table(self._buf, pos)
+
+    def string(self, field):
+        pos = self._target(field)
+        if pos is None:
+            return None
+        length = _unpack("<I", self._buf, pos)
+        return str(_slice(self._buf, pos + 4, length), "utf-8")
+
+    def tables(self, field):
+        """Returns the tables of a vector field."""
+        pos = self._target(field)
+        if pos is None:
+            return []
+        tables = []
+        for idx in range(_unpack("<I", self._buf, pos)):
+            element = pos + 4 + 4 * idx
+            tables.append(_Table(self._buf, element + _unpack("<I", self._buf, element)))
+        return tables
+
+    def floats(self, field, width=1):
+        """Returns a vector of floats or of structs of ``width`` floats as flat ``array("f")``, or None."""
+        pos = self._target(field)
+        if pos is None:
+            return None
+        values = array("f")
+        values.frombytes(_slice(self._buf, pos + 4, _unpack("<I", self._buf, pos) * 4 * width))
+        if sys.byteorder == "big":  # pragma: no cover
+            values.byteswap()
+        return values
+
+
+def _unpack(fmt, buf, pos):
+    try:
+        return struct.unpack_from(fmt, buf, pos)[0]
+    except struct.error:
+        raise exceptions.FlatBuffersParseError("Reading beyond the buffer at byte {}.".format(pos))
+
+
+def _slice(buf, pos, length):
+    if pos + length > len(buf):
+        raise exceptions.FlatBuffersParseError("Reading beyond the buffer at byte {}.".format(pos))
+    return buf[pos : pos + length]
+
+
+def _result(body):
+    """Returns the root FBResult table, raises if it holds an error."""
+    body = memoryview(body)
+    result = _Table(body, _unpack("<I", body, 0))
+    if result.scalar(_RESULT_ERROR, "<?", False):
+        error = result.table(_RESULT_CODE)
+        if error is None:  # pragma: no cover
+            raise exceptions.RouterApiError("Error")
+        raise exceptions.RouterApiError(error.string(_ERROR_CODE), error.string(_ERROR_MESSAGE))
+    return result
+
+
+def decode_route(body):
+    """
+    Decodes a ``/route`` FlatBuffers response.
+
+    :param body: The response body.
+    :type body: bytes
+
+    :returns: The routes as dicts with "distance" and "duration", and either "polyline" as string for
+        encoded geometries or "coordinates" as list of [lon, lat] for "geojson".
+    :rtype: list of dict
+    """
+    routes = []
+    for route in _result(body).tables(_RESULT_ROUTES):
+        coordinates = route.floats(_ROUTE_COORDINATES, width=2)
+        routes.append(
+            {
+                "distance": route.scalar(_ROUTE_DISTANCE, "<f"),
+                "duration": route.scalar(_ROUTE_DURATION, "<f"),
+                "polyline": route.string(_ROUTE_POLYLINE),
+                "coordinates": None
+                if coordinates is None
+                else [[coordinates[idx], coordinates[idx + 1]] for idx in range(0, len(coordinates), 2)],
+            }
+        )
+    return routes
+
+
+def decode_table(body):
+    """
+    Decodes a ``/table`` FlatBuffers response. OSRM writes 0 for cells without a path in this format.
+
+    :param body: The response body.
+    :type body: bytes
+
+    :returns: The number of rows and columns, and the row-major durations and distances as flat
+        ``array("f")``, or None if they weren't requested.
+    :rtype: tuple of (int, int, array or None, array or None)
+    """
+    table = _result(body).table(_RESULT_TABLE)
+    if table is None:
+        raise exceptions.FlatBuffersParseError("The response has no table.")
+
+    rows, cols = table.scalar(_TABLE_ROWS, "<H"), table.scalar(_TABLE_COLS, "<H")
+    durations = table.floats(_TABLE_DURATIONS)
+    distances = table.floats(_TABLE_DISTANCES)
+    for values in (durations, distances):
+        if values is not None and len(values) != rows * cols:
+            raise exceptions.FlatBuffersParseError(
+                "Table of {} cells for {} rows and {} columns.".format(len(values), rows, cols)
+            )
+    return rows, cols, durations, distances
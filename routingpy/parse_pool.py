@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 GIS OPS UG
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+#
+"""
+:class:`ParsePool` decodes and parses responses in worker processes.
+"""
+import json
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Optional
+
+from . import exceptions
+
+
+class ParsePool(object):
+    """
+    Runs JSON decoding and a router's ``parse_*_json`` in a process pool, so that threads requesting
+    concurrently (e.g. with :func:`routingpy.batch.batch`) don't serialize on the GIL while parsing big responses.
+
+    The raw response bytes are sent to the worker and the parsed result is sent back. By default the result's
+    ``raw`` property is dropped in the worker, so that only the compact parsed form crosses the process boundary.
+
+    >>> from routingpy import Valhalla
+    >>> from routingpy.parse_pool import ParsePool
+    >>> with ParsePool(max_workers=4) as pool:
+    ...     router = Valhalla(parse_pool=pool)
+    ...     expansions = router.expansion(**params)
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, keep_raw: bool = False):
+        """
+        :param max_workers: Number of worker processes. Defaults to the number of CPUs.
+        :type max_workers: int
+
+        :param keep_raw: Whether parsed results should keep their ``raw`` response. Default False.
+        :type keep_raw: bool
+        """
+        self._executor = ProcessPoolExecutor(max_workers=max_workers)
+        self.keep_raw = keep_raw
+
+    def submit(self, parser: Callable, body: Optional[bytes], *args, decode: bool = True) -> Future:
+        """
+        Schedules decoding and parsing of a response body.
+
+        :param parser: A picklable parse function, e.g. :meth:`routingpy.routers.Valhalla.parse_expansion_json`.
+        :type parser: callable
+
+        :param body: The undecoded JSON response. If None, the parser is called in the current process.
+        :type body: bytes
+
+        :param args: Additional arguments passed to ``parser`` after the decoded response.
+
+        :param decode: Whether the body is JSON to decode. If False, the body is passed to ``parser`` as it
+            is, e.g. to :meth:`routingpy.routers.Valhalla.parse_matrix_pbf`. Default True.
+        :type decode: bool
+
+        :rtype: :class:`concurrent.futures.Future`
+        """
+        if body is None:
+            future = Future()
+            future.set_result(parser(None, *args))
+            return future
+
+        return self._executor.submit(_decode_and_parse, parser, body, self.keep_raw, args, decode)
+
+    def parse(self, parser: Callable, body: Optional[bytes], *args, decode: bool = True) -> Any:
+        """
+        Decodes and parses a response body in a worker process and waits for the result.
+        See :meth:`submit` for the parameters.
+        """
+        return self.submit(parser, body, *args, decode=decode).result()
+
+    def close(self):
+        """Shuts down the worker processes."""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def _decode_and_parse(parser, body, keep_raw, args, decode=True):
+    response = body
+    if decode:
+        try:
+            response = json.loads(body)
+        except ValueError:
+            raise exceptions.JSONParseError("Can't decode JSON response:{!r}".format(body[:1000]))
+
+    result = parser(response, *args)
+    if not keep_raw:
+        _strip_raw(result)
+
+    return result
+
+
+def _strip_raw(result):
+    if hasattr(result, "_raw"):
+        result._raw = None
+
+    # Collections like Directions or Isochrones hold results with their own raw response
+    if hasattr(result, "__iter__"):
+        for item in result:
+            if hasattr(item, "_raw"):
+                item._raw = None
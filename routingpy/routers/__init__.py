@@ -14,38 +14,62 @@ locations and profile (car, bike, pedestrian etc.), among others (full list here
 .. _`contribution guidelines`: https://github.com/gis-ops/routing-py/blob/master/CONTRIBUTING.md
 .. _here: https://github.com/gis-ops/routing-py#api
 """
+from importlib import import_module
+
 from ..client_base import options  # noqa: F401
 from ..exceptions import RouterNotFound
-from .google import Google
-from .graphhopper import Graphhopper
-from .heremaps import HereMaps
-from .mapbox_osrm import MapboxOSRM
-from .openrouteservice import ORS
-from .opentripplanner_v2 import OpenTripPlannerV2
-from .osrm import OSRM
-from .valhalla import Valhalla
+
+# Routers are imported on first access, so importing routingpy doesn't import every router and requests
+_ROUTER_MODULES = {
+    "Google": "google",
+    "Graphhopper": "graphhopper",
+    "HereMaps": "heremaps",
+    "MapboxOSRM": "mapbox_osrm",
+    "ORS": "openrouteservice",
+    "OpenTripPlannerV2": "opentripplanner_v2",
+    "OSRM": "osrm",
+    "Valhalla": "valhalla",
+}
 
 # Provide synonyms
 _SERVICE_TO_ROUTER = {
-    "google": Google,
-    "graphhopper": Graphhopper,
-    "here": HereMaps,
-    "heremaps": HereMaps,
-    "mapbox_osrm": MapboxOSRM,
-    "mapbox-osrm": MapboxOSRM,
-    "mapbox": MapboxOSRM,
-    "mapboxosrm": MapboxOSRM,
-    "openrouteservice": ORS,
-    "opentripplanner": OpenTripPlannerV2,
-    "opentripplanner_v2": OpenTripPlannerV2,
-    "ors": ORS,
-    "osrm": OSRM,
-    "otp": OpenTripPlannerV2,
-    "otp_v2": OpenTripPlannerV2,
-    "valhalla": Valhalla,
+    "google": "Google",
+    "graphhopper": "Graphhopper",
+    "here": "HereMaps",
+    "heremaps": "HereMaps",
+    "mapbox_osrm": "MapboxOSRM",
+    "mapbox-osrm": "MapboxOSRM",
+    "mapbox": "MapboxOSRM",
+    "mapboxosrm": "MapboxOSRM",
+    "openrouteservice": "ORS",
+    "opentripplanner": "OpenTripPlannerV2",
+    "opentripplanner_v2": "OpenTripPlannerV2",
+    "ors": "ORS",
+    "osrm": "OSRM",
+    "otp": "OpenTripPlannerV2",
+    "otp_v2": "OpenTripPlannerV2",
+    "valhalla": "Valhalla",
 }
 
 
+__all__ = list(_ROUTER_MODULES) + ["get_router_by_name", "options", "RouterNotFound"]
+
+
+def __getattr__(name):
+    try:
+        module_name = _ROUTER_MODULES[name]
+    except KeyError:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+    router = getattr(import_module("." + module_name, __name__), name)
+    globals()[name] = router
+    return router
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_ROUTER_MODULES))
+
+
 def get_router_by_name(router_name):
     """
     Given a router's name, try to return the router class.
@@ -66,7 +90,7 @@ def get_router_by_name(router_name):
 
     """
     try:
-        return _SERVICE_TO_ROUTER[router_name.lower()]
+        return __getattr__(_SERVICE_TO_ROUTER[router_name.lower()])
     except KeyError:
         raise RouterNotFound(
             "Unknown router '{}'; options are: {}".format(router_name, _SERVICE_TO_ROUTER.keys())
@@ -19,7 +19,7 @@ from operator import itemgetter
 from typing import List, Optional, Tuple, Union
 
 from .. import convert, utils
-from ..client_base import DEFAULT
+from ..client_base import DEFAULT, Deadline
 from ..client_default import Client
 from ..direction import Direction, Directions
 from ..exceptions import OverQueryLimit, RouterApiError, RouterServerError
@@ -79,7 +79,7 @@ class Google:
         retry_over_query_limit=True,
         skip_api_error: Optional[bool] = None,
         client=Client,
-        **client_kwargs
+        **client_kwargs,
     ):
         """
         Initializes a Google client.
@@ -126,7 +126,7 @@ class Google:
             retry_timeout,
             retry_over_query_limit,
             skip_api_error,
-            **client_kwargs
+            **client_kwargs,
         )
 
     class WayPoint(object):
@@ -192,6 +192,9 @@ class Google:
         transit_mode: Optional[Union[List[str], Tuple[str]]] = None,
         transit_routing_preference: Optional[str] = None,
         dry_run: Optional[bool] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
+        *,
+        geometry_detail: str = "full",
     ):
         """Get directions between an origin point and a destination point.
 
@@ -253,35 +256,44 @@ class Google:
         :param dry_run: Print URL and parameters without sending the request.
         :type dry_run: bool
 
+        :param deadline: Time budget of the call including retries, in seconds or as
+            :class:`routingpy.client_base.Deadline` with separate connect and read timeouts.
+        :type deadline: float or :class:`routingpy.client_base.Deadline`
+
+        :param geometry_detail: The detail of the returned geometry. "full" joins the polylines of all steps,
+            "overview" only decodes the route's smoothed overview polyline, which is much faster for long
+            routes. Default "full".
+        :type geometry_detail: str
+
         :returns: One or multiple route(s) from provided coordinates and restrictions.
         :rtype: :class:`routingpy.direction.Direction` or :class:`routingpy.direction.Directions`
         """
 
+        if geometry_detail not in ("full", "overview"):
+            raise ValueError(
+                "geometry_detail must be either 'full' or 'overview', not {}.".format(geometry_detail)
+            )
+
         params = {"mode": profile}
 
+        locations = convert.as_locations(locations)
         origin, destination = locations[0], locations[-1]
-        if isinstance(origin, (list, tuple)):
-            params["origin"] = convert.delimit_list(list(reversed(origin)))
+        if convert.is_location(origin):
+            params["origin"] = convert.format_locations([origin], order="latlng")
         elif isinstance(origin, str):
             params["origin"] = origin
         elif isinstance(origin, self.WayPoint):
             raise TypeError("The first and last locations must be list/tuple of [lon, lat]")
 
-        if isinstance(destination, (list, tuple)):
-            params["destination"] = convert.delimit_list(list(reversed(destination)))
+        if convert.is_location(destination):
+            params["destination"] = convert.format_locations([destination], order="latlng")
         elif isinstance(destination, str):
             params["destination"] = destination
         elif isinstance(origin, self.WayPoint):
             raise TypeError("The first and last locations must be list/tuple of [lon, lat]")
 
         if len(locations) > 2:
-            waypoints = []
-            s = slice(1, -1)
-            for coord in locations[s]:
-                if isinstance(coord, (list, tuple)):
-                    waypoints.append(convert.delimit_list(list(reversed(coord))))
-                elif isinstance(coord, self.WayPoint):
-                    waypoints.append(coord.make_waypoint())
+            waypoints = self._build_waypoints(locations[1:-1])
             if optimize:
                 waypoints.insert(0, "optimize:true")
 
@@ -324,11 +336,15 @@ class Google:
             params["transit_routing_preference"] = transit_routing_preference
 
         return self.parse_direction_json(
-            self.client._request("/directions/json", get_params=params, dry_run=dry_run), alternatives
+            self.client._request(
+                "/directions/json", get_params=params, dry_run=dry_run, deadline=deadline
+            ),
+            alternatives,
+            geometry_detail,
         )
 
     @staticmethod
-    def parse_direction_json(response, alternatives):
+    def parse_direction_json(response, alternatives, geometry_detail="full"):
         if response is None:  # pragma: no cover
             if alternatives:
                 return Directions()
@@ -352,30 +368,43 @@ class Google:
         if alternatives:
             routes = []
             for route in response["routes"]:
-                geometry = []
                 duration, distance = 0, 0
                 for leg in route["legs"]:
                     duration += leg["duration"]["value"]
                     distance += leg["distance"]["value"]
-                    for step in leg["steps"]:
-                        geometry.extend(utils.decode_polyline5(step["polyline"]["points"]))
 
                 routes.append(
                     Direction(
-                        geometry=geometry, duration=int(duration), distance=int(distance), raw=route
+                        geometry=Google._parse_geometry(route, geometry_detail),
+                        duration=int(duration),
+                        distance=int(distance),
+                        raw=route,
                     )
                 )
             return Directions(routes, response)
         else:
-            geometry = []
+            route = response["routes"][0]
             duration, distance = 0, 0
-            for leg in response["routes"][0]["legs"]:
+            for leg in route["legs"]:
                 duration += leg["duration"]["value"]
                 distance += leg["distance"]["value"]
-                for step in leg["steps"]:
-                    geometry.extend(utils.decode_polyline5(step["polyline"]["points"]))
 
-            return Direction(geometry=geometry, duration=duration, distance=distance, raw=response)
+            return Direction(
+                geometry=Google._parse_geometry(route, geometry_detail),
+                duration=duration,
+                distance=distance,
+                raw=response,
+            )
+
+    @staticmethod
+    def _parse_geometry(route, geometry_detail):
+        """Decodes the route's overview polyline, or the polylines of all steps with shared points once."""
+        if geometry_detail == "overview":
+            return utils.decode_polyline5(route["overview_polyline"]["points"])
+
+        return utils.decode_polylines5(
+            step["polyline"]["points"] for leg in route["legs"] for step in leg["steps"]
+        )
 
     def isochrones(self):  # pragma: no cover
         raise NotImplementedError
@@ -396,6 +425,7 @@ class Google:
         transit_mode: Optional[Union[List[str], Tuple[str]]] = None,
         transit_routing_preference: Optional[str] = None,
         dry_run: Optional[bool] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
     ):
         """Gets travel distance and time for a matrix of origins and destinations.
 
@@ -454,17 +484,16 @@ class Google:
         :param dry_run: Print URL and parameters without sending the request.
         :param dry_run: bool
 
+        :param deadline: Time budget of the call including retries, in seconds or as
+            :class:`routingpy.client_base.Deadline` with separate connect and read timeouts.
+        :type deadline: float or :class:`routingpy.client_base.Deadline`
+
         :returns: A matrix from the specified sources and destinations.
         :rtype: :class:`routingpy.matrix.Matrix`
         """
         params = {"mode": profile}
 
-        waypoints = []
-        for coord in locations:
-            if isinstance(coord, (list, tuple)):
-                waypoints.append(convert.delimit_list(list(reversed(coord))))
-            elif isinstance(coord, self.WayPoint):
-                waypoints.append(coord.make_waypoint())
+        waypoints = self._build_waypoints(locations)
 
         sources_coords = waypoints
         if sources is not None:
@@ -511,7 +540,9 @@ class Google:
             params["transit_routing_preference"] = transit_routing_preference
 
         return self.parse_matrix_json(
-            self.client._request("/distancematrix/json", get_params=params, dry_run=dry_run)
+            self.client._request(
+                "/distancematrix/json", get_params=params, dry_run=dry_run, deadline=deadline
+            )
         )
 
     @staticmethod
@@ -537,3 +568,20 @@ class Google:
             distances.append(row_distances)
 
         return Matrix(durations, distances, response)
+
+    def _build_waypoints(self, locations):
+        """Returns the waypoint strings of the locations, formatting all coordinates at once."""
+        locations = convert.as_locations(locations)
+        coords = [coord for coord in locations if convert.is_location(coord)]
+        if len(coords) == len(locations):
+            coords = locations
+        formatted = iter(convert.format_locations(coords, order="latlng").split(";") if coords else [])
+
+        waypoints = []
+        for coord in locations:
+            if convert.is_location(coord):
+                waypoints.append(next(formatted))
+            elif isinstance(coord, self.WayPoint):
+                waypoints.append(coord.make_waypoint())
+
+        return waypoints
@@ -18,7 +18,7 @@
 from typing import List, Optional, Tuple, Union  # noqa: F401
 
 from .. import convert, utils
-from ..client_base import DEFAULT
+from ..client_base import DEFAULT, Deadline
 from ..client_default import Client
 from ..direction import Direction, Directions
 from ..isochrone import Isochrone, Isochrones
@@ -125,6 +125,7 @@ class Graphhopper:
         dry_run: Optional[bool] = None,
         snap_preventions: Optional[List[str]] = None,
         curbsides: Optional[List[str]] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
         **direction_kwargs
     ):
         """Get directions between an origin point and a destination point.
@@ -250,6 +251,10 @@ class Graphhopper:
             or all points. Only supported for motor vehicles and OpenStreetMap.
         :type curbsides: list of str
 
+        :param deadline: Time budget of the call including retries, in seconds or as
+            :class:`routingpy.client_base.Deadline` with separate connect and read timeouts.
+        :type deadline: float or :class:`routingpy.client_base.Deadline`
+
         :returns: One or multiple route(s) from provided coordinates and restrictions.
         :rtype: :class:`routingpy.direction.Direction` or :class:`routingpy.direction.Directions`
 
@@ -273,7 +278,7 @@ class Graphhopper:
         params = {"profile": profile}
 
         if locations is not None:
-            params["points"] = locations
+            params["points"] = convert.locations_to_list(locations)
 
         get_params = {}
 
@@ -356,7 +361,9 @@ class Graphhopper:
         params.update(direction_kwargs)
 
         return self.parse_directions_json(
-            self.client._request("/route", get_params=get_params, post_params=params, dry_run=dry_run),
+            self.client._request(
+                "/route", get_params=get_params, post_params=params, dry_run=dry_run, deadline=deadline
+            ),
             algorithm,
             elevation,
             points_encoded,
@@ -411,6 +418,7 @@ class Graphhopper:
         reverse_flow: Optional[bool] = None,
         debug: Optional[bool] = None,
         dry_run: Optional[bool] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
         **isochrones_kwargs
     ):
         """Gets isochrones or equidistants for a range of time/distance values around a given set of coordinates.
@@ -451,6 +459,10 @@ class Graphhopper:
         :param dry_run: Print URL and parameters without sending the request.
         :param dry_run: bool
 
+        :param deadline: Time budget of the call including retries, in seconds or as
+            :class:`routingpy.client_base.Deadline` with separate connect and read timeouts.
+        :type deadline: float or :class:`routingpy.client_base.Deadline`
+
         :returns: An isochrone with the specified range.
         :rtype: :class:`routingpy.isochrone.Isochrones`
         """
@@ -466,9 +478,9 @@ class Graphhopper:
         else:
             raise TypeError("Parameter range={} must be of type list or tuple".format(range))
 
-        center = [convert.format_float(f) for f in locations]
-        center.reverse()
-        params.append(("point", ",".join(center)))
+        point = convert.format_locations([locations], order="latlng")
+        center = point.split(",")
+        params.append(("point", point))
 
         if self.key is not None:
             params.append(("key", self.key))
@@ -485,7 +497,7 @@ class Graphhopper:
         params.extend(isochrones_kwargs.items())
 
         return self.parse_isochrone_json(
-            self.client._request("/isochrone", get_params=params, dry_run=dry_run),
+            self.client._request("/isochrone", get_params=params, dry_run=dry_run, deadline=deadline),
             type,
             intervals[0],
             buckets,
@@ -525,6 +537,7 @@ class Graphhopper:
         out_array: Optional[List[str]] = ["times", "distances"],
         debug=None,
         dry_run: Optional[bool] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
         **matrix_kwargs
     ):
         """Gets travel distance and time for a matrix of origins and destinations.
@@ -563,6 +576,10 @@ class Graphhopper:
         :param dry_run: Print URL and parameters without sending the request.
         :param dry_run: bool
 
+        :param deadline: Time budget of the call including retries, in seconds or as
+            :class:`routingpy.client_base.Deadline` with separate connect and read timeouts.
+        :type deadline: float or :class:`routingpy.client_base.Deadline`
+
         :returns: A matrix from the specified sources and destinations.
         :rtype: :class:`routingpy.matrix.Matrix`
         """
@@ -571,9 +588,10 @@ class Graphhopper:
         if self.key is not None:
             params.append(("key", self.key))
 
+        locations = convert.as_locations(locations)
         if sources is None and destinations is None:
-            locations = (reversed([convert.format_float(f) for f in coord]) for coord in locations)
-            params.extend([("point", ",".join(coord)) for coord in locations])
+            points = convert.format_locations(locations, order="latlng").split(";")
+            params.extend([("point", point) for point in points])
 
         else:
             sources_out = locations
@@ -599,13 +617,11 @@ class Graphhopper:
                 # Raised when destinations == None
                 pass
 
-            sources_out = (reversed([convert.format_float(f) for f in coord]) for coord in sources_out)
-            params.extend([("from_point", ",".join(coord)) for coord in sources_out])
+            sources_out = convert.format_locations(sources_out, order="latlng").split(";")
+            params.extend([("from_point", point) for point in sources_out])
 
-            destinations_out = (
-                reversed([convert.format_float(f) for f in coord]) for coord in destinations_out
-            )
-            params.extend([("to_point", ",".join(coord)) for coord in destinations_out])
+            destinations_out = convert.format_locations(destinations_out, order="latlng").split(";")
+            params.extend([("to_point", point) for point in destinations_out])
 
         if out_array is not None:
             for e in out_array:
@@ -617,7 +633,7 @@ class Graphhopper:
         params.extend(matrix_kwargs.items())
 
         return self.parse_matrix_json(
-            self.client._request("/matrix", get_params=params, dry_run=dry_run),
+            self.client._request("/matrix", get_params=params, dry_run=dry_run, deadline=deadline),
         )
 
     @staticmethod
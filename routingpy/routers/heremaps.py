@@ -19,7 +19,7 @@ from operator import itemgetter
 from typing import List, Optional, Tuple, Union
 
 from .. import convert
-from ..client_base import DEFAULT
+from ..client_base import DEFAULT, Deadline
 from ..client_default import Client
 from ..direction import Direction, Directions
 from ..isochrone import Isochrone, Isochrones
@@ -288,6 +288,7 @@ class HereMaps:
         custom_consumption_details: Optional[str] = None,
         speed_profile: Optional[str] = None,
         dry_run: Optional[bool] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
         **directions_kwargs
     ):
         """Get directions between an origin point and a destination point.
@@ -585,6 +586,10 @@ class HereMaps:
         :param dry_run: Print URL and parameters without sending the request.
         :param dry_run: bool
 
+        :param deadline: Time budget of the call including retries, in seconds or as
+            :class:`routingpy.client_base.Deadline` with separate connect and read timeouts.
+        :type deadline: float or :class:`routingpy.client_base.Deadline`
+
         :returns: One or multiple route(s) from provided coordinates and restrictions.
         :rtype: :class:`routingpy.direction.Direction` or :class:`routingpy.direction.Directions`
         """
@@ -777,6 +782,7 @@ class HereMaps:
                 convert.delimit_list(["/calculateroute", format], "."),
                 get_params=params,
                 dry_run=dry_run,
+                deadline=deadline,
             ),
             alternatives=alternatives,
         )
@@ -847,6 +853,7 @@ class HereMaps:
         custom_consumption_details: Optional[str] = None,
         speed_profile: Optional[str] = None,
         dry_run: Optional[bool] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
         **isochrones_kwargs
     ):
         """Gets isochrones or equidistants for a range of time/distance values around a given set of coordinates.
@@ -992,6 +999,10 @@ class HereMaps:
         :param dry_run: Print URL and parameters without sending the request.
         :param dry_run: bool
 
+        :param deadline: Time budget of the call including retries, in seconds or as
+            :class:`routingpy.client_base.Deadline` with separate connect and read timeouts.
+        :type deadline: float or :class:`routingpy.client_base.Deadline`
+
         :returns: raw JSON response
         :rtype: dict
         """
@@ -1080,6 +1091,7 @@ class HereMaps:
                 convert.delimit_list(["/calculateisoline", format], "."),
                 get_params=params,
                 dry_run=dry_run,
+                deadline=deadline,
             ),
             intervals,
             interval_type,
@@ -1140,6 +1152,7 @@ class HereMaps:
         tunnel_category: Optional[List[str]] = None,
         speed_profile: Optional[str] = None,
         dry_run: Optional[bool] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
         **matrix_kwargs
     ):
         """Gets travel distance and time for a matrix of origins and destinations.
@@ -1268,6 +1281,10 @@ class HereMaps:
         :param dry_run: Print URL and parameters without sending the request.
         :param dry_run: bool
 
+        :param deadline: Time budget of the call including retries, in seconds or as
+            :class:`routingpy.client_base.Deadline` with separate connect and read timeouts.
+        :type deadline: float or :class:`routingpy.client_base.Deadline`
+
         :returns: raw JSON response
         :rtype: dict
         """
@@ -1377,6 +1394,7 @@ class HereMaps:
                 convert.delimit_list(["/calculatematrix", format], "."),
                 get_params=params,
                 dry_run=dry_run,
+                deadline=deadline,
             )
         )
 
@@ -1426,33 +1444,32 @@ class HereMaps:
     def _build_locations(self, coordinates, matrix=False):
         """Build the locations object for all methods"""
 
-        locations = []
-
-        # Directions and matrix calls which are lists of list
-        if isinstance(coordinates[0], (list, tuple, self.Waypoint)):
-            for idx, coord in enumerate(coordinates):
-                if isinstance(locations, self.Waypoint):
-                    locations.append(locations._make_waypoint())
-                elif isinstance(locations, (list, tuple)):
-                    wp = "geo!" + convert.delimit_list(
-                        [convert.format_float(f) for f in list(reversed(coord))], ","
-                    )
-                    locations.append(wp)
-                else:
-                    raise TypeError(
-                        "Location type {} at index {} is not supported: {}".format(
-                            type(coord), idx, coord
-                        )
-                    )
+        # Isochrones using waypoint class
+        if isinstance(coordinates, self.Waypoint):
+            return [coordinates._make_waypoint()]
 
         # Isochrones
-        elif isinstance(coordinates[0], float):
-            center = "geo!" + convert.delimit_list(
-                [convert.format_float(f) for f in list(reversed(coordinates))], ","
-            )
-            locations.append(center)
-        # Isochrones using waypoint class
-        elif isinstance(coordinates, self.Waypoint):
-            locations.append(coordinates._make_waypoint())
+        if convert.is_location(coordinates):
+            return ["geo!" + convert.format_locations([coordinates], order="latlng")]
+
+        # Directions and matrix calls which are lists of list, all coordinates are formatted at once
+        coordinates = convert.as_locations(coordinates)
+        positions = [coord for coord in coordinates if convert.is_location(coord)]
+        if len(positions) == len(coordinates):
+            positions = coordinates
+        formatted = iter(
+            convert.format_locations(positions, order="latlng").split(";") if positions else []
+        )
+
+        locations = []
+        for idx, coord in enumerate(coordinates):
+            if isinstance(coord, self.Waypoint):
+                locations.append(coord._make_waypoint())
+            elif convert.is_location(coord):
+                locations.append("geo!" + next(formatted))
+            else:
+                raise TypeError(
+                    "Location type {} at index {} is not supported: {}".format(type(coord), idx, coord)
+                )
 
         return locations
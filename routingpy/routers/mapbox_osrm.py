@@ -20,7 +20,7 @@ Core client functionality, common across all API requests.
 from typing import List, Optional, Tuple, Union
 
 from .. import convert, utils
-from ..client_base import DEFAULT
+from ..client_base import DEFAULT, Deadline
 from ..client_default import Client
 from ..direction import Direction, Directions
 from ..isochrone import Isochrone, Isochrones
@@ -115,6 +115,7 @@ class MapboxOSRM:
         waypoint_names: Optional[List[str]] = None,
         waypoint_targets: Optional[List[List[float]]] = None,
         dry_run: Optional[bool] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
     ):
         """Get directions between an origin point and a destination point.
 
@@ -218,13 +219,15 @@ class MapboxOSRM:
         :param dry_run: Print URL and parameters without sending the request.
         :param dry_run: bool
 
+        :param deadline: Time budget of the call including retries, in seconds or as
+            :class:`routingpy.client_base.Deadline` with separate connect and read timeouts.
+        :type deadline: float or :class:`routingpy.client_base.Deadline`
+
         :returns: One or multiple route(s) from provided coordinates and restrictions.
         :rtype: :class:`routingpy.direction.Direction` or :class:`routingpy.direction.Directions`
         """
 
-        coords = convert.delimit_list(
-            [convert.delimit_list([convert.format_float(f) for f in pair]) for pair in locations], ";"
-        )
+        coords = convert.format_locations(locations)
 
         params = {"coordinates": coords}
 
@@ -279,13 +282,7 @@ class MapboxOSRM:
             params["waypoint_names"] = convert.delimit_list(waypoint_names, ";")
 
         if waypoint_targets:
-            params["waypoint_targets"] = ";" + convert.delimit_list(
-                [
-                    convert.delimit_list([convert.format_float(f) for f in pair])
-                    for pair in waypoint_targets
-                ],
-                ";",
-            )
+            params["waypoint_targets"] = ";" + convert.format_locations(waypoint_targets)
 
         get_params = {"access_token": self.api_key} if self.api_key else {}
 
@@ -295,6 +292,7 @@ class MapboxOSRM:
                 get_params=get_params,
                 post_params=params,
                 dry_run=dry_run,
+                deadline=deadline,
             ),
             alternatives,
             geometries,
@@ -351,6 +349,7 @@ class MapboxOSRM:
         denoise: Optional[float] = None,
         generalize: Optional[float] = None,
         dry_run: Optional[bool] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
     ):
         """Gets isochrones or equidistants for a range of time values around a given set of coordinates.
 
@@ -385,6 +384,10 @@ class MapboxOSRM:
         :param dry_run: Print URL and parameters without sending the request.
         :param dry_run: bool
 
+        :param deadline: Time budget of the call including retries, in seconds or as
+            :class:`routingpy.client_base.Deadline` with separate connect and read timeouts.
+        :type deadline: float or :class:`routingpy.client_base.Deadline`
+
         :returns: An isochrone with the specified range.
         :rtype: :class:`routingpy.isochrone.Isochrones`
         """
@@ -415,6 +418,7 @@ class MapboxOSRM:
                 "/isochrone/v1/mapbox/" + profile + "/" + locations_string,
                 get_params=params,
                 dry_run=dry_run,
+                deadline=deadline,
             ),
             intervals,
             locations,
@@ -445,6 +449,7 @@ class MapboxOSRM:
         annotations: Optional[List[str]] = None,
         fallback_speed: Optional[int] = None,
         dry_run: Optional[bool] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
     ):
         """
         Gets travel distance and time for a matrix of origins and destinations.
@@ -480,20 +485,22 @@ class MapboxOSRM:
         :param dry_run: Print URL and parameters without sending the request.
         :param dry_run: bool
 
+        :param deadline: Time budget of the call including retries, in seconds or as
+            :class:`routingpy.client_base.Deadline` with separate connect and read timeouts.
+        :type deadline: float or :class:`routingpy.client_base.Deadline`
+
         :returns: A matrix from the specified sources and destinations.
         :rtype: :class:`routingpy.matrix.Matrix`
         """
 
-        coords = convert.delimit_list(
-            [convert.delimit_list([convert.format_float(f) for f in pair]) for pair in locations], ";"
-        )
+        coords = convert.format_locations(locations)
 
         params = {"access_token": self.api_key}
 
-        if sources:
+        if not convert.is_empty(sources):
             params["sources"] = convert.delimit_list(sources, ";")
 
-        if destinations:
+        if not convert.is_empty(destinations):
             params["destinations"] = convert.delimit_list(destinations, ";")
 
         if annotations:
@@ -507,6 +514,7 @@ class MapboxOSRM:
                 "/directions-matrix/v1/mapbox/" + profile + "/" + coords,
                 get_params=params,
                 dry_run=dry_run,
+                deadline=deadline,
             )
         )
 
@@ -14,10 +14,10 @@
 # License for the specific language governing permissions and limitations under
 # the License.
 #
-from typing import List, Optional
+from typing import List, Optional, Union
 
-from .. import utils
-from ..client_base import DEFAULT
+from .. import convert, utils
+from ..client_base import DEFAULT, Deadline
 from ..client_default import Client
 from ..direction import Direction, Directions
 from ..isochrone import Isochrone, Isochrones
@@ -123,6 +123,7 @@ class ORS:
         suppress_warnings: Optional[bool] = None,
         options: Optional[dict] = None,
         dry_run: Optional[bool] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
     ):
         """Get directions between an origin point and a destination point.
 
@@ -230,12 +231,16 @@ class ORS:
         :param dry_run: Print URL and parameters without sending the request.
         :type dry_run: bool
 
+        :param deadline: Time budget of the call including retries, in seconds or as
+            :class:`routingpy.client_base.Deadline` with separate connect and read timeouts.
+        :type deadline: float or :class:`routingpy.client_base.Deadline`
+
         :returns: A route from provided coordinates and restrictions.
         :rtype: :class:`routingpy.direction.Direction`
 
         """
 
-        params = {"coordinates": locations}
+        params = {"coordinates": convert.locations_to_list(locations)}
 
         if preference:
             params["preference"] = preference
@@ -313,6 +318,7 @@ class ORS:
                 get_params={},
                 post_params=params,
                 dry_run=dry_run,
+                deadline=deadline,
             ),
             format,
             units,
@@ -385,6 +391,7 @@ class ORS:
         attributes: Optional[List[str]] = None,
         intersections: Optional[bool] = None,
         dry_run: Optional[bool] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
     ):
         """Gets isochrones or equidistants for a range of time/distance values around a given set of coordinates.
 
@@ -429,12 +436,16 @@ class ORS:
         :param dry_run: Print URL and parameters without sending the request.
         :param dry_run: bool
 
+        :param deadline: Time budget of the call including retries, in seconds or as
+            :class:`routingpy.client_base.Deadline` with separate connect and read timeouts.
+        :type deadline: float or :class:`routingpy.client_base.Deadline`
+
         :returns: An isochrone with the specified range.
         :rtype: :class:`routingpy.isochrone.Isochrones`
         """
 
         params = {
-            "locations": [locations],
+            "locations": [convert.to_list(locations)],
             "range": intervals,
         }
 
@@ -462,6 +473,7 @@ class ORS:
                 get_params={},
                 post_params=params,
                 dry_run=dry_run,
+                deadline=deadline,
             ),
             interval_type,
         )
@@ -494,6 +506,7 @@ class ORS:
         resolve_locations: Optional[bool] = None,
         units: Optional[str] = None,
         dry_run: Optional[bool] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
     ):
         """Gets travel distance and time for a matrix of origins and destinations.
 
@@ -531,17 +544,21 @@ class ORS:
         :param dry_run: Print URL and parameters without sending the request.
         :param dry_run: bool
 
+        :param deadline: Time budget of the call including retries, in seconds or as
+            :class:`routingpy.client_base.Deadline` with separate connect and read timeouts.
+        :type deadline: float or :class:`routingpy.client_base.Deadline`
+
         :returns: A matrix from the specified sources and destinations.
         :rtype: :class:`routingpy.matrix.Matrix`
         """
 
-        params = {"locations": locations}
+        params = {"locations": convert.locations_to_list(locations)}
 
-        if sources:
-            params["sources"] = sources
+        if not convert.is_empty(sources):
+            params["sources"] = convert.to_list(sources)
 
-        if destinations:
-            params["destinations"] = destinations
+        if not convert.is_empty(destinations):
+            params["destinations"] = convert.to_list(destinations)
 
         if metrics:
             params["metrics"] = metrics
@@ -554,7 +571,11 @@ class ORS:
 
         return self.parse_matrix_json(
             self.client._request(
-                "/v2/matrix/" + profile + "/json", get_params={}, post_params=params, dry_run=dry_run
+                "/v2/matrix/" + profile + "/json",
+                get_params={},
+                post_params=params,
+                dry_run=dry_run,
+                deadline=deadline,
             )
         )
 
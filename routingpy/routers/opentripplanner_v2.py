@@ -15,13 +15,16 @@
 # the License.
 #
 import datetime
-from typing import List, Optional  # noqa: F401
+import json
+from typing import List, Optional, Union  # noqa: F401
 
-from .. import convert, utils
-from ..client_base import DEFAULT
+from .. import convert, exceptions, utils
+from ..batch import batch
+from ..client_base import DEFAULT, Deadline
 from ..client_default import Client
 from ..direction import Direction, Directions
 from ..isochrone import Isochrone, Isochrones
+from ..matrix import Matrix
 from ..raster import Raster
 
 
@@ -100,6 +103,7 @@ class OpenTripPlannerV2:
         arrive_by: Optional[bool] = False,
         num_itineraries: Optional[int] = 3,
         dry_run: Optional[bool] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
     ):
         """
         Get directions between an origin point and a destination point.
@@ -128,21 +132,20 @@ class OpenTripPlannerV2:
         :param dry_run: Print URL and parameters without sending the request.
         :type dry_run: bool
 
+        :param deadline: Time budget of the call including retries, in seconds or as
+            :class:`routingpy.client_base.Deadline` with separate connect and read timeouts.
+        :type deadline: float or :class:`routingpy.client_base.Deadline`
+
         :returns: One or multiple route(s) from provided coordinates and restrictions.
         :rtype: :class:`routingpy.direction.Direction` or :class:`routingpy.direction.Directions`
         """
-        transport_modes = [{"mode": mode} for mode in profile.strip().split(",")]
+        locations = convert.as_locations(locations)
+        plan_arguments = self._build_plan_arguments(
+            locations[0], locations[1], profile, date, time, arrive_by, num_itineraries
+        )
         query = f"""
             {{
-                plan(
-                    date: "{ date.strftime("%Y-%m-%d") }"
-                    time: "{ time.strftime("%H:%M:%S") }"
-                    from: {{lat: {locations[0][1]}, lon: {locations[0][0]}}}
-                    to: {{lat: {locations[1][1]}, lon: {locations[1][0]}}}
-                    transportModes: {str(transport_modes).replace("'", "")}
-                    numItineraries: {num_itineraries}
-                    arriveBy: {"true" if arrive_by else "false"}
-                ) {{
+                plan({plan_arguments}) {{
                     itineraries {{
                         duration
                         startTime
@@ -163,10 +166,24 @@ class OpenTripPlannerV2:
         """
         params = {"query": query}
         response = self.client._request(
-            "/otp/routers/default/index/graphql", post_params=params, dry_run=dry_run
+            "/otp/routers/default/index/graphql", post_params=params, dry_run=dry_run, deadline=deadline
         )
         return self._parse_directions_response(response, num_itineraries)
 
+    @staticmethod
+    def _build_plan_arguments(origin, destination, profile, date, time, arrive_by, num_itineraries):
+        """Builds the arguments of a GraphQL plan query."""
+        transport_modes = [{"mode": mode} for mode in profile.strip().split(",")]
+        return f"""
+                    date: "{ date.strftime("%Y-%m-%d") }"
+                    time: "{ time.strftime("%H:%M:%S") }"
+                    from: {{lat: {origin[1]}, lon: {origin[0]}}}
+                    to: {{lat: {destination[1]}, lon: {destination[0]}}}
+                    transportModes: {str(transport_modes).replace("'", "")}
+                    numItineraries: {num_itineraries}
+                    arriveBy: {"true" if arrive_by else "false"}
+                """
+
     def _parse_directions_response(self, response, num_itineraries):
         if response is None:  # pragma: no cover
             return Directions() if num_itineraries > 1 else Direction()
@@ -210,6 +227,7 @@ class OpenTripPlannerV2:
         cutoffs: Optional[List[int]] = [3600],
         arrive_by: Optional[bool] = False,
         dry_run: Optional[bool] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
     ):
         """Gets isochrones for a range of time values around a given set of coordinates.
 
@@ -232,6 +250,10 @@ class OpenTripPlannerV2:
         :param dry_run: Print URL and parameters without sending the request.
         :param dry_run: bool
 
+        :param deadline: Time budget of the call including retries, in seconds or as
+            :class:`routingpy.client_base.Deadline` with separate connect and read timeouts.
+        :type deadline: float or :class:`routingpy.client_base.Deadline`
+
         :returns: An isochrone with the specified range.
         :rtype: :class:`routingpy.isochrone.Isochrones`
         """
@@ -248,6 +270,7 @@ class OpenTripPlannerV2:
             "/otp/traveltime/isochrone",
             get_params=params,
             dry_run=dry_run,
+            deadline=deadline,
         )
         return self._parse_isochrones_response(response)
 
@@ -275,6 +298,7 @@ class OpenTripPlannerV2:
         cutoff: Optional[int] = 3600,
         arrive_by: Optional[bool] = False,
         dry_run: Optional[bool] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
     ):
         """Get raster for a time value around a given set of coordinates.
 
@@ -297,6 +321,10 @@ class OpenTripPlannerV2:
         :param dry_run: Print URL and parameters without sending the request.
         :param dry_run: bool
 
+        :param deadline: Time budget of the call including retries, in seconds or as
+            :class:`routingpy.client_base.Deadline` with separate connect and read timeouts.
+        :type deadline: float or :class:`routingpy.client_base.Deadline`
+
         :returns: A raster with the specified range.
         :rtype: :class:`routingpy.raster.Raster`
         """
@@ -311,6 +339,7 @@ class OpenTripPlannerV2:
             "/otp/traveltime/surface",
             get_params=params,
             dry_run=dry_run,
+            deadline=deadline,
         )
         return self._parse_rasters_response(response, cutoff)
 
@@ -320,5 +349,146 @@ class OpenTripPlannerV2:
 
         return Raster(image=response, max_travel_time=max_travel_time)
 
-    def matrix(self):  # pragma: no cover
-        raise NotImplementedError
+    def matrix(
+        self,
+        locations: List[List[float]],
+        profile: Optional[str] = "WALK,TRANSIT",
+        sources: Optional[List[int]] = None,
+        destinations: Optional[List[int]] = None,
+        date: Optional[datetime.date] = datetime.datetime.now().date(),
+        time: Optional[datetime.time] = datetime.datetime.now().time(),
+        arrive_by: Optional[bool] = False,
+        queries_per_request: Optional[int] = 50,
+        max_workers: Optional[int] = 4,
+        dry_run: Optional[bool] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
+    ):
+        """
+        Gets travel distance and time for a matrix of origins and destinations.
+
+        OpenTripPlanner has no matrix endpoint, so every cell is requested as a separate plan query for the
+        first itinerary OpenTripPlanner finds. ``queries_per_request`` plan queries are sent as aliases in one GraphQL request,
+        and ``max_workers`` of those requests run concurrently. Cells without itinerary are None, cells with
+        identical origin and destination are 0.
+
+        :param locations: List of coordinates as [[lon,lat], [lon,lat], ...].
+        :type locations: list of list of float
+
+        :param profile: Comma-separated list of transportation modes that the user is willing to
+            use. Default: "WALK,TRANSIT"
+        :type profile: str
+
+        :param sources: A list of indices that refer to the list of locations
+            (starting with 0). If not passed, all indices are considered.
+        :type sources: list of int
+
+        :param destinations: A list of indices that refer to the list of locations
+            (starting with 0). If not passed, all indices are considered.
+        :type destinations: list of int
+
+        :param date: Date of departure or arrival. Default value: current date.
+        :type date: datetime.date
+
+        :param time: Time of departure or arrival. Default value: current time.
+        :type time: datetime.time
+
+        :arrive_by: Whether the itinerary should depart at the specified time (False), or arrive to
+            the destination at the specified time (True). Default value: False.
+        :type arrive_by: bool
+
+        :param queries_per_request: Number of plan queries sent in one GraphQL request. Default value: 50.
+        :type queries_per_request: int
+
+        :param max_workers: Number of GraphQL requests sent concurrently. Default value: 4.
+        :type max_workers: int
+
+        :param dry_run: Print URL and parameters without sending the request.
+        :type dry_run: bool
+
+        :param deadline: Time budget of the call including retries, in seconds or as
+            :class:`routingpy.client_base.Deadline` with separate connect and read timeouts.
+        :type deadline: float or :class:`routingpy.client_base.Deadline`
+
+        :returns: A matrix from the specified sources and destinations.
+        :rtype: :class:`routingpy.matrix.Matrix`
+        """
+        locations = convert.as_locations(locations)
+        sources = list(range(len(locations))) if sources is None else sources
+        destinations = list(range(len(locations))) if destinations is None else destinations
+
+        durations = [[None] * len(destinations) for _ in sources]
+        distances = [[None] * len(destinations) for _ in sources]
+
+        cells = []
+        for row, source in enumerate(sources):
+            for col, destination in enumerate(destinations):
+                if list(locations[source]) == list(locations[destination]):
+                    durations[row][col], distances[row][col] = 0, 0
+                else:
+                    cells.append((row, col))
+
+        # all requests share the matrix' time budget
+        if deadline is not None:
+            deadline = Deadline.of(deadline).start()
+
+        queries = []
+        for start in range(0, len(cells), queries_per_request):
+            plans = []
+            for idx in range(start, min(start + queries_per_request, len(cells))):
+                row, col = cells[idx]
+                plan_arguments = self._build_plan_arguments(
+                    locations[sources[row]],
+                    locations[destinations[col]],
+                    profile,
+                    date,
+                    time,
+                    arrive_by,
+                    1,
+                )
+                plans.append(
+                    f"""
+                p{idx}: plan({plan_arguments}) {{
+                    itineraries {{
+                        duration
+                        legs {{
+                            distance
+                        }}
+                    }}
+                }}"""
+                )
+            queries.append(
+                {"query": "{{{}\n}}".format("".join(plans)), "dry_run": dry_run, "deadline": deadline}
+            )
+
+        raw = {"data": {}}
+        for result in batch(self._request_graphql, queries, max_workers=max_workers):
+            if not result.ok:
+                raise result.error
+            if result.result is None:
+                continue
+            # GraphQL reports errors with HTTP 200 and no data
+            if result.result.get("errors"):
+                raise exceptions.RouterApiError(200, json.dumps(result.result["errors"]))
+            raw["data"].update(result.result.get("data") or {})
+
+        return self._parse_matrix_response(raw, cells, durations, distances)
+
+    def _request_graphql(self, query, dry_run=None, deadline=None):
+        return self.client._request(
+            "/otp/routers/default/index/graphql",
+            post_params={"query": query},
+            dry_run=dry_run,
+            deadline=deadline,
+        )
+
+    @staticmethod
+    def _parse_matrix_response(response, cells, durations, distances):
+        for alias, plan in response["data"].items():
+            if not plan or not plan["itineraries"]:
+                continue
+            row, col = cells[int(alias[1:])]
+            itinerary = plan["itineraries"][0]
+            durations[row][col] = int(itinerary["duration"])
+            distances[row][col] = int(sum(leg["distance"] for leg in itinerary["legs"]))
+
+        return Matrix(durations=durations, distances=distances, raw=response)
@@ -16,12 +16,17 @@
 #
 
 from typing import List, Optional, Union  # noqa: F401
+from urllib.parse import quote
 
-from .. import convert, utils
-from ..client_base import DEFAULT
+from .. import convert, osrm_flatbuffers, utils
+from ..client_base import DEFAULT, Deadline
 from ..client_default import Client
 from ..direction import Direction, Directions
-from ..matrix import Matrix
+from ..matrix import Matrix, _FlatTable
+
+# Longer plain coordinate paths are sent as polyline6 with locations_encoding="auto", which keeps the
+# 6 decimals of the plain format while staying below common URL length limits of proxies
+_MAX_PLAIN_LOCATIONS_LENGTH = 2000
 
 
 class OSRM:
@@ -38,6 +43,7 @@ class OSRM:
         retry_over_query_limit: Optional[bool] = False,
         skip_api_error: Optional[bool] = None,
         client=Client,
+        locations_encoding: Optional[str] = "auto",
         **client_kwargs,
     ):
         """
@@ -73,9 +79,20 @@ class OSRM:
         :param client: A client class for request handling. Needs to be derived from :class:`routingpy.client_base.BaseClient`
         :type client: abc.ABCMeta
 
+        :param locations_encoding: How locations are encoded in the URL path of requests. One of "plain" for
+            ``lon,lat;lon,lat``, "polyline" or "polyline6" for an encoded polyline with a precision of 5 or 6
+            decimals, or "auto" for "plain", unless the path gets longer than 2000 characters, then "polyline6".
+            Default "auto".
+        :type locations_encoding: str
+
         :param client_kwargs: Additional arguments passed to the client, such as headers or proxies.
         :type client_kwargs: dict
         """
+        if locations_encoding not in ("plain", "polyline", "polyline6", "auto"):
+            raise ValueError(
+                "OSRM: locations_encoding needs to be one of ['plain', 'polyline', 'polyline6', 'auto']"
+            )
+        self.locations_encoding = locations_encoding
 
         self.client = client(
             base_url,
@@ -100,6 +117,9 @@ class OSRM:
         geometries: Optional[str] = None,
         overview: Optional[str] = None,
         dry_run: Optional[bool] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
+        *,
+        format: Optional[str] = None,
         **direction_kwargs,
     ):
         """
@@ -164,12 +184,18 @@ class OSRM:
         :param dry_run: Print URL and parameters without sending the request.
         :param dry_run: bool
 
+        :param deadline: Time budget of the call including retries, in seconds or as
+            :class:`routingpy.client_base.Deadline` with separate connect and read timeouts.
+        :type deadline: float or :class:`routingpy.client_base.Deadline`
+
+        :param format: The response format, "json" or "flatbuffers". FlatBuffers responses are read without
+            decoding the whole response, ``raw`` is then the response body as bytes. Default "json".
+        :type format: str
+
         :returns: One or multiple route(s) from provided coordinates and restrictions.
         :rtype: :class:`routingpy.direction.Direction` or :class:`routingpy.direction.Directions`
         """
-        coords = convert.delimit_list(
-            [convert.delimit_list([convert.format_float(f) for f in pair]) for pair in locations], ";"
-        )
+        coords = self._build_locations(locations) + _format_suffix(format)
 
         params = self.get_direction_params(
             locations,
@@ -185,12 +211,35 @@ class OSRM:
             **direction_kwargs,
         )
 
-        return self.parse_direction_json(
-            self.client._request(f"/route/v1/{profile}/{coords}", get_params=params, dry_run=dry_run),
+        parser = (
+            self.parse_direction_flatbuffers if format == "flatbuffers" else self.parse_direction_json
+        )
+        return parser(
+            self.client._request(
+                f"/route/v1/{profile}/{coords}", get_params=params, dry_run=dry_run, deadline=deadline
+            ),
             alternatives,
             geometries,
         )
 
+    def _build_locations(self, locations):
+        """Returns the locations for the URL path in the router's ``locations_encoding``."""
+        encoding = self.locations_encoding
+        locations = convert.as_locations(locations)
+        if encoding in ("plain", "auto"):
+            coords = convert.format_locations(locations)
+            if encoding == "plain" or len(coords) <= _MAX_PLAIN_LOCATIONS_LENGTH:
+                return coords
+            encoding = "polyline6"
+
+        if encoding == "polyline":
+            polyline = utils.encode_polyline5(locations)
+        else:
+            polyline = utils.encode_polyline6(locations)
+
+        # polylines may contain "?" and other characters which aren't allowed in a path
+        return "{}({})".format(encoding, quote(polyline, safe="@"))
+
     @staticmethod
     def get_direction_params(
         locations,
@@ -285,6 +334,40 @@ class OSRM:
                 raw=response,
             )
 
+    @staticmethod
+    def parse_direction_flatbuffers(response, alternatives, geometry_format):
+        """Parses a FlatBuffers ``/route`` response like :meth:`parse_direction_json`, the raw response is
+        the FlatBuffers body."""
+        if response is None:  # pragma: no cover
+            if alternatives:
+                return Directions()
+            else:
+                return Direction()
+
+        def _parse_geometry(route):
+            if geometry_format == "geojson":
+                return route["coordinates"]
+            elif geometry_format == "polyline6":
+                return utils.decode_polyline6(route["polyline"], is3d=False)
+            elif geometry_format in (None, "polyline"):
+                return utils.decode_polyline5(route["polyline"], is3d=False)
+            raise ValueError(
+                "OSRM: parameter geometries needs one of ['polyline', 'polyline6', 'geojson"
+            )
+
+        routes = [
+            Direction(
+                geometry=_parse_geometry(route),
+                duration=int(route["duration"]),
+                distance=int(route["distance"]),
+                raw=response,
+            )
+            for route in osrm_flatbuffers.decode_route(response)
+        ]
+        if alternatives:
+            return Directions(routes, response)
+        return routes[0]
+
     def isochrones(self):  # pragma: no cover
         raise NotImplementedError
 
@@ -298,6 +381,9 @@ class OSRM:
         destinations: Optional[List[int]] = None,
         dry_run: Optional[bool] = None,
         annotations: Optional[List[str]] = ("duration", "distance"),
+        deadline: Optional[Union[float, Deadline]] = None,
+        *,
+        format: Optional[str] = None,
         **matrix_kwargs,
     ):
         """
@@ -350,6 +436,16 @@ class OSRM:
             One or more of ["duration", "distance"].
         :type annotations: List[str]
 
+        :param deadline: Time budget of the call including retries, in seconds or as
+            :class:`routingpy.client_base.Deadline` with separate connect and read timeouts.
+        :type deadline: float or :class:`routingpy.client_base.Deadline`
+
+        :param format: The response format, "json" or "flatbuffers". FlatBuffers tables are read straight
+            into compact, read-only ``durations`` and ``distances`` with 4 bytes per cell, ``raw`` is then the
+            response body as bytes. Note that OSRM returns 0 for cells without a path in this format. Default
+            "json".
+        :type format: str
+
         :returns: A matrix from the specified sources and destinations.
         :rtype: :class:`routingpy.matrix.Matrix`
 
@@ -357,16 +453,17 @@ class OSRM:
            Add annotations parameter to get both distance and duration
         """
 
-        coords = convert.delimit_list(
-            [convert.delimit_list([convert.format_float(f) for f in pair]) for pair in locations], ";"
-        )
+        coords = self._build_locations(locations) + _format_suffix(format)
 
         params = self.get_matrix_params(
             locations, profile, radiuses, bearings, sources, destinations, annotations, **matrix_kwargs
         )
 
-        return self.parse_matrix_json(
-            self.client._request(f"/table/v1/{profile}/{coords}", get_params=params, dry_run=dry_run)
+        parser = self.parse_matrix_flatbuffers if format == "flatbuffers" else self.parse_matrix_json
+        return parser(
+            self.client._request(
+                f"/table/v1/{profile}/{coords}", get_params=params, dry_run=dry_run, deadline=deadline
+            )
         )
 
     @staticmethod
@@ -397,10 +494,10 @@ class OSRM:
                 [convert.delimit_list(pair) for pair in bearings], ";"
             )
 
-        if sources:
+        if not convert.is_empty(sources):
             params["sources"] = convert.delimit_list(sources, ";")
 
-        if destinations:
+        if not convert.is_empty(destinations):
             params["destinations"] = convert.delimit_list(destinations, ";")
 
         if annotations:
@@ -418,3 +515,26 @@ class OSRM:
         return Matrix(
             durations=response.get("durations"), distances=response.get("distances"), raw=response
         )
+
+    @staticmethod
+    def parse_matrix_flatbuffers(response):
+        """Parses a FlatBuffers ``/table`` response like :meth:`parse_matrix_json`, without converting the
+        cells to Python lists. The raw response is the FlatBuffers body."""
+        if response is None:  # pragma: no cover
+            return Matrix()
+
+        rows, cols, durations, distances = osrm_flatbuffers.decode_table(response)
+        return Matrix(
+            durations=None if durations is None else _FlatTable(durations, cols),
+            distances=None if distances is None else _FlatTable(distances, cols),
+            raw=response,
+        )
+
+
+def _format_suffix(format):
+    """Checks the response format and returns the suffix of the URL path for it."""
+    if format is None:
+        return ""
+    if format not in ("json", "flatbuffers"):
+        raise ValueError("format must be either 'json' or 'flatbuffers', not {}.".format(format))
+    return "." + format
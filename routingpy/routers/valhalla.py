@@ -18,13 +18,15 @@
 from operator import itemgetter
 from typing import List, Optional, Sequence, Union  # noqa: F401
 
-from .. import utils
-from ..client_base import DEFAULT
+from .. import convert, utils, valhalla_pbf
+from ..batch import batch
+from ..client_base import DEFAULT, Deadline
 from ..client_default import Client
 from ..direction import Direction
 from ..expansion import Edge, Expansions
 from ..isochrone import Isochrone, Isochrones
 from ..matrix import Matrix
+from ..parse_pool import ParsePool
 from ..valhalla_attributes import MatchedResults
 
 
@@ -42,6 +44,7 @@ class Valhalla:
         retry_over_query_limit: Optional[bool] = False,
         skip_api_error: Optional[bool] = None,
         client=Client,
+        parse_pool: Optional[ParsePool] = None,
         **client_kwargs: dict
     ):
         """
@@ -71,6 +74,9 @@ class Valhalla:
         :param client: A client class for request handling. Needs to be derived from :class:`routingpy.base.BaseClient`
         :type client: abc.ABCMeta
 
+        :param parse_pool: Decode and parse responses in the pool's worker processes instead of the calling thread.
+            Note, that the results' ``raw`` property will be None, unless the pool was created with ``keep_raw=True``.
+
         :param client_kwargs: Additional arguments passed to the client, such as headers or proxies.
         """
 
@@ -81,9 +87,11 @@ class Valhalla:
             retry_timeout,
             retry_over_query_limit,
             skip_api_error,
-            **client_kwargs
+            **client_kwargs,
         )
 
+        self.parse_pool = parse_pool
+
     class Waypoint(object):
         """
         Constructs a waypoint with additional information or constraints.
@@ -124,6 +132,9 @@ class Valhalla:
         date_time: Optional[dict] = None,
         id: Optional[Union[str, int, float]] = None,
         dry_run: Optional[bool] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
+        *,
+        format: Optional[str] = None,
         **kwargs
     ):
         """Get directions between an origin point and a destination point.
@@ -178,12 +189,19 @@ class Valhalla:
 
         :param dry_run: Print URL and parameters without sending the request.
 
+        :param deadline: Time budget of the call including retries, in seconds or as
+            :class:`routingpy.client_base.Deadline` with separate connect and read timeouts.
+
+        :param format: The response format, "json" or "pbf". Protobuf responses are smaller and decoded
+            faster, especially for long routes. Default "json".
+
         :param kwargs: any additional keyword arguments which will override parameters.
 
         :returns: A route from provided coordinates and restrictions.
         :rtype: :class:`routingpy.direction.Direction`
         """
 
+        _check_format(format, kwargs)
         params = self.get_direction_params(
             locations,
             profile,
@@ -197,12 +215,16 @@ class Valhalla:
             avoid_polygons,
             date_time,
             id,
-            **kwargs
+            **kwargs,
         )
 
-        return self.parse_direction_json(
-            self.client._request("/route", post_params=params, dry_run=dry_run),
-            units,
+        if params.get("format") == "pbf":
+            return self._request_and_parse(
+                self.parse_direction_pbf, "/route", params, dry_run, units, deadline=deadline
+            )
+
+        return self._request_and_parse(
+            self.parse_direction_json, "/route", params, dry_run, units, deadline=deadline
         )
 
     @staticmethod
@@ -247,7 +269,7 @@ class Valhalla:
             if directions_type:
                 params["directions_options"]["directions_type"] = directions_type
 
-        if avoid_locations:
+        if not convert.is_empty(avoid_locations):
             params["avoid_locations"] = Valhalla._build_locations(avoid_locations)
 
         if avoid_polygons:
@@ -279,6 +301,24 @@ class Valhalla:
 
         return Direction(geometry=geometry, duration=int(duration), distance=int(distance), raw=response)
 
+    @staticmethod
+    def parse_direction_pbf(response, units):
+        """Parses a protobuf ``/route`` response like :meth:`parse_direction_json`, the raw response is the
+        protobuf body."""
+        if response is None:  # pragma: no cover
+            return Direction()
+
+        geometry, duration, distance = [], 0, 0
+        factor = 0.621371 if units == "mi" else 1
+        for leg in valhalla_pbf.decode_route(response):
+            geometry.extend(utils.decode_polyline6(leg["shape"]))
+            duration += leg["time"]
+            # the JSON response rounds lengths to 3 decimals for km and 4 for mi
+            length = round(leg["length"], 4 if units == "mi" else 3)
+            distance += int(length * 1000 * factor)
+
+        return Direction(geometry=geometry, duration=int(duration), distance=int(distance), raw=response)
+
     def isochrones(  # noqa: C901
         self,
         locations: List[float],
@@ -300,6 +340,9 @@ class Valhalla:
         show_locations: Optional[List[List[float]]] = None,
         id: Optional[str] = None,
         dry_run: Optional[bool] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
+        *,
+        format: Optional[str] = None,
         **kwargs
     ):
         """Gets isochrones or equidistants for a range of time values around a given set of coordinates.
@@ -363,10 +406,17 @@ class Valhalla:
 
         :param dry_run: Print URL and parameters without sending the request.
 
+        :param deadline: Time budget of the call including retries, in seconds or as
+            :class:`routingpy.client_base.Deadline` with separate connect and read timeouts.
+
+        :param format: The response format, "json" or "pbf". Protobuf responses are smaller and decoded
+            faster, especially for detailed isochrones. Default "json".
+
         :returns: An isochrone with the specified range.
         :rtype: :class:`routingpy.isochrone.Isochrones`
         """
 
+        _check_format(format, kwargs)
         params = self.get_isochrone_params(
             locations,
             profile,
@@ -383,14 +433,31 @@ class Valhalla:
             date_time,
             show_locations,
             id,
-            **kwargs
+            **kwargs,
         )
 
-        return self.parse_isochrone_json(
-            self.client._request("/isochrone", post_params=params, dry_run=dry_run),
+        if params.get("format") == "pbf":
+            return self._request_and_parse(
+                self.parse_isochrone_pbf,
+                "/isochrone",
+                params,
+                dry_run,
+                intervals,
+                locations,
+                interval_type,
+                polygons,
+                deadline=deadline,
+            )
+
+        return self._request_and_parse(
+            self.parse_isochrone_json,
+            "/isochrone",
+            params,
+            dry_run,
             intervals,
             locations,
             interval_type,
+            deadline=deadline,
         )
 
     @staticmethod  # noqa: C901
@@ -456,7 +523,7 @@ class Valhalla:
         if generalize:
             params["generalize"] = generalize
 
-        if avoid_locations:
+        if not convert.is_empty(avoid_locations):
             params["avoid_locations"] = Valhalla._build_locations(avoid_locations)
 
         if avoid_polygons:
@@ -494,6 +561,34 @@ class Valhalla:
 
         return Isochrones(isochrones, response)
 
+    @staticmethod
+    def parse_isochrone_pbf(response, intervals, locations, interval_type, polygons):
+        """Parses a protobuf ``/isochrone`` response like :meth:`parse_isochrone_json`, the raw response is the
+        protobuf body."""
+        if response is None:  # pragma: no cover
+            return Isochrones()
+
+        isochrones = []
+        for idx, (_, contours) in enumerate(reversed(valhalla_pbf.decode_isochrone(response))):
+            if polygons:
+                # parse_isochrone_json skips MultiPolygons, i.e. intervals with more than one contour
+                if len(contours) != 1:
+                    continue
+                geometry = contours[0]
+            else:
+                geometry = [coord for contour in contours for ring in contour for coord in ring]
+
+            isochrones.append(
+                Isochrone(
+                    geometry=geometry,
+                    interval=intervals[idx],
+                    center=locations,
+                    interval_type=interval_type,
+                )
+            )
+
+        return Isochrones(isochrones, response)
+
     def matrix(
         self,
         locations: List[List[float]],
@@ -508,6 +603,10 @@ class Valhalla:
         date_time: Optional[dict] = None,
         id: Optional[str] = None,
         dry_run: Optional[bool] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
+        *,
+        verbose: Optional[bool] = None,
+        format: Optional[str] = None,
         **kwargs
     ):
         """
@@ -556,10 +655,21 @@ class Valhalla:
 
         :param dry_run: Print URL and parameters without sending the request.
 
+        :param deadline: Time budget of the call including retries, in seconds or as
+            :class:`routingpy.client_base.Deadline` with separate connect and read timeouts.
+
+        :param verbose: Set False to request the concise matrix format of Valhalla 3.4 and newer, with arrays
+            of durations and distances instead of an object per origin-destination pair. It's about a fifth of
+            the size and decoded and parsed about 4 times faster. Older Valhalla versions ignore it. Default True.
+
+        :param format: The response format, "json" or "pbf". Protobuf responses are smaller and decoded
+            faster, especially for big matrices. Default "json".
+
         :returns: A matrix from the specified sources and destinations.
         :rtype: :class:`routingpy.matrix.Matrix`
         """
 
+        _check_format(format, kwargs)
         params = self.get_matrix_params(
             locations,
             profile,
@@ -572,12 +682,23 @@ class Valhalla:
             units,
             date_time,
             id,
-            **kwargs
+            verbose,
+            **kwargs,
         )
 
-        return self.parse_matrix_json(
-            self.client._request("/sources_to_targets", post_params=params, dry_run=dry_run),
-            units,
+        if params.get("format") == "pbf":
+            return self._request_and_parse(
+                self.parse_matrix_pbf,
+                "/sources_to_targets",
+                params,
+                dry_run,
+                units,
+                len(params["targets"]),
+                deadline=deadline,
+            )
+
+        return self._request_and_parse(
+            self.parse_matrix_json, "/sources_to_targets", params, dry_run, units, deadline=deadline
         )
 
     @staticmethod
@@ -593,6 +714,7 @@ class Valhalla:
         units=None,
         date_time=None,
         id=None,
+        verbose=None,
         **kwargs
     ):
         """
@@ -628,7 +750,7 @@ class Valhalla:
             if preference == "shortest":
                 params["costing_options"][profile]["shortest"] = True
 
-        if avoid_locations:
+        if not convert.is_empty(avoid_locations):
             params["avoid_locations"] = Valhalla._build_locations(avoid_locations)
 
         if avoid_polygons:
@@ -643,6 +765,11 @@ class Valhalla:
         if id:
             params["id"] = id
 
+        if verbose is not None:
+            params["verbose"] = verbose
+
+        params.update(kwargs)
+
         return params
 
     @staticmethod
@@ -651,6 +778,16 @@ class Valhalla:
             return Matrix()
 
         factor = 0.621371 if units == "mi" else 1
+
+        # The concise format of verbose=false has the arrays already, only distances need to be converted
+        if isinstance(response["sources_to_targets"], dict):
+            durations = response["sources_to_targets"]["durations"]
+            distances = [
+                [int(distance * 1000 * factor) if distance is not None else None for distance in row]
+                for row in response["sources_to_targets"]["distances"]
+            ]
+            return Matrix(durations=durations, distances=distances, raw=response)
+
         durations = [
             [destination["time"] for destination in origin] for origin in response["sources_to_targets"]
         ]
@@ -666,6 +803,34 @@ class Valhalla:
 
         return Matrix(durations=durations, distances=distances, raw=response)
 
+    @staticmethod
+    def parse_matrix_pbf(response, units, n_targets):
+        """Parses a protobuf ``/sources_to_targets`` response like :meth:`parse_matrix_json`, the raw response
+        is the protobuf body."""
+        if response is None:  # pragma: no cover
+            return Matrix()
+
+        times, meters = valhalla_pbf.decode_matrix(response)
+
+        # The JSON response has distances in mi, which parse_matrix_json multiplies with 1000 * 0.621371 too
+        factor = 0.000621371 * 1000 * 0.621371 if units == "mi" else 1
+        durations, distances = [], []
+        for start in range(0, len(times), n_targets):
+            row_durations, row_distances = [], []
+            for time, distance in zip(
+                times[start : start + n_targets], meters[start : start + n_targets]
+            ):
+                if time == valhalla_pbf.MAX_COST:
+                    row_durations.append(None)
+                    row_distances.append(None)
+                else:
+                    row_durations.append(int(time))
+                    row_distances.append(int(distance * factor))
+            durations.append(row_durations)
+            distances.append(row_distances)
+
+        return Matrix(durations=durations, distances=distances, raw=response)
+
     def expansion(
         self,
         locations: Sequence[float],
@@ -678,6 +843,7 @@ class Valhalla:
         date_time: Optional[dict] = None,
         id: Optional[str] = None,
         dry_run: Optional[bool] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
         **kwargs
     ) -> Expansions:
         """Gets the expansion tree for a range of time or distance values around a given coordinate.
@@ -713,6 +879,9 @@ class Valhalla:
 
         :param dry_run: Print URL and parameters without sending the request.
 
+        :param deadline: Time budget of the call including retries, in seconds or as
+            :class:`routingpy.client_base.Deadline` with separate connect and read timeouts.
+
         :returns: An expansions object consisting of single line strings and their attributes (if specified).
         """
         params = self.get_expansion_params(
@@ -725,13 +894,17 @@ class Valhalla:
             options,
             date_time,
             id,
-            **kwargs
+            **kwargs,
         )
-        return self.parse_expansion_json(
-            self.client._request("/expansion", post_params=params, dry_run=dry_run),
+        return self._request_and_parse(
+            self.parse_expansion_json,
+            "/expansion",
+            params,
+            dry_run,
             locations,
             expansion_properties,
             interval_type,
+            deadline=deadline,
         )
 
     @classmethod
@@ -794,6 +967,11 @@ class Valhalla:
         filters_action: Optional[str] = None,
         options: Optional[dict] = None,
         dry_run: Optional[bool] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
+        *,
+        chunk_size: Optional[int] = 16000,
+        chunk_overlap: int = 50,
+        max_workers: int = 4,
         **kwargs
     ) -> MatchedResults:
         """
@@ -818,18 +996,82 @@ class Valhalla:
             https://github.com/valhalla/valhalla/blob/master/docs/api/turn-by-turn/api-reference.md#costing-options
         :param dry_run: Print URL and parameters without sending the request.
 
+        :param deadline: Time budget of the call including retries, in seconds or as
+            :class:`routingpy.client_base.Deadline` with separate connect and read timeouts. Chunks of a long
+            trace share the budget.
+
+        :param chunk_size: Traces with more points are split into chunks of at most this many points, which
+            are map-matched concurrently and stitched into one result. The edge which two chunks have in
+            common at their hand-over point is kept once and ``edge_index`` refers to the stitched edges. The
+            attributes needed for stitching are always requested. None disables chunking. Default 16000,
+            Valhalla's default ``max_shape`` for map-matching.
+
+        :param chunk_overlap: Number of points shared by consecutive chunks, so their matches agree where
+            they hand over. Needs to be smaller than half of ``chunk_size``. Default 50.
+
+        :param max_workers: Number of chunks map-matched concurrently. Default 4.
+
         :raises: ValueError if 'locations' and 'encoded_polyline' was specified
         :returns: A :class:`MatchedResults` object with matched edges and points set.
         """
-        if locations and encoded_polyline:
+        if not convert.is_empty(locations) and encoded_polyline:
             raise ValueError
+        if chunk_size is not None and not 0 < chunk_overlap < chunk_size / 2:
+            raise ValueError("chunk_overlap must be positive and smaller than half of chunk_size.")
 
         params = self.get_trace_attributes_params(
             locations, profile, shape_match, encoded_polyline, filters, filters_action, options, **kwargs
         )
 
-        return self.parse_trace_attributes_json(
-            self.client._request("/trace_attributes", post_params=params, dry_run=dry_run)
+        if chunk_size is not None:
+            shape = params.get("shape")
+            if shape is None:
+                shape = [
+                    {"lon": lon, "lat": lat} for lon, lat in utils.decode_polyline6(encoded_polyline)
+                ]
+            if len(shape) > chunk_size:
+                return self._trace_attributes_chunked(
+                    params, shape, chunk_size, chunk_overlap, max_workers, dry_run, deadline
+                )
+
+        return self._request_and_parse(
+            self.parse_trace_attributes_json, "/trace_attributes", params, dry_run, deadline=deadline
+        )
+
+    def _trace_attributes_chunked(
+        self, params, shape, chunk_size, chunk_overlap, max_workers, dry_run, deadline
+    ):
+        """Map-matches overlapping chunks of a long trace concurrently and stitches their responses."""
+        params = _with_stitching_attributes(params)
+        params.pop("encoded_polyline", None)
+
+        # all requests share the trace's time budget
+        if deadline is not None:
+            deadline = Deadline.of(deadline).start()
+
+        starts = list(range(0, len(shape) - chunk_overlap, chunk_size - chunk_overlap))
+        requests = [
+            {
+                "params": dict(params, shape=shape[start : start + chunk_size]),
+                "dry_run": dry_run,
+                "deadline": deadline,
+            }
+            for start in starts
+        ]
+
+        chunks = []
+        for start, result in zip(starts, batch(self._request_trace_attributes, requests, max_workers)):
+            if not result.ok:
+                raise result.error
+            if result.result is None:
+                return self.parse_trace_attributes_json(None)
+            chunks.append((start, result.result))
+
+        return self.parse_trace_attributes_json(_stitch_trace_attributes(chunks))
+
+    def _request_trace_attributes(self, params, dry_run=None, deadline=None):
+        return self.client._request(
+            "/trace_attributes", post_params=params, dry_run=dry_run, deadline=deadline
         )
 
     @classmethod
@@ -845,7 +1087,7 @@ class Valhalla:
         **kwargs
     ):
         params = dict()
-        if locations:
+        if not convert.is_empty(locations):
             params["shape"] = cls._build_locations(locations)
         elif encoded_polyline:
             params["encoded_polyline"] = encoded_polyline
@@ -878,21 +1120,34 @@ class Valhalla:
 
         return MatchedResults(response)
 
+    def _request_and_parse(self, parser, url, params, dry_run, *parser_args, deadline=None):
+        """Requests and parses in this thread or, if a parse pool is set, decodes and parses in the pool."""
+        if self.parse_pool is None:
+            return parser(
+                self.client._request(url, post_params=params, dry_run=dry_run, deadline=deadline),
+                *parser_args,
+            )
+
+        body = self.client._request(
+            url, post_params=params, dry_run=dry_run, decode=False, deadline=deadline
+        )
+        return self.parse_pool.parse(parser, body, *parser_args, decode=params.get("format") != "pbf")
+
     @staticmethod
     def _build_locations(coordinates):
         """Build the locations object for all methods"""
 
         locations = []
 
-        # Isochrones only support one coordinate tuple, so check for type of first element
+        # Isochrones only support one coordinate tuple
         if isinstance(coordinates, Valhalla.Waypoint):
             locations.append(coordinates._make_waypoint())
-        elif isinstance(coordinates[0], float):
-            locations.append({"lon": coordinates[0], "lat": coordinates[1]})
-        elif isinstance(coordinates[0], (list, tuple, Valhalla.Waypoint)):
-            for idx, coord in enumerate(coordinates):
-                if isinstance(coord, (list, tuple)):
-                    locations.append({"lon": coord[0], "lat": coord[1]}),
+        elif convert.is_location(coordinates):
+            locations.append({"lon": float(coordinates[0]), "lat": float(coordinates[1])})
+        else:
+            for idx, coord in enumerate(convert.as_locations(coordinates)):
+                if convert.is_location(coord):
+                    locations.append({"lon": float(coord[0]), "lat": float(coord[1])})
                 elif isinstance(coord, Valhalla.Waypoint):
                     locations.append(coord._make_waypoint())
                 else:
@@ -903,3 +1158,137 @@ class Valhalla:
                     )
 
         return locations
+
+
+def _check_format(format, kwargs):
+    """Checks the response format and adds it to the request's kwargs."""
+    if format is None:
+        return
+    if format not in ("json", "pbf"):
+        raise ValueError("format must be either 'json' or 'pbf', not {}.".format(format))
+    kwargs["format"] = format
+
+
+# Attributes of map-matching responses which are needed to stitch the chunks of a trace
+_STITCHING_ATTRIBUTES = (
+    "shape",
+    "edge.id",
+    "edge.begin_shape_index",
+    "edge.end_shape_index",
+    "matched.point",
+    "matched.edge_index",
+)
+
+
+def _with_stitching_attributes(params):
+    """Returns the map-matching parameters with filters which don't exclude the attributes for stitching."""
+    filters = params.get("filters")
+    if not filters:
+        return dict(params)
+
+    attributes = filters.get("attributes", [])
+    if filters.get("action", params.get("action")) == "include":
+        attributes = attributes + [attr for attr in _STITCHING_ATTRIBUTES if attr not in attributes]
+    else:
+        attributes = [attr for attr in attributes if attr not in _STITCHING_ATTRIBUTES]
+    return dict(params, filters=dict(filters, attributes=attributes))
+
+
+def _find_cut(prev_start, prev_points, start, points):
+    """
+    Returns the index of the trace point where the chunk beginning at ``start`` takes over from the previous
+    one: the point closest to the middle of the overlap which both chunks matched. The overlap's outer points
+    are avoided, as a chunk's first and last edges are only partially traversed.
+    """
+    end = prev_start + len(prev_points)
+    candidates = range(start + 1, end - 1) if end - start > 2 else range(start, end)
+    middle = (start + end) // 2
+    for idx in sorted(candidates, key=lambda idx: abs(idx - middle)):
+        if (
+            prev_points[idx - prev_start].get("edge_index") is not None
+            and points[idx - start].get("edge_index") is not None
+        ):
+            return idx
+    return middle
+
+
+def _stitch_trace_attributes(chunks):
+    """
+    Stitches the map-matching responses of overlapping chunks of a trace, given as (index of the chunk's
+    first trace point, response), into one response. Each chunk contributes the matched points up to the
+    next chunk's cut point and the edges up to the cut point's edge, which is kept once if the next chunk
+    matched the same edge. Edge and shape indices are remapped to the stitched edges and shape.
+    """
+    cuts = [0]
+    for (prev_start, prev), (start, response) in zip(chunks, chunks[1:]):
+        cuts.append(_find_cut(prev_start, prev["matched_points"], start, response["matched_points"]))
+    cuts.append(chunks[-1][0] + len(chunks[-1][1]["matched_points"]))
+
+    stitched = {
+        key: value
+        for key, value in chunks[0][1].items()
+        if key not in ("shape", "edges", "matched_points", "admins")
+    }
+    shape, edges, points, admins, admin_indices = [], [], [], [], {}
+
+    for k, (start, response) in enumerate(chunks):
+        chunk_points, chunk_edges = response["matched_points"], response["edges"]
+        geometry = utils.decode_polyline6(response["shape"])
+        lo, hi = cuts[k] - start, cuts[k + 1] - start
+
+        first_edge, last_edge = 0, len(chunk_edges) - 1
+        if k > 0:
+            first_edge = next(
+                (pt["edge_index"] for pt in chunk_points[lo:] if pt.get("edge_index") is not None),
+                len(chunk_edges),
+            )
+        if k < len(chunks) - 1:
+            last_edge = next(
+                (pt["edge_index"] for pt in chunk_points[hi::-1] if pt.get("edge_index") is not None), -1
+            )
+
+        offset = len(edges) - first_edge
+        if (
+            edges
+            and first_edge <= last_edge
+            and edges[-1].get("id") is not None
+            and edges[-1].get("id") == chunk_edges[first_edge].get("id")
+        ):
+            # the previous chunk's last edge, which is complete, unlike this chunk's first one
+            first_edge += 1
+            offset -= 1
+
+        admin_map = []
+        for admin in response.get("admins", []):
+            key = tuple(sorted(admin.items()))
+            if key not in admin_indices:
+                admin_indices[key] = len(admins)
+                admins.append(admin)
+            admin_map.append(admin_indices[key])
+
+        for edge in chunk_edges[first_edge : last_edge + 1]:
+            coords = geometry[
+                edge.get("begin_shape_index", 0) : edge.get("end_shape_index", len(geometry) - 1) + 1
+            ]
+            if shape and coords and shape[-1] == coords[0]:
+                coords = coords[1:]
+                begin = len(shape) - 1
+            else:
+                begin = len(shape)
+            shape.extend(coords)
+
+            edge = dict(edge, begin_shape_index=begin, end_shape_index=len(shape) - 1)
+            end_node = edge.get("end_node")
+            if end_node and end_node.get("admin_index") is not None and admin_map:
+                edge["end_node"] = dict(end_node, admin_index=admin_map[end_node["admin_index"]])
+            edges.append(edge)
+
+        for point in chunk_points[lo:hi]:
+            if point.get("edge_index") is not None:
+                point = dict(point, edge_index=point["edge_index"] + offset)
+            points.append(point)
+
+    stitched.update(shape=utils.encode_polyline6(shape), edges=edges, matched_points=points)
+    if admins:
+        stitched["admins"] = admins
+    return stitched
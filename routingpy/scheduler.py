@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 GIS OPS UG
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+#
+"""
+:class:`PriorityScheduler` orders requests by priority class and deadline.
+"""
+import heapq
+import itertools
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional, Sequence
+
+from . import exceptions
+
+INTERACTIVE = "interactive"
+BATCH = "batch"
+
+_BATCH_ENDPOINTS = re.compile(r"matrix|/table/|sources_to_targets", re.IGNORECASE)
+
+
+def classify_by_endpoint(url: str) -> str:
+    """Classifies matrix requests as ``"batch"`` and all other requests as ``"interactive"``."""
+    return BATCH if _BATCH_ENDPOINTS.search(url) else INTERACTIVE
+
+
+class _Ticket(object):
+    __slots__ = ("priority", "granted", "cancelled")
+
+    def __init__(self, priority):
+        self.priority = priority
+        self.granted = False
+        self.cancelled = False
+
+
+class PriorityScheduler(object):
+    """
+    Schedules the requests of one or more routers sharing a backend: a request waits until a slot is free
+    and slots go to the highest priority class first, within a class to the earliest deadline. Each class may
+    have its own concurrency quota, so e.g. matrix tiles of a background job never occupy all slots.
+
+    Requests in flight are never interrupted, but queued batch requests are overtaken by interactive ones.
+    The class of a request is taken from :meth:`priority` if the calling thread entered it, otherwise from
+    ``classify``, which by default treats matrix requests as batch and everything else as interactive.
+
+    >>> from routingpy import Valhalla
+    >>> from routingpy.scheduler import PriorityScheduler
+    >>> scheduler = PriorityScheduler(max_concurrency=8, quotas={"batch": 6})
+    >>> router = Valhalla(scheduler=scheduler)
+    >>> with scheduler.priority("interactive", deadline=2):
+    ...     route = router.directions(locations, "auto")
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        quotas: Optional[Dict[str, int]] = None,
+        priorities: Sequence[str] = (INTERACTIVE, BATCH),
+        classify: Callable[[str], str] = classify_by_endpoint,
+    ):
+        """
+        :param max_concurrency: Maximum number of requests in flight over all classes. Default 8.
+        :type max_concurrency: int
+
+        :param quotas: Maximum number of requests in flight per class. Classes without quota may use
+            all ``max_concurrency`` slots.
+        :type quotas: dict
+
+        :param priorities: The priority classes, highest priority first. Default ("interactive", "batch").
+        :type priorities: list of str
+
+        :param classify: Returns the class of a request from its URL path, if not set by :meth:`priority`.
+        :type classify: callable
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1, got {}".format(max_concurrency))
+        unknown = set(quotas or {}) - set(priorities)
+        if unknown:
+            raise ValueError(
+                "Quotas for unknown priority classes: {}".format(", ".join(sorted(unknown)))
+            )
+
+        self.max_concurrency = max_concurrency
+        self.priorities = list(priorities)
+        self.quotas = {p: max_concurrency for p in self.priorities}
+        self.quotas.update(quotas or {})
+        self.classify = classify
+
+        self._queues = {p: [] for p in self.priorities}
+        self._in_flight = {p: 0 for p in self.priorities}
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._local = threading.local()
+
+    @contextmanager
+    def priority(self, priority: str, deadline: Optional[float] = None):
+        """
+        Sets the priority class of the requests the current thread sends within the context.
+
+        :param priority: One of the scheduler's priority classes.
+        :type priority: str
+
+        :param deadline: Seconds from entering the context until which requests need to be sent. Requests
+            with earlier deadlines are sent first within their class and queued requests whose deadline
+            passed raise :class:`routingpy.exceptions.Timeout`. A router call's own ``deadline`` applies
+            as well, the earlier one wins.
+        :type deadline: float
+        """
+        if priority not in self._queues:
+            raise ValueError("Unknown priority class {}".format(priority))
+
+        previous = getattr(self._local, "context", None)
+        self._local.context = (
+            priority,
+            float("inf") if deadline is None else time.monotonic() + deadline,
+        )
+        try:
+            yield self
+        finally:
+            self._local.context = previous
+
+    def queued(self, priority: str) -> int:
+        """The number of requests of a class waiting for a slot."""
+        with self._condition:
+            return sum(not ticket.cancelled for _, _, ticket in self._queues[priority])
+
+    def in_flight(self, priority: str) -> int:
+        """The number of requests of a class holding a slot."""
+        return self._in_flight[priority]
+
+    def acquire(self, url: str, timeout: Optional[float] = None):
+        """
+        Blocks until the request may be sent.
+
+        :param url: The request's URL path, passed to ``classify``.
+        :type url: str
+
+        :param timeout: Seconds the request may wait at most, e.g. the remaining budget of the call's deadline.
+            Combined with the deadline of :meth:`priority`, the earlier one is used for ordering and expiry.
+        :type timeout: float
+
+        :raises routingpy.exceptions.Timeout: if the request's deadline passed while it was queued.
+
+        :returns: The ticket to pass to :meth:`release`.
+        """
+        context = getattr(self._local, "context", None)
+        priority, deadline = context or (self.classify(url), float("inf"))
+        if priority not in self._queues:
+            raise ValueError("Unknown priority class {}".format(priority))
+        if timeout is not None:
+            deadline = min(deadline, time.monotonic() + timeout)
+
+        ticket = _Ticket(priority)
+        with self._condition:
+            heapq.heappush(self._queues[priority], (deadline, next(self._counter), ticket))
+            self._dispatch()
+
+            while not ticket.granted:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    ticket.cancelled = True
+                    raise exceptions.Timeout()
+                self._condition.wait(None if remaining == float("inf") else remaining)
+
+        return ticket
+
+    def release(self, ticket):
+        """Frees the slot of a sent request."""
+        with self._condition:
+            self._in_flight[ticket.priority] -= 1
+            self._dispatch()
+
+    def _dispatch(self):
+        """Grants free slots to queued requests in priority order. Needs to hold the condition."""
+        total = sum(self._in_flight.values())
+        for priority in self.priorities:
+            queue = self._queues[priority]
+            while (
+                queue
+                and total < self.max_concurrency
+                and self._in_flight[priority] < self.quotas[priority]
+            ):
+                _, _, ticket = heapq.heappop(queue)
+                if ticket.cancelled:
+                    continue
+                ticket.granted = True
+                self._in_flight[priority] += 1
+                total += 1
+
+        self._condition.notify_all()
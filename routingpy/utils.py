@@ -16,6 +16,7 @@
 #
 
 import logging
+import math
 
 logger = logging.getLogger("routingpy")
 
@@ -112,6 +113,113 @@ def decode_polyline6(polyline, is3d=False, order="lnglat"):
     return _decode(polyline, precision=6, is3d=is3d, order=order)
 
 
+def decode_polylines5(polylines, order="lnglat"):
+    """Decodes consecutive polylines with a precision of 5 into one line, e.g. the polylines of a route's
+    steps. A point which ends one polyline and starts the next is only kept once.
+
+    :param polylines: The encoded polylines, only the geometries.
+    :type polylines: list of str
+
+    :param order: Specifies the order in which the coordinates are returned.
+                  Options: latlng, lnglat. Defaults to 'lnglat'.
+    :type order: str
+
+    :returns: List of decoded coordinates with precision 5.
+    :rtype: list
+    """
+    if order not in ("lnglat", "latlng"):
+        raise ValueError(f"order must be either 'latlng' or 'lnglat', not {order}.")
+
+    # all polylines are decoded into the same list, without a list per polyline
+    coordinates, factor, last = [], 1e5, None
+    for expression in polylines:
+        index, lat, lng, length = 0, 0, 0, len(expression)
+        first = True
+        while index < length:
+            lat_change, index = _trans(expression, index)
+            lng_change, index = _trans(expression, index)
+            lat += lat_change
+            lng += lng_change
+            if first:
+                first = False
+                if (lat, lng) == last:
+                    continue
+            coordinates.append(
+                (lat / factor, lng / factor) if order == "latlng" else (lng / factor, lat / factor)
+            )
+        if length:
+            last = (lat, lng)
+
+    return coordinates
+
+
+def _encode_value(value, chunks):
+    """Appends the characters of a zigzag encoded integer in 5 bit chunks."""
+    value = ~(value << 1) if value < 0 else value << 1
+    while value >= 0x20:
+        chunks.append(chr((0x20 | (value & 0x1F)) + 63))
+        value >>= 5
+    chunks.append(chr(value + 63))
+
+
+def _round(value):
+    """Rounds half away from zero, like the reference implementation, instead of Python's half to even."""
+    return int(math.copysign(math.floor(math.fabs(value) + 0.5), value))
+
+
+def _encode(coordinates, precision=5, order="lnglat"):
+    if order not in ("lnglat", "latlng"):
+        raise ValueError(f"order must be either 'latlng' or 'lnglat', not {order}.")
+
+    factor = 10**precision
+    chunks = []
+    prev_lat, prev_lng = 0, 0
+    for coordinate in coordinates:
+        if order == "lnglat":
+            lng, lat = coordinate[0], coordinate[1]
+        else:
+            lat, lng = coordinate[0], coordinate[1]
+        lat, lng = _round(float(lat) * factor), _round(float(lng) * factor)
+
+        _encode_value(lat - prev_lat, chunks)
+        _encode_value(lng - prev_lng, chunks)
+        prev_lat, prev_lng = lat, lng
+
+    return "".join(chunks)
+
+
+def encode_polyline5(coordinates, order="lnglat"):
+    """Encodes coordinates as polyline string with a precision of 5.
+
+    :param coordinates: The 2D coordinates to encode.
+    :type coordinates: list of list of float
+
+    :param order: Specifies the order of the coordinates' components.
+                  Options: latlng, lnglat. Defaults to 'lnglat'.
+    :type order: str
+
+    :returns: The encoded polyline with precision 5.
+    :rtype: str
+    """
+    return _encode(coordinates, precision=5, order=order)
+
+
+def encode_polyline6(coordinates, order="lnglat"):
+    """Encodes coordinates as polyline string with a precision of 6.
+
+    :param coordinates: The 2D coordinates to encode.
+    :type coordinates: list of list of float
+
+    :param order: Specifies the order of the coordinates' components.
+                  Options: latlng, lnglat. Defaults to 'lnglat'.
+    :type order: str
+
+    :returns: The encoded polyline with precision 6.
+    :rtype: str
+    """
+    return _encode(coordinates, precision=6, order=order)
+
+
 def get_ordinal(number):
     """Produces an ordinal (1st, 2nd, 3rd, 4th) from a number"""
 
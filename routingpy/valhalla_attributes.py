@@ -309,7 +309,7 @@ class MatchedPoint:
         self._match_type = MatchType(point.get("type", "")) or None
         self._dist_along_edge: Optional[float] = point.get("distance_along_edge")
         self._dist_from_input: Optional[int] = point.get("distance_from_trace_point")
-        self._edge_index: Optional[int] = point.get("distance_along_edge")
+        self._edge_index: Optional[int] = point.get("edge_index")
         self._discontinuity: Optional[MatchDiscontinuity] = None
         if point.get("begin_route_discontinuity"):
             self._discontinuity = MatchDiscontinuity("begin")
@@ -378,8 +378,7 @@ class MatchedResults:
         # fill the edges
         for edge in response["edges"]:
             coords: List[List[float]] = geometry[
-                response.get("begin_shape_index")
-                or 0 : (response.get("end_shape_index") or (len(geometry) - 1)) + 1
+                edge.get("begin_shape_index", 0) : edge.get("end_shape_index", len(geometry) - 1) + 1
             ]
             self._edges.append(MatchedEdge(edge, coords))
 
@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 GIS OPS UG
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+#
+"""
+Minimal decoder for Valhalla's protobuf responses of ``format: "pbf"``, which only reads the fields of
+``/route``, ``/sources_to_targets`` and ``/isochrone`` responses that routingpy's results need. Field
+numbers are the ones of Valhalla's ``api.proto``, ``directions.proto``, ``matrix.proto`` and
+``isochrone.proto``. Unknown fields are skipped, so responses of newer Valhalla versions can be decoded.
+"""
+import struct
+import sys
+from array import array
+
+from . import exceptions
+
+# Field numbers of the Api message
+_API_DIRECTIONS = 3
+_API_MATRIX = 5
+_API_ISOCHRONE = 6
+
+# Varint, 64 bit, length delimited and 32 bit wire types
+_VARINT, _FIXED64, _LENGTH_DELIMITED, _FIXED32 = 0, 1, 2, 5
+
+# Valhalla's matrix cells without a path have a time and distance of kMaxCost = 99999999.9999f
+MAX_COST = struct.unpack("<f", struct.pack("<f", 99999999.9999))[0]
+
+
+def _read_varint(data, pos):
+    result = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _fields(data):
+    """Yields the field number, wire type and value of every field of a message. Varints are returned as
+    int, all other values as the memoryview of their bytes."""
+    pos, end = 0, len(data)
+    try:
+        while pos < end:
+            key, pos = _read_varint(data, pos)
+            number, wire_type = key >> 3, key & 7
+            if wire_type == _VARINT:
+                value, pos = _read_varint(data, pos)
+            elif wire_type == _LENGTH_DELIMITED:
+                length, pos = _read_varint(data, pos)
+                value = data[pos : pos + length]
+                pos += length
+            elif wire_type == _FIXED32:
+                value = data[pos : pos + 4]
+                pos += 4
+            elif wire_type == _FIXED64:
+                value = data[pos : pos + 8]
+                pos += 8
+            else:
+                raise exceptions.ProtobufParseError(
+                    "Unsupported wire type {} of field {}.".format(wire_type, number)
+                )
+            if pos > end:
+                raise exceptions.ProtobufParseError("Field {} exceeds the message.".format(number))
+            yield number, wire_type, value
+    except IndexError:
+        raise exceptions.ProtobufParseError("Truncated varint at byte {}.".format(pos))
+
+
+def _message(data, number):
+    """Returns the last occurrence of the embedded message with the field number, or an empty one."""
+    message = b""
+    for field, wire_type, value in _fields(data):
+        if field == number and wire_type == _LENGTH_DELIMITED:
+            message = value
+    return message
+
+
+def _varints(data):
+    values, pos, end = [], 0, len(data)
+    try:
+        while pos < end:
+            value, pos = _read_varint(data, pos)
+            values.append(value)
+    except IndexError:
+        raise exceptions.ProtobufParseError("Truncated packed varints.")
+    return values
+
+
+def _floats(data, typecode="f"):
+    """Decodes packed little endian floats ("f") or doubles ("d") at once."""
+    values = array(typecode)
+    if len(data) % values.itemsize:
+        raise exceptions.ProtobufParseError("Packed floats of invalid length {}.".format(len(data)))
+    values.frombytes(data)
+    if sys.byteorder == "big":  # pragma: no cover
+        values.byteswap()
+    return values
+
+
+def _add_repeated(values, wire_type, value, typecode):
+    """Adds a packed or unpacked repeated scalar field's value to the list."""
+    if wire_type == _LENGTH_DELIMITED:
+        values.extend(_varints(value) if typecode == "varint" else _floats(value, typecode))
+    elif wire_type == _VARINT:
+        values.append(value)
+    else:
+        values.extend(_floats(value, typecode))
+
+
+def _zigzag(value):
+    return (value >> 1) ^ -(value & 1)
+
+
+def decode_route(body):
+    """Decodes the legs of the first route of a ``/route`` response.
+
+    :param body: The protobuf response body.
+    :type body: bytes
+
+    :returns: The legs as dicts with the leg's ``shape`` as polyline6, and its summary's ``time`` in
+        seconds and ``length`` in the request's units.
+    :rtype: list of dict
+    """
+    data = memoryview(body)
+    directions = _message(data, _API_DIRECTIONS)
+    legs = []
+    for number, wire_type, route in _fields(directions):
+        # repeated DirectionsRoute routes = 1
+        if number != 1 or wire_type != _LENGTH_DELIMITED:
+            continue
+        for number, wire_type, leg in _fields(route):
+            # repeated DirectionsLeg legs = 1
+            if number == 1 and wire_type == _LENGTH_DELIMITED:
+                legs.append(_decode_leg(leg))
+        break
+
+    return legs
+
+
+def _decode_leg(data):
+    leg = {"shape": "", "time": 0.0, "length": 0.0}
+    for number, wire_type, value in _fields(data):
+        if number == 7 and wire_type == _LENGTH_DELIMITED:  # string shape = 7
+            leg["shape"] = bytes(value).decode("utf-8")
+        elif number == 5 and wire_type == _LENGTH_DELIMITED:  # Summary summary = 5
+            for field, field_type, summary_value in _fields(value):
+                if field == 1 and field_type == _FIXED32:  # float length = 1
+                    leg["length"] = struct.unpack("<f", summary_value)[0]
+                elif field == 2 and field_type == _FIXED64:  # double time = 2
+                    leg["time"] = struct.unpack("<d", summary_value)[0]
+    return leg
+
+
+def decode_matrix(body):
+    """Decodes the flat cell arrays of a ``/sources_to_targets`` response, ordered by source and then by
+    target.
+
+    :param body: The protobuf response body.
+    :type body: bytes
+
+    :returns: The cells' times in seconds and distances in meters. Cells without a path have the value
+        :data:`MAX_COST`.
+    :rtype: tuple of (array.array, list)
+    """
+    data = memoryview(body)
+    times, distances = array("f"), []
+    for number, wire_type, value in _fields(_message(data, _API_MATRIX)):
+        if number == 2:  # repeated uint32 distances = 2
+            _add_repeated(distances, wire_type, value, "varint")
+        elif number == 3:  # repeated float times = 3
+            _add_repeated(times, wire_type, value, "f")
+
+    return times, distances
+
+
+def decode_isochrone(body):
+    """Decodes the contours of an ``/isochrone`` response, which are ordered from the largest to the
+    smallest interval like the features of the GeoJSON response.
+
+    :param body: The protobuf response body.
+    :type body: bytes
+
+    :returns: The intervals as tuples of their value and contours. Each contour is a list of rings, the
+        first is the outer one, with [lon, lat] coordinates.
+    :rtype: list of tuple
+    """
+    data = memoryview(body)
+    intervals = []
+    for number, wire_type, interval in _fields(_message(data, _API_ISOCHRONE)):
+        # repeated Interval intervals = 1
+        if number != 1 or wire_type != _LENGTH_DELIMITED:
+            continue
+        value, contours = 0.0, []
+        for field, field_type, field_value in _fields(interval):
+            if field == 2 and field_type == _FIXED32:  # float metric_value = 2
+                value = struct.unpack("<f", field_value)[0]
+            elif field == 3 and field_type == _LENGTH_DELIMITED:  # repeated Contour contours = 3
+                contours.append(_decode_contour(field_value))
+        intervals.append((value, contours))
+
+    return intervals
+
+
+def _decode_contour(data):
+    rings = []
+    for number, wire_type, geometry in _fields(data):
+        # repeated Geometry geometries = 2
+        if number != 2 or wire_type != _LENGTH_DELIMITED:
+            continue
+        coords = []
+        for field, field_type, value in _fields(geometry):
+            if field == 1:  # repeated sint32 coords = 1 [packed=true], lng and lat times 1e6
+                _add_repeated(coords, field_type, value, "varint")
+        rings.append(
+            [
+                [_zigzag(coords[i]) / 1e6, _zigzag(coords[i + 1]) / 1e6]
+                for i in range(0, len(coords) - 1, 2)
+            ]
+        )
+    return rings
@@ -16,15 +16,23 @@
 #
 """Tests for client module."""
 
+import inspect
+import multiprocessing
+import threading
 import time
+import unittest
+from unittest import mock
 
 import requests
 import responses
 
 import routingpy
 import tests as _test
-from routingpy import client_default
+from routingpy import Valhalla, client_default
+from routingpy.cache import NegativeCache
+from routingpy.client_base import Deadline
 from routingpy.routers import options
+from tests.test_helper import *
 
 
 class ClientMock(client_default.Client):
@@ -189,3 +197,195 @@ class BaseTest(_test.TestCase):
 
         assert isinstance(self.client.req, requests.PreparedRequest)
         self.assertEqual("https://httpbin.org/routes?a=b", self.client.req.url)
+
+    @unittest.skipUnless(
+        "fork" in multiprocessing.get_all_start_methods(), "needs the fork start method"
+    )
+    @responses.activate
+    def test_session_after_fork(self):
+        responses.add(
+            responses.GET,
+            "https://httpbin.org/routes",
+            json={"a": "b"},
+            status=200,
+            content_type="application/json",
+        )
+        parent_session = self.client._session
+        context = multiprocessing.get_context("fork")
+        queue = context.Queue()
+
+        def child():
+            response = self.client.directions(url="routes")
+            queue.put((self.client._session is not parent_session, response))
+
+        process = context.Process(target=child)
+        process.start()
+        process.join()
+
+        self.assertEqual((True, {"a": "b"}), queue.get(timeout=10))
+        self.assertIs(parent_session, self.client._session)
+
+    def test_session_created_once(self):
+        client = ClientMock("https://httpbin.org")
+        sessions = []
+        with mock.patch.object(
+            client, "_new_session", side_effect=lambda: time.sleep(0.01) or requests.Session()
+        ):
+            threads = [
+                threading.Thread(target=lambda: sessions.append(client._session)) for _ in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(1, len(set(map(id, sessions))))
+
+    @responses.activate
+    def test_close(self):
+        responses.add(
+            responses.GET,
+            "https://httpbin.org/routes",
+            json={},
+            status=200,
+            content_type="application/json",
+        )
+        with ClientMock("https://httpbin.org") as client:
+            session = client._session
+            client.directions(url="/routes")
+        self.assertIsNone(client._requests_session)
+
+        # the closed client opens a new session if used again
+        client.directions(url="/routes")
+        self.assertIsNot(session, client._session)
+        self.assertEqual(2, len(responses.calls))
+
+    @responses.activate
+    def test_negative_cache(self):
+        responses.add(
+            responses.POST,
+            "https://httpbin.org/post",
+            json={"error": "no route"},
+            status=400,
+            content_type="application/json",
+        )
+        responses.add(
+            responses.POST,
+            "https://httpbin.org/other",
+            json={"error": "bad gateway"},
+            status=502,
+            content_type="application/json",
+        )
+
+        negative_cache = NegativeCache(ttl=60)
+        client = ClientMock(base_url="https://httpbin.org", negative_cache=negative_cache)
+
+        for _ in range(3):
+            with self.assertRaises(routingpy.exceptions.RouterApiError):
+                client.directions(url="/post", post_params={"b": 1, "a": 2})
+        self.assertEqual(1, len(responses.calls))
+        self.assertEqual(2, negative_cache.avoided)
+
+        # different request body
+        with self.assertRaises(routingpy.exceptions.RouterApiError):
+            client.directions(url="/post", post_params={"a": 1})
+        self.assertEqual(2, len(responses.calls))
+
+        client.skip_api_error = True
+        self.assertIsNone(client.directions(url="/post", post_params={"a": 2, "b": 1}))
+        self.assertEqual(2, len(responses.calls))
+
+        # server errors aren't cached
+        client = ClientMock(
+            base_url="https://httpbin.org", negative_cache=negative_cache, retry_timeout=1
+        )
+        for _ in range(2):
+            with self.assertRaises(routingpy.exceptions.RouterServerError):
+                client.directions(url="/other", post_params={})
+        self.assertEqual(4, len(responses.calls))
+
+    def test_deadline_timeout(self):
+        deadline = Deadline(connect=0.5)
+        self.assertEqual((0.5, 10), deadline.start().timeout(10))
+        self.assertEqual((0.5, 4), deadline.start().timeout((3, 4)))
+        self.assertIsNone(deadline.start().remaining())
+
+        started = Deadline(total=2, connect=5, read=1).start()
+        connect, read = started.timeout(10)
+        self.assertLessEqual(connect, 2)
+        self.assertEqual(1, read)
+        self.assertIs(started, started.start())
+        self.assertEqual(3, Deadline.of(3).total)
+
+    @responses.activate
+    def test_deadline_attempt_timeouts(self):
+        responses.add(
+            responses.POST,
+            "https://httpbin.org/post",
+            json=self.params,
+            status=200,
+            content_type="application/json",
+        )
+        client = ClientMock(base_url="https://httpbin.org", timeout=30)
+
+        client.directions(url="/post", post_params=self.params, deadline=Deadline(connect=0.5, read=2))
+        self.assertEqual((0.5, 2), responses.calls[0].request.req_kwargs["timeout"])
+
+        client.directions(url="/post", post_params=self.params, deadline=5)
+        connect, read = responses.calls[1].request.req_kwargs["timeout"]
+        self.assertTrue(4 < connect == read <= 5)
+
+        # the client's timeout is left untouched
+        client.directions(url="/post", post_params=self.params)
+        self.assertEqual(30, responses.calls[2].request.req_kwargs["timeout"])
+
+    @responses.activate
+    def test_deadline_covers_retries(self):
+        responses.add(
+            responses.POST,
+            "https://httpbin.org/post",
+            json=self.params,
+            status=503,
+            content_type="application/json",
+        )
+        client = ClientMock(base_url="https://httpbin.org", retry_timeout=60)
+
+        start = time.monotonic()
+        with self.assertRaises(routingpy.exceptions.Timeout):
+            client.directions(url="/post", post_params=self.params, deadline=1)
+
+        # no backoff sleep overshoots the deadline
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertGreaterEqual(len(responses.calls), 1)
+
+    def test_deadline_parameter_last(self):
+        # deadline is appended, so it doesn't shift existing positional arguments
+        for name in routingpy.routers._ROUTER_MODULES:
+            router = getattr(routingpy.routers, name)
+            for method in (
+                "directions",
+                "isochrones",
+                "matrix",
+                "expansion",
+                "trace_attributes",
+                "raster",
+            ):
+                if not hasattr(router, method):
+                    continue
+                parameters = inspect.signature(getattr(router, method)).parameters.values()
+                positional = [p.name for p in parameters if p.kind == p.POSITIONAL_OR_KEYWORD]
+                if "deadline" in positional:
+                    self.assertEqual("deadline", positional[-1], "{}.{}".format(name, method))
+
+    @responses.activate
+    def test_router_deadline(self):
+        responses.add(
+            responses.POST,
+            "https://valhalla.test/route",
+            json=ENDPOINTS_RESPONSES["valhalla"]["directions"],
+            status=200,
+            content_type="application/json",
+        )
+        router = Valhalla("https://valhalla.test", timeout=60)
+        router.directions(**ENDPOINTS_QUERIES["valhalla"]["directions"], deadline=Deadline(read=3))
+        self.assertEqual((60, 3), responses.calls[0].request.req_kwargs["timeout"])
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 GIS OPS UG
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+#
+"""Tests for the batch module."""
+
+import os
+import re
+import tempfile
+import time
+
+import responses
+
+import tests as _test
+from routingpy import OSRM
+from routingpy.batch import BatchResult, Journal, batch
+from routingpy.direction import Direction
+from routingpy.exceptions import RouterApiError
+from tests.test_helper import *
+
+
+class BatchTest(_test.TestCase):
+    def setUp(self):
+        self.router = OSRM("https://osrm.test")
+
+    @responses.activate
+    def test_ordered_results_and_errors(self):
+        responses.add(
+            responses.GET,
+            re.compile(r"https://osrm.test/route/v1/driving/0,0;.*"),
+            status=400,
+            json={"code": "NoRoute"},
+            content_type="application/json",
+        )
+        responses.add(
+            responses.GET,
+            re.compile(r"https://osrm.test/route/v1/driving/.*"),
+            status=200,
+            json=ENDPOINTS_RESPONSES["osrm"]["directions_geojson"],
+            content_type="application/json",
+        )
+
+        requests = [{"locations": PARAM_LINE, "geometries": "geojson"} for _ in range(10)]
+        requests[3] = {"locations": [[0, 0], [1, 1]], "geometries": "geojson"}
+
+        results = list(batch(self.router.directions, requests, max_workers=3))
+
+        self.assertEqual(list(range(10)), [r.index for r in results])
+        for res in results:
+            self.assertIsInstance(res, BatchResult)
+            if res.index == 3:
+                self.assertFalse(res.ok)
+                self.assertIsInstance(res.error, RouterApiError)
+                self.assertIsNone(res.result)
+            else:
+                self.assertTrue(res.ok)
+                self.assertIsInstance(res.result, Direction)
+
+    def test_unordered_completion(self):
+        def method(delay):
+            time.sleep(delay)
+            return delay
+
+        results = list(batch(method, [{"delay": 0.2}, {"delay": 0}], max_workers=2, ordered=False))
+
+        self.assertEqual([1, 0], [r.index for r in results])
+        self.assertEqual([0, 0.2], [r.result for r in results])
+
+    def test_backpressure(self):
+        consumed = []
+
+        def requests():
+            for i in range(20):
+                consumed.append(i)
+                yield {"value": i}
+
+        def method(value):
+            return value
+
+        gen = batch(method, requests(), max_workers=2, max_pending=4)
+        first = next(gen)
+
+        self.assertEqual(0, first.index)
+        self.assertLessEqual(len(consumed), 5)
+        self.assertEqual(list(range(1, 20)), [r.result for r in gen])
+
+    def test_unexpected_errors_propagate(self):
+        def method():
+            raise KeyError("bug")
+
+        with self.assertRaises(KeyError):
+            list(batch(method, [{}]))
+
+
+class JournalTest(_test.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "batch.journal")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_resume_skips_completed(self):
+        calls = []
+
+        def method(value):
+            calls.append(value)
+            if value == 2:
+                raise RouterApiError(400, "no route")
+            return value * 10
+
+        requests = [{"value": i} for i in range(4)]
+        with Journal(self.path) as journal:
+            list(batch(method, requests, max_workers=2, journal=journal))
+            self.assertEqual(3, len(journal))
+
+        calls.clear()
+        with Journal(self.path) as journal:
+            results = list(batch(method, requests, max_workers=2, journal=journal))
+
+        # Only the failed request is repeated
+        self.assertEqual([2], calls)
+        self.assertEqual([0, 10, None, 30], [r.result for r in results])
+
+    def test_truncated_record(self):
+        with Journal(self.path) as journal:
+            journal.record({"value": 1}, Direction(geometry=PARAM_LINE, duration=1, distance=2))
+            journal.record({"value": 2}, Direction(geometry=PARAM_LINE, duration=3, distance=4))
+
+        # Simulate a crash in the middle of writing the last record
+        size = os.path.getsize(self.path)
+        os.truncate(self.path, size - 5)
+
+        with Journal(self.path) as journal:
+            self.assertEqual(1, len(journal))
+            self.assertEqual(1, journal.get({"value": 1}).duration)
+            self.assertNotIn({"value": 2}, journal)
+            journal.record({"value": 3}, 3)
+
+        with Journal(self.path) as journal:
+            self.assertEqual(2, len(journal))
+            self.assertEqual(3, journal.get({"value": 3}))
@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 GIS OPS UG
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+#
+"""Tests for the cache module."""
+
+import json
+from unittest import mock
+
+import responses
+
+import tests as _test
+from routingpy import Valhalla
+from routingpy.batch import batch
+from routingpy.cache import (
+    ApproximateCache,
+    IsochroneCache,
+    MatrixCache,
+    NegativeCache,
+    _geohash,
+)
+from routingpy.client_default import Client
+from routingpy.exceptions import RouterApiError
+from routingpy.isochrone import Isochrones
+from routingpy.matrix import Matrix
+from tests.test_helper import *
+
+
+class FakeMatrixRouter:
+    """Returns the sum of the locations' x coordinates as duration and their difference as distance."""
+
+    def __init__(self):
+        self.client = Client("https://fake.router")
+        self.calls = []
+
+    def matrix(self, locations, profile, sources=None, destinations=None, **kwargs):
+        self.calls.append(
+            ([locations[s] for s in sources], [locations[d] for d in destinations], kwargs)
+        )
+        return Matrix(
+            durations=[[locations[s][0] + locations[d][0] for d in destinations] for s in sources],
+            distances=[[locations[s][0] - locations[d][0] for d in destinations] for s in sources],
+        )
+
+
+def expected(sources, destinations):
+    return (
+        [[a + b for b in destinations] for a in sources],
+        [[a - b for b in destinations] for a in sources],
+    )
+
+
+class MatrixCacheTest(_test.TestCase):
+    def setUp(self):
+        self.router = FakeMatrixRouter()
+        self.cache = MatrixCache(self.router)
+
+    def test_only_missing_cells(self):
+        locations = [[1, 0], [2, 0], [3, 0]]
+        matrix = self.cache.matrix(locations, "car")
+
+        self.assertEqual(1, len(self.router.calls))
+        self.assertEqual(expected([1, 2, 3], [1, 2, 3]), (matrix.durations, matrix.distances))
+        self.assertEqual(9, len(self.cache))
+
+        matrix = self.cache.matrix(locations + [[4, 0]], "car")
+
+        # one request for the new column of the cached rows, one for the new row
+        self.assertEqual(3, len(self.router.calls))
+        self.assertEqual(([[1, 0], [2, 0], [3, 0]], [[4, 0]], {}), self.router.calls[1])
+        self.assertEqual(([[4, 0]], [[1, 0], [2, 0], [3, 0], [4, 0]], {}), self.router.calls[2])
+        self.assertEqual(expected([1, 2, 3, 4], [1, 2, 3, 4]), (matrix.durations, matrix.distances))
+        self.assertEqual(9, self.cache.hits)
+        self.assertEqual(16, self.cache.misses)
+
+    def test_concurrent_stats(self):
+        locations = [[1, 0], [2, 0], [3, 0]]
+        requests = [{"locations": locations, "profile": "car"}] * 50
+        results = list(batch(self.cache.matrix, requests, max_workers=8))
+
+        self.assertTrue(all(result.ok for result in results))
+        self.assertEqual(50 * 9, self.cache.hits + self.cache.misses)
+
+    def test_sources_destinations(self):
+        locations = [[1, 0], [2, 0], [3, 0]]
+        self.cache.matrix(locations, "car", sources=[0], destinations=[1, 2])
+        matrix = self.cache.matrix([[3, 0], [1, 0]], "car", sources=[1], destinations=[0])
+
+        self.assertEqual(1, len(self.router.calls))
+        self.assertEqual([[4]], matrix.durations)
+
+    def test_key(self):
+        locations = [[1.0000001, 0], [2, 0]]
+        self.cache.matrix(locations, "car")
+        self.cache.matrix([[1, 0], [2, 0]], "car")
+        self.assertEqual(1, len(self.router.calls))
+
+        self.cache.matrix(locations, "bike")
+        self.cache.matrix(locations, "car", units="mi")
+        self.assertEqual(3, len(self.router.calls))
+        self.assertEqual({"units": "mi"}, self.router.calls[2][2])
+
+    def test_maxsize(self):
+        cache = MatrixCache(self.router, maxsize=4)
+        cache.matrix([[1, 0], [2, 0], [3, 0]], "car")
+        self.assertEqual(4, len(cache))
+
+
+class NegativeCacheTest(_test.TestCase):
+    def test_ttl(self):
+        cache = NegativeCache(ttl=10)
+        key = cache.key("https://fake.router", "/route", {"b": 1, "a": 2})
+        self.assertEqual(key, cache.key("https://fake.router", "/route", [("a", 2), ("b", 1)]))
+
+        with mock.patch("routingpy.cache.time.monotonic", return_value=100):
+            cache.add(key, RouterApiError(400, "no route"))
+            error = cache.get(key)
+        self.assertIsInstance(error, RouterApiError)
+        self.assertEqual("no route", error.message)
+        self.assertEqual(1, cache.avoided)
+
+        with mock.patch("routingpy.cache.time.monotonic", return_value=111):
+            self.assertIsNone(cache.get(key))
+        self.assertEqual(1, cache.avoided)
+
+    def test_statuses(self):
+        cache = NegativeCache(statuses=[404])
+        cache.add("a", RouterApiError(400, "bad request"))
+        cache.add("b", RouterApiError(404, "not found"))
+        self.assertIsNone(cache.get("a"))
+        self.assertIsNotNone(cache.get("b"))
+
+
+class FakeDirectionsRouter:
+    def __init__(self):
+        self.client = Client("https://fake.router")
+        self.calls = 0
+
+    def directions(self, locations, profile, **kwargs):
+        self.calls += 1
+        return locations
+
+    def matrix(self, locations, profile, **kwargs):
+        self.calls += 1
+        return Matrix(durations=[[0] * len(locations)] * len(locations))
+
+
+class ApproximateCacheTest(_test.TestCase):
+    def setUp(self):
+        self.router = FakeDirectionsRouter()
+
+    def test_decimal_grid(self):
+        cache = ApproximateCache(self.router, precision=3)
+        first = cache.directions([[8.68864, 49.42057], [8.68091, 49.41577]], "car")
+        second = cache.directions([[8.68869, 49.42061], [8.68091, 49.41577]], "car")
+        cache.directions([[8.68864, 49.42057], [8.68091, 49.41577]], "bike")
+        cache.matrix([[8.68864, 49.42057], [8.68091, 49.41577]], "car")
+
+        self.assertIs(first, second)
+        self.assertEqual(3, self.router.calls)
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(0.25, cache.hit_rate)
+        self.assertAlmostEqual(5.7, cache.max_error, places=1)
+
+    def test_precision_per_profile(self):
+        cache = ApproximateCache(self.router, precision={"car": 2})
+        cache.directions([[8.681, 49.421], [8.68, 49.41]], "car")
+        cache.directions([[8.682, 49.422], [8.68, 49.41]], "car")
+        cache.directions([[8.681, 49.421], [8.68, 49.41]], "foot")
+        cache.directions([[8.682, 49.422], [8.68, 49.41]], "foot")
+
+        self.assertEqual(3, self.router.calls)
+
+    def test_geohash_grid(self):
+        self.assertEqual("u4pruydqqvj", _geohash(10.40744, 57.64911, 11))
+
+        cache = ApproximateCache(self.router, precision=6, grid="geohash")
+        cache.directions([[8.68864, 49.42057], [8.68091, 49.41577]], "car")
+        cache.directions([[8.68870, 49.42060], [8.68091, 49.41577]], "car")
+        self.assertEqual(1, self.router.calls)
+
+        with self.assertRaises(ValueError):
+            ApproximateCache(self.router, grid="h3")
+
+
+class IsochroneCacheTest(_test.TestCase):
+    @responses.activate
+    def test_unsorted_intervals(self):
+        def request_callback(request):
+            # Valhalla returns the largest contour first, its geometry here is tagged with the minutes
+            minutes = sorted((c["time"] for c in json.loads(request.body)["contours"]), reverse=True)
+            features = [
+                {"geometry": {"type": "LineString", "coordinates": [[m, 0]]}, "properties": {}}
+                for m in minutes
+            ]
+            return 200, {}, json.dumps({"features": features})
+
+        responses.add_callback(
+            responses.POST,
+            "https://valhalla.test/isochrone",
+            callback=request_callback,
+            content_type="application/json",
+        )
+        cache = IsochroneCache(Valhalla("https://valhalla.test"))
+
+        isochrones = cache.isochrones(PARAM_POINT, "auto", [1800, 600])
+        self.assertEqual([1800, 600], [iso.interval for iso in isochrones])
+        self.assertEqual([[[30, 0]], [[10, 0]]], [iso.geometry for iso in isochrones])
+
+        isochrones = cache.isochrones(PARAM_POINT, "auto", [600])
+        self.assertEqual([[10, 0]], isochrones[0].geometry)
+        self.assertEqual(1, len(responses.calls))
+
+    @responses.activate
+    def test_subset_and_missing_intervals(self):
+        feature = ENDPOINTS_RESPONSES["valhalla"]["isochrones"]["features"][0]
+
+        def request_callback(request):
+            contours = json.loads(request.body)["contours"]
+            return 200, {}, json.dumps({"features": [feature] * len(contours)})
+
+        responses.add_callback(
+            responses.POST,
+            "https://valhalla.test/isochrone",
+            callback=request_callback,
+            content_type="application/json",
+        )
+        cache = IsochroneCache(Valhalla("https://valhalla.test"))
+
+        isochrones = cache.isochrones(PARAM_POINT, "auto", [600, 1200])
+        self.assertIsInstance(isochrones, Isochrones)
+        self.assertEqual([600, 1200], [iso.interval for iso in isochrones])
+        self.assertEqual(1, len(responses.calls))
+
+        isochrones = cache.isochrones(PARAM_POINT, "auto", [1200])
+        self.assertEqual([1200], [iso.interval for iso in isochrones])
+        self.assertEqual(1, len(responses.calls))
+
+        # different options aren't served from the cache
+        cache.isochrones(PARAM_POINT, "auto", [600], denoise=0.5)
+        self.assertEqual(2, len(responses.calls))
+
+        isochrones = cache.isochrones(PARAM_POINT, "auto", [1800, 600, 2400])
+        self.assertEqual(3, len(responses.calls))
+        requested = json.loads(responses.calls[2].request.body)["contours"]
+        self.assertEqual([{"time": 30.0}, {"time": 40.0}], requested)
+        self.assertEqual([1800, 600, 2400], [iso.interval for iso in isochrones])
+        self.assertEqual(2, cache.hits)
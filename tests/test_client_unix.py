@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 GIS OPS UG
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+#
+"""Tests for the Unix domain socket client."""
+
+import json
+import os
+import socketserver
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler
+
+import tests as _test
+from routingpy import OSRM, Valhalla
+from routingpy.client_unix import UnixSocketClient
+from routingpy.direction import Direction
+from routingpy.exceptions import RouterApiError
+from tests.test_helper import *
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.requests.append(("GET", self.path, None))
+        self._respond()
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.requests.append(("POST", self.path, json.loads(body)))
+        self._respond()
+
+    def _respond(self):
+        status, response = self.server.responses.get(self.path.split("?")[0], (404, {"error": "nope"}))
+        body = json.dumps(response).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self):
+        return "unix"
+
+    def log_message(self, *args):
+        pass
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+@unittest.skipUnless(hasattr(socketserver, "UnixStreamServer"), "Unix domain sockets not supported")
+class UnixSocketClientTest(_test.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.socket_path = os.path.join(self.tmpdir.name, "router.sock")
+        self.server = _UnixServer(self.socket_path, _Handler)
+        self.server.requests = []
+        self.server.responses = {}
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        self.tmpdir.cleanup()
+
+    def test_osrm_directions(self):
+        self.server.responses["/route/v1/driving/8.688641,49.420577;8.680916,49.415776"] = (
+            200,
+            ENDPOINTS_RESPONSES["osrm"]["directions_geojson"],
+        )
+        router = OSRM(base_url="unix://" + self.socket_path, client=UnixSocketClient)
+
+        for _ in range(2):
+            direction = router.directions(PARAM_LINE, "driving", geometries="geojson")
+            self.assertIsInstance(direction, Direction)
+
+        self.assertEqual(2, len(self.server.requests))
+        self.assertEqual("GET", self.server.requests[0][0])
+        self.assertTrue(self.server.requests[0][1].startswith("/route/v1/driving/"))
+
+    def test_valhalla_post_with_prefix(self):
+        self.server.responses["/valhalla/route"] = (200, ENDPOINTS_RESPONSES["valhalla"]["directions"])
+        base_url = "http+unix://{}/valhalla".format(self.socket_path.replace("/", "%2F"))
+        router = Valhalla(base_url=base_url, client=UnixSocketClient)
+
+        direction = router.directions(PARAM_LINE, "auto")
+
+        self.assertIsInstance(direction, Direction)
+        self.assertEqual("POST", self.server.requests[0][0])
+        self.assertEqual("auto", self.server.requests[0][2]["costing"])
+        self.assertEqual(self.socket_path, router.client.socket_path)
+
+    def test_close(self):
+        self.server.responses["/route/v1/driving/8.688641,49.420577;8.680916,49.415776"] = (
+            200,
+            ENDPOINTS_RESPONSES["osrm"]["directions_geojson"],
+        )
+        router = OSRM(base_url="unix://" + self.socket_path, client=UnixSocketClient)
+
+        with router.client:
+            router.directions(PARAM_LINE, "driving", geometries="geojson")
+
+        # the new session mounts the adapter for the socket again
+        direction = router.directions(PARAM_LINE, "driving", geometries="geojson")
+        self.assertIsInstance(direction, Direction)
+        self.assertEqual(2, len(self.server.requests))
+
+    def test_api_error(self):
+        router = OSRM(base_url="unix://" + self.socket_path, client=UnixSocketClient)
+        with self.assertRaises(RouterApiError):
+            router.directions(PARAM_LINE, "driving")
+
+    def test_invalid_url(self):
+        with self.assertRaises(ValueError):
+            UnixSocketClient("http://localhost:5000")
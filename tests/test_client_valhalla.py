@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 GIS OPS UG
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+#
+"""Tests for the in-process Valhalla client."""
+
+import json
+
+import tests as _test
+from routingpy import Valhalla
+from routingpy.client_valhalla import ValhallaActorClient
+from routingpy.direction import Direction
+from routingpy.exceptions import RouterApiError, RouterServerError
+from routingpy.expansion import Expansions
+from routingpy.isochrone import Isochrones
+from routingpy.matrix import Matrix
+from routingpy.parse_pool import ParsePool
+from routingpy.valhalla_attributes import MatchedResults
+from tests.test_helper import *
+
+
+class FakeActor:
+    """Mimics valhalla.Actor, which takes and returns JSON strings."""
+
+    def __init__(self, error=None):
+        self.error = error
+        self.requests = []
+
+    def _respond(self, name, request):
+        self.requests.append((name, json.loads(request)))
+        if self.error is not None:
+            raise RuntimeError(json.dumps(self.error))
+
+        return json.dumps(ENDPOINTS_RESPONSES["valhalla"][name])
+
+    def route(self, request):
+        return self._respond("directions", request)
+
+    def matrix(self, request):
+        return self._respond("matrix", request)
+
+    def isochrone(self, request):
+        return self._respond("isochrones", request)
+
+    def expansion(self, request):
+        return self._respond("expansion", request)
+
+    def trace_attributes(self, request):
+        return self._respond("trace_attributes", request)
+
+
+class ValhallaActorClientTest(_test.TestCase):
+    def setUp(self):
+        self.actor = FakeActor()
+        self.router = Valhalla(client=ValhallaActorClient, actor=self.actor)
+
+    def test_endpoints(self):
+        cases = [
+            ("directions", self.router.directions, Direction),
+            ("matrix", self.router.matrix, Matrix),
+            ("isochrones", self.router.isochrones, Isochrones),
+            ("expansion", self.router.expansion, Expansions),
+            ("trace_attributes", self.router.trace_attributes, MatchedResults),
+        ]
+        for name, method, result_type in cases:
+            result = method(**ENDPOINTS_QUERIES["valhalla"][name])
+
+            self.assertIsInstance(result, result_type)
+            self.assertEqual(name, self.actor.requests[-1][0])
+            self.assertEqual(ENDPOINTS_EXPECTED["valhalla"][name], self.actor.requests[-1][1])
+
+        self.assertIsInstance(
+            self.router.directions(**ENDPOINTS_QUERIES["valhalla"]["directions"]).raw, dict
+        )
+
+    def test_parse_pool(self):
+        query = ENDPOINTS_QUERIES["valhalla"]["expansion"]
+        with ParsePool(max_workers=1) as pool:
+            router = Valhalla(client=ValhallaActorClient, actor=self.actor, parse_pool=pool)
+            expansion = router.expansion(**query)
+
+        self.assertIsInstance(expansion, Expansions)
+        self.assertIsNone(expansion.raw)
+
+    def test_errors(self):
+        self.actor.error = {"error_code": 171, "error": "No suitable edges", "status_code": 400}
+        with self.assertRaises(RouterApiError) as e:
+            self.router.directions(**ENDPOINTS_QUERIES["valhalla"]["directions"])
+        self.assertEqual(400, e.exception.status)
+
+        self.actor.error = {"error_code": 499, "error": "Unknown", "status_code": 500}
+        with self.assertRaises(RouterServerError):
+            self.router.matrix(**ENDPOINTS_QUERIES["valhalla"]["matrix"])
+
+        router = Valhalla(client=ValhallaActorClient, actor=self.actor, skip_api_error=True)
+        self.actor.error = {"error_code": 171, "error": "No suitable edges", "status_code": 400}
+        with self.assertWarns(UserWarning):
+            direction = router.directions(**ENDPOINTS_QUERIES["valhalla"]["directions"])
+        self.assertIsNone(direction.geometry)
+
+    def test_unsupported_endpoint(self):
+        with self.assertRaises(RouterApiError):
+            self.router.client._request("/height", post_params={})
+
+    def test_dry_run(self):
+        self.router.directions(**ENDPOINTS_QUERIES["valhalla"]["directions"], dry_run=True)
+        self.assertEqual([], self.actor.requests)
@@ -16,6 +16,11 @@
 #
 """Tests for convert module."""
 
+import array
+import importlib.util
+import unittest
+from random import Random
+
 import tests as _test
 from routingpy import convert
 
@@ -31,3 +36,82 @@ class UtilsTest(_test.TestCase):  # noqa: E741
         for f in falses:
             with self.assertRaises(TypeError):
                 convert.delimit_list(f)
+
+    def test_format_locations(self):
+        random = Random(42)
+        values = [0, -0.0, 1, 8.0, 1e-7, -5e-7, 4.9999995e-5, 0.1234565, 180, -179.9999999, 1e17]
+        locations = [
+            [random.choice(values + [random.uniform(-180, 180)]) for _ in range(2)] for _ in range(500)
+        ]
+
+        for order in ("lnglat", "latlng"):
+            expected = ";".join(
+                ",".join(
+                    convert.format_float(c)
+                    for c in (reversed(location) if order == "latlng" else location)
+                )
+                for location in locations
+            )
+            self.assertEqual(expected, convert.format_locations(locations, order=order))
+
+        self.assertEqual(
+            "8.68|49.42%8.6809|49.4158",
+            convert.format_locations(
+                ((8.68, 49.42), (8.6809, 49.4158)), delimiter="%", coordinate_delimiter="|"
+            ),
+        )
+
+    def test_format_locations_order_error(self):
+        with self.assertRaises(ValueError):
+            convert.format_locations([[8.68, 49.42]], order="xy")
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "NumPy is not installed")
+    def test_format_locations_numpy(self):
+        import numpy as np
+
+        locations = np.random.default_rng(42).uniform(-180, 180, (1000, 2)).round(7)
+        expected = ";".join(
+            ",".join(convert.format_float(c) for c in location) for location in locations.tolist()
+        )
+
+        self.assertEqual(expected, convert.format_locations(locations))
+        self.assertEqual(expected, convert.format_locations(locations.tolist()))
+
+    def test_is_location(self):
+        self.assertTrue(convert.is_location([8.68, 49.42]))
+        self.assertTrue(convert.is_location((8, 49)))
+        self.assertFalse(convert.is_location([[8.68, 49.42]]))
+        self.assertFalse(convert.is_location("8.68,49.42"))
+        self.assertFalse(convert.is_location([]))
+        self.assertFalse(
+            convert.is_location(memoryview(array.array("d", [8.68, 49.42])).cast("B").cast("d", [1, 2]))
+        )
+
+    def test_is_empty(self):
+        self.assertTrue(convert.is_empty(None))
+        self.assertTrue(convert.is_empty([]))
+        self.assertTrue(convert.is_empty(array.array("l")))
+        self.assertFalse(convert.is_empty([0]))
+
+    def test_buffer_locations(self):
+        coordinates = array.array("d", [8.68, 49.42, 8.6809, 49.4158, 8.7, 49.5])
+        locations = convert.as_locations(memoryview(coordinates).cast("B").cast("d", [3, 2]))
+
+        self.assertEqual(3, len(locations))
+        self.assertEqual([8.6809, 49.4158], list(locations[1]))
+        self.assertEqual([8.7, 49.5], list(locations[-1]))
+        self.assertEqual([[8.68, 49.42], [8.7, 49.5]], [list(location) for location in locations[::2]])
+        self.assertTrue(convert.is_location(locations[0]))
+        with self.assertRaises(IndexError):
+            locations[3]
+
+        self.assertEqual("8.68,49.42;8.6809,49.4158;8.7,49.5", convert.format_locations(locations))
+        self.assertEqual(
+            [[8.68, 49.42], [8.6809, 49.4158], [8.7, 49.5]], convert.locations_to_list(locations)
+        )
+        self.assertEqual([1, 2], convert.to_list(array.array("l", [1, 2])))
+
+    def test_list_locations_not_copied(self):
+        locations = [[8.68, 49.42]]
+        self.assertIs(locations, convert.as_locations(locations))
+        self.assertIs(locations[0], convert.locations_to_list(locations)[0])
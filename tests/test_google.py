@@ -64,6 +64,28 @@ class GoogleTest(_test.TestCase):
         self.assertIsInstance(routes[0].duration, int)
         self.assertIsInstance(routes[0].raw, dict)
 
+    @responses.activate
+    def test_directions_overview_geometry(self):
+        query = deepcopy(ENDPOINTS_QUERIES[self.name]["directions"])
+
+        responses.add(
+            responses.GET,
+            "https://maps.googleapis.com/maps/api/directions/json",
+            status=200,
+            json=ENDPOINTS_RESPONSES[self.name]["directions"],
+            content_type="application/json",
+        )
+
+        routes = self.client.directions(**query, geometry_detail="overview")
+        self.assertEqual([(8.68864, 49.42058), (8.68092, 49.41578)], routes[0].geometry)
+
+        query["alternatives"] = False
+        route = self.client.directions(**query, geometry_detail="overview")
+        self.assertEqual([(8.68864, 49.42058), (8.68092, 49.41578)], route.geometry)
+
+        with self.assertRaises(ValueError):
+            self.client.directions(**query, geometry_detail="simplified")
+
     @responses.activate
     def test_full_directions_no_alternatives(self):
         query = deepcopy(ENDPOINTS_QUERIES[self.name]["directions"])
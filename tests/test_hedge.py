@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 GIS OPS UG
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+#
+"""Tests for the hedge module."""
+
+import json
+import threading
+import time
+
+import responses
+
+import tests as _test
+from routingpy import OSRM
+from routingpy.direction import Direction
+from routingpy.hedge import HedgePolicy
+from tests.test_helper import *
+
+
+class FakeResponse:
+    def __init__(self, url):
+        self.url = url
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakeSession:
+    """Responds after the delay configured for the URL's host."""
+
+    def __init__(self, delays):
+        self.delays = delays
+        self.urls = []
+        self.responses = []
+        self._lock = threading.Lock()
+
+    def get(self, url, **kwargs):
+        with self._lock:
+            self.urls.append(url)
+        host = url.split("/")[2]
+        time.sleep(self.delays.get(host, 0))
+        if host == "broken":
+            raise ConnectionError(url)
+
+        response = FakeResponse(url)
+        with self._lock:
+            self.responses.append(response)
+        return response
+
+
+class HedgePolicyTest(_test.TestCase):
+    def setUp(self):
+        self.session = FakeSession({"slow": 0.5})
+        self.policy = HedgePolicy(
+            ["http://slow", "http://fast"], percentile=50, max_hedge_ratio=0.2, min_samples=4
+        )
+
+    def tearDown(self):
+        self.policy.close()
+
+    def warm_up(self, n=4):
+        for _ in range(n):
+            self.policy.send(self.session.get, "http://fast", "/route", {})
+
+    def test_no_hedge_before_min_samples(self):
+        self.assertIsNone(self.policy.delay)
+        self.warm_up(3)
+        self.assertIsNone(self.policy.delay)
+        self.assertEqual(0, self.policy.hedges)
+
+        self.warm_up(1)
+        self.assertLess(self.policy.delay, 0.5)
+
+    def test_hedge_wins(self):
+        self.warm_up()
+        start = time.monotonic()
+        response = self.policy.send(self.session.get, "http://slow", "/route", {})
+
+        self.assertLess(time.monotonic() - start, 0.4)
+        self.assertEqual("http://fast/route", response.url)
+        self.assertEqual(["http://slow/route", "http://fast/route"], self.session.urls[-2:])
+        self.assertEqual(1, self.policy.hedges)
+        self.assertEqual(1, self.policy.hedge_wins)
+
+        # the slow loser's response is closed once it arrives
+        time.sleep(0.6)
+        loser = [r for r in self.session.responses if r.url == "http://slow/route"]
+        self.assertTrue(loser[0].closed)
+
+    def test_hedge_ratio(self):
+        self.warm_up()
+        self.policy.send(self.session.get, "http://slow", "/route", {})
+        # 6 requests * 0.2 don't allow a second hedge
+        response = self.policy.send(self.session.get, "http://slow", "/route", {})
+
+        self.assertEqual("http://slow/route", response.url)
+        self.assertEqual(1, self.policy.hedges)
+        self.assertEqual(6, self.policy.requests)
+
+    def test_failed_request(self):
+        self.session.delays["broken"] = 0.3
+        self.warm_up()
+        policy = HedgePolicy(["http://fast"], percentile=50, max_hedge_ratio=1, min_samples=1)
+        policy.send(self.session.get, "http://fast", "/route", {})
+
+        response = policy.send(self.session.get, "http://broken", "/route", {})
+        self.assertEqual("http://fast/route", response.url)
+
+        policy.endpoints = ["http://broken"]
+        with self.assertRaises(ConnectionError):
+            policy.send(self.session.get, "http://broken", "/route", {})
+        policy.close()
+
+    def test_concurrent_primaries(self):
+        self.session.delays["medium"] = 0.2
+        policy = HedgePolicy(
+            ["http://fast"], percentile=50, max_hedge_ratio=0, min_samples=1, max_workers=1
+        )
+        policy.send(self.session.get, "http://fast", "/route", {})
+
+        threads = [
+            threading.Thread(target=policy.send, args=(self.session.get, "http://medium", "/route", {}))
+            for _ in range(4)
+        ]
+        start = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # primaries don't queue for the hedge workers, nor does their latency include waiting
+        self.assertLess(time.monotonic() - start, 0.6)
+        self.assertLess(max(policy._latencies), 0.4)
+        policy.close()
+
+    def test_invalid_percentile(self):
+        with self.assertRaises(ValueError):
+            HedgePolicy(percentile=0)
+
+    @responses.activate
+    def test_client(self):
+        def slow_callback(request):
+            time.sleep(0.5)
+            return 200, {}, json.dumps(ENDPOINTS_RESPONSES["osrm"]["directions_geojson"])
+
+        def fast_callback(request):
+            return 200, {}, json.dumps(ENDPOINTS_RESPONSES["osrm"]["directions_geojson"])
+
+        responses.add_callback(
+            responses.GET,
+            "http://slow/route/v1/driving/8.688641,49.420577;8.680916,49.415776",
+            callback=slow_callback,
+            content_type="application/json",
+        )
+        responses.add_callback(
+            responses.GET,
+            "http://fast/route/v1/driving/8.688641,49.420577;8.680916,49.415776",
+            callback=fast_callback,
+            content_type="application/json",
+        )
+
+        policy = HedgePolicy(["http://fast"], percentile=50, max_hedge_ratio=1, min_samples=1)
+        router = OSRM(base_url="http://slow", hedge_policy=policy)
+        # observe the fast replica's latency
+        policy.send(
+            router.client._session.get,
+            "http://fast",
+            "/route/v1/driving/8.688641,49.420577;8.680916,49.415776",
+            {},
+        )
+
+        start = time.monotonic()
+        direction = router.directions(PARAM_LINE, "driving", geometries="geojson")
+
+        self.assertIsInstance(direction, Direction)
+        self.assertEqual(1, policy.hedge_wins)
+        self.assertLess(time.monotonic() - start, 0.4)
+        policy.close()
@@ -411,7 +411,8 @@ ENDPOINTS_RESPONSES = {
                                 },
                             ],
                         }
-                    ]
+                    ],
+                    "overview_polyline": {"points": "smslH__`t@~\\fo@"},
                 }
             ],
             "status": "OK",
@@ -1130,6 +1131,11 @@ ENDPOINTS_QUERIES = {
             "profile": "CAR",
             "num_itineraries": 3,
         },
+        "matrix": {
+            "locations": PARAM_LINE_MULTI,
+            "profile": "CAR",
+            "queries_per_request": 4,
+        },
         "isochrones": {
             "locations": PARAM_POINT,
             "time": datetime.datetime.fromisoformat("2023-07-07T16:00:00+00:00"),
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 GIS OPS UG
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+#
+"""Tests for the lazy imports of routers."""
+
+import json
+import os
+import subprocess
+import sys
+
+import tests as _test
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def imported_modules(code):
+    """Runs code in a fresh interpreter and returns the modules it imported."""
+    script = code + "\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"
+    output = subprocess.check_output([sys.executable, "-c", script], cwd=ROOT)
+    return set(json.loads(output.decode("utf-8").splitlines()[-1]))
+
+
+class LazyImportTest(_test.TestCase):
+    def test_import_routingpy(self):
+        modules = imported_modules("import routingpy")
+
+        self.assertNotIn("requests", modules)
+        self.assertNotIn("routingpy.valhalla_attributes", modules)
+        self.assertEqual(set(), {m for m in modules if m.startswith("routingpy.routers.")})
+
+    def test_import_one_router(self):
+        modules = imported_modules("from routingpy import OSRM")
+
+        self.assertIn("routingpy.routers.osrm", modules)
+        self.assertNotIn("routingpy.routers.valhalla", modules)
+        self.assertNotIn("routingpy.routers.google", modules)
+
+    def test_get_router_by_name(self):
+        modules = imported_modules(
+            "from routingpy.routers import get_router_by_name\n"
+            "assert get_router_by_name('otp').__name__ == 'OpenTripPlannerV2'"
+        )
+
+        self.assertIn("routingpy.routers.opentripplanner_v2", modules)
+        self.assertNotIn("routingpy.routers.heremaps", modules)
+
+    def test_star_import(self):
+        namespace = {}
+        exec("from routingpy import *", namespace)
+
+        for name in ("Valhalla", "OSRM", "Google", "get_router_by_name", "RouterNotFound"):
+            self.assertIn(name, namespace)
+        self.assertNotIn("options", namespace)
+
+    def test_attributes(self):
+        import routingpy
+        from routingpy import routers
+        from routingpy.routers.valhalla import Valhalla
+
+        self.assertIs(Valhalla, routingpy.Valhalla)
+        self.assertIs(Valhalla, routers.Valhalla)
+        self.assertIn("Valhalla", dir(routingpy))
+        self.assertFalse(hasattr(routingpy, "options"))
+        with self.assertRaises(AttributeError):
+            routingpy.Routers
+        with self.assertRaises(ImportError):
+            from routingpy import MapboxValhalla  # noqa: F401
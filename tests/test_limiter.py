@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 GIS OPS UG
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+#
+"""Tests for the limiter module."""
+
+import json
+import threading
+import time
+from unittest import mock
+
+import responses
+
+import tests as _test
+from routingpy import Valhalla
+from routingpy.batch import batch
+from routingpy.exceptions import OverQueryLimit, Timeout
+from routingpy.limiter import AIMDLimiter
+from tests.test_helper import *
+
+
+class AIMDLimiterTest(_test.TestCase):
+    def test_additive_increase(self):
+        limiter = AIMDLimiter(initial_limit=2, max_limit=3)
+        with mock.patch("routingpy.limiter.time.monotonic", return_value=10):
+            for _ in range(3):
+                start = limiter.acquire()
+                limiter.release(start)
+            self.assertEqual(3, limiter.limit)
+
+            for _ in range(10):
+                limiter.release(limiter.acquire())
+        self.assertEqual(3, limiter.limit)
+        self.assertEqual(0, limiter.in_flight)
+
+    def test_no_increase_on_latency_growth(self):
+        limiter = AIMDLimiter(initial_limit=2, latency_tolerance=2)
+        limiter.release(limiter.acquire() - 1)
+        limiter.release(limiter.acquire() - 5)
+        self.assertEqual(2.5, limiter._limit)
+
+    def test_multiplicative_decrease(self):
+        limiter = AIMDLimiter(initial_limit=16, min_limit=3)
+        starts = [limiter.acquire() for _ in range(3)]
+
+        limiter.release(starts[0], overloaded=True)
+        self.assertEqual(8, limiter.limit)
+        # requests sent before the backoff don't decrease the limit again
+        limiter.release(starts[1], overloaded=True)
+        self.assertEqual(8, limiter.limit)
+        self.assertEqual(1, limiter.backoffs)
+
+        for _ in range(3):
+            limiter.release(limiter.acquire(), overloaded=True)
+        self.assertEqual(3, limiter.limit)
+        limiter.release(starts[2])
+
+    def test_blocks_at_limit(self):
+        limiter = AIMDLimiter(initial_limit=1, max_limit=1)
+        start = limiter.acquire()
+        acquired = threading.Event()
+
+        thread = threading.Thread(target=lambda: (limiter.acquire(), acquired.set()))
+        thread.start()
+        self.assertFalse(acquired.wait(0.1))
+
+        limiter.release(start)
+        self.assertTrue(acquired.wait(1))
+        thread.join()
+
+    def test_acquire_timeout(self):
+        limiter = AIMDLimiter(initial_limit=1, max_limit=1)
+        start = limiter.acquire()
+
+        with self.assertRaises(Timeout):
+            limiter.acquire(timeout=0.05)
+
+        self.assertEqual(1, limiter.in_flight)
+        limiter.release(start)
+        limiter.release(limiter.acquire(timeout=0.05))
+
+    def test_client_deadline(self):
+        limiter = AIMDLimiter(initial_limit=1, max_limit=1)
+        router = Valhalla("https://valhalla.test", concurrency_limiter=limiter)
+        start = limiter.acquire()
+
+        begin = time.monotonic()
+        with self.assertRaises(Timeout):
+            router.directions(**ENDPOINTS_QUERIES["valhalla"]["directions"], deadline=0.2)
+
+        # waiting for a slot counts towards the deadline
+        self.assertLess(time.monotonic() - begin, 1)
+        self.assertEqual(1, limiter.in_flight)
+        limiter.release(start)
+
+    def test_invalid_limits(self):
+        with self.assertRaises(ValueError):
+            AIMDLimiter(initial_limit=10, max_limit=5)
+        with self.assertRaises(ValueError):
+            AIMDLimiter(backoff_ratio=1)
+
+    @responses.activate
+    def test_client_backs_off(self):
+        responses.add(
+            responses.POST,
+            "https://valhalla.test/route",
+            status=429,
+            json={"error": "Too Many Requests"},
+            content_type="application/json",
+        )
+        limiter = AIMDLimiter(initial_limit=8)
+        router = Valhalla("https://valhalla.test", concurrency_limiter=limiter)
+
+        with self.assertRaises(OverQueryLimit):
+            router.directions(**ENDPOINTS_QUERIES["valhalla"]["directions"])
+
+        self.assertEqual(4, limiter.limit)
+        self.assertEqual(0, limiter.in_flight)
+
+    @responses.activate
+    def test_batch_within_limit(self):
+        in_flight = []
+
+        def request_callback(request):
+            in_flight.append(limiter.in_flight)
+            time.sleep(0.01)
+            return 200, {}, json.dumps(ENDPOINTS_RESPONSES["valhalla"]["directions"])
+
+        responses.add_callback(
+            responses.POST,
+            "https://valhalla.test/route",
+            callback=request_callback,
+            content_type="application/json",
+        )
+        limiter = AIMDLimiter(initial_limit=2, max_limit=3)
+        router = Valhalla("https://valhalla.test", concurrency_limiter=limiter)
+        requests = [ENDPOINTS_QUERIES["valhalla"]["directions"]] * 20
+
+        results = list(batch(router.directions, requests, max_workers=8))
+
+        self.assertTrue(all(result.ok for result in results))
+        self.assertLessEqual(max(in_flight), 3)
+        self.assertEqual(3, limiter.limit)
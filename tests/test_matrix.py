@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 GIS OPS UG
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+#
+"""Tests for the matrix module."""
+
+import responses
+
+import tests as _test
+from routingpy import OSRM
+from routingpy.matrix import IncrementalMatrix, Matrix
+from tests.test_helper import *
+
+
+class FakeRouter:
+    """Returns the sum of the locations' x coordinates as duration and their difference as distance."""
+
+    def __init__(self):
+        self.calls = []
+
+    def matrix(self, locations, profile, sources=None, destinations=None):
+        self.calls.append((sources, destinations))
+        return Matrix(
+            durations=[[locations[s][0] + locations[d][0] for d in destinations] for s in sources],
+            distances=[[locations[s][0] - locations[d][0] for d in destinations] for s in sources],
+        )
+
+
+def full_matrix(xs):
+    return [[a + b for b in xs] for a in xs], [[a - b for b in xs] for a in xs]
+
+
+class IncrementalMatrixTest(_test.TestCase):
+    def setUp(self):
+        self.router = FakeRouter()
+
+    def test_add(self):
+        matrix = IncrementalMatrix(self.router, [[1, 0], [2, 0]], profile="car")
+        self.assertEqual([([0, 1], [0, 1])], self.router.calls)
+
+        matrix.add([[10, 0], [20, 0]])
+
+        self.assertEqual([([2, 3], [0, 1, 2, 3]), ([0, 1], [2, 3])], self.router.calls[1:])
+        durations, distances = full_matrix([1, 2, 10, 20])
+        self.assertEqual(durations, matrix.durations)
+        self.assertEqual(distances, matrix.distances)
+        self.assertEqual(4, len(matrix))
+
+    def test_existing_matrix(self):
+        durations, distances = full_matrix([1, 2])
+        matrix = IncrementalMatrix(
+            self.router,
+            [[1, 0], [2, 0]],
+            matrix=Matrix(durations=durations, distances=distances),
+            profile="car",
+        )
+        matrix.add([[5, 0]])
+
+        self.assertEqual(2, len(self.router.calls))
+        self.assertEqual(full_matrix([1, 2, 5])[0], matrix.durations)
+        # the passed matrix is left untouched
+        self.assertEqual(full_matrix([1, 2])[0], durations)
+
+    def test_remove_and_add(self):
+        matrix = IncrementalMatrix(self.router, [[1, 0], [2, 0], [3, 0], [4, 0]], profile="car")
+        matrix.remove([0, 2])
+
+        self.assertEqual(1, len(self.router.calls))
+        self.assertEqual([[2, 0], [4, 0]], matrix.locations)
+        self.assertEqual(full_matrix([2, 4])[0], matrix.durations)
+        self.assertEqual([6, 8], matrix.durations[1])
+        self.assertEqual([[4, 6]], [list(row) for row in matrix.durations[:1]])
+
+        matrix.add([[7, 0]])
+
+        self.assertEqual([([2], [0, 1, 2]), ([0, 1], [2])], self.router.calls[1:])
+        self.assertEqual(full_matrix([2, 4, 7])[1], matrix.distances)
+
+        plain = matrix.to_matrix()
+        self.assertIsInstance(plain, Matrix)
+        self.assertEqual(full_matrix([2, 4, 7])[0], plain.durations)
+        self.assertIsInstance(plain.durations[0], list)
+
+    @responses.activate
+    def test_osrm_requests(self):
+        responses.add(
+            responses.GET,
+            "https://routing.openstreetmap.de/routed-bike/table/v1/driving/8.688641,49.420577;8.680916,49.415776;8.780916,49.445776",
+            status=200,
+            json={"durations": [[1, 2, 3]], "distances": [[4, 5, 6]]},
+            content_type="application/json",
+        )
+        responses.add(
+            responses.GET,
+            "https://routing.openstreetmap.de/routed-bike/table/v1/driving/8.688641,49.420577;8.680916,49.415776;8.780916,49.445776",
+            status=200,
+            json={"durations": [[7], [8]], "distances": [[9], [10]]},
+            content_type="application/json",
+        )
+
+        existing = Matrix(durations=[[0, 1], [1, 0]], distances=[[0, 1], [1, 0]])
+        matrix = IncrementalMatrix(OSRM(), PARAM_LINE, matrix=existing)
+        matrix.add(PARAM_LINE_MULTI[2:])
+
+        self.assertEqual(2, len(responses.calls))
+        url = "https://routing.openstreetmap.de/routed-bike/table/v1/driving/8.688641,49.420577;8.680916,49.415776;8.780916,49.445776?annotations=duration%2Cdistance"
+        self.assertURLEqual(url + "&sources=2&destinations=0%3B1%3B2", responses.calls[0].request.url)
+        self.assertURLEqual(url + "&sources=0%3B1&destinations=2", responses.calls[1].request.url)
+        self.assertEqual([[0, 1, 7], [1, 0, 8], [1, 2, 3]], matrix.durations)
+        self.assertEqual([[0, 1, 9], [1, 0, 10], [4, 5, 6]], matrix.distances)
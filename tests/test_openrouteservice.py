@@ -16,6 +16,7 @@
 #
 """Tests for the openrouteservice module."""
 
+import array
 import json
 from copy import deepcopy
 
@@ -151,6 +152,28 @@ class ORSTest(_test.TestCase):
         self.assertIsInstance(matrix.distances, list)
         self.assertIsInstance(matrix.raw, dict)
 
+    @responses.activate
+    def test_matrix_buffer_locations(self):
+        query = deepcopy(ENDPOINTS_QUERIES[self.name]["matrix"])
+        expected = deepcopy(query)
+        del expected["profile"]
+
+        coordinates = array.array("d", [c for location in query["locations"] for c in location])
+        query["locations"] = memoryview(coordinates).cast("B").cast("d", [len(query["locations"]), 2])
+        query["sources"] = array.array("l", query["sources"])
+
+        responses.add(
+            responses.POST,
+            "https://api.openrouteservice.org/v2/matrix/{}/json".format(query["profile"]),
+            status=200,
+            json=ENDPOINTS_RESPONSES[self.name]["matrix"],
+            content_type="application/json",
+        )
+
+        self.client.matrix(**query)
+
+        self.assertEqual(expected, json.loads(responses.calls[0].request.body.decode("utf-8")))
+
     @responses.activate
     def test_key_in_header(self):
         # Test that API key is being put in the Authorization header
@@ -16,6 +16,8 @@
 #
 """Tests for the OpenTripPlannerV2 module."""
 
+import json
+import re
 import urllib.parse
 from copy import deepcopy
 
@@ -24,7 +26,9 @@ import responses
 import tests as _test
 from routingpy import OpenTripPlannerV2, convert
 from routingpy.direction import Direction, Directions
+from routingpy.exceptions import RouterApiError
 from routingpy.isochrone import Isochrone, Isochrones
+from routingpy.matrix import Matrix
 from routingpy.raster import Raster
 from tests.test_helper import *
 
@@ -137,3 +141,59 @@ class OpenTripPlannerV2Test(_test.TestCase):
             self.assertIsInstance(raster, Raster)
             self.assertEqual(raster.image, image)
             self.assertEqual(raster.max_travel_time, query["cutoff"])
+
+    @responses.activate
+    def test_matrix(self):
+        query = deepcopy(ENDPOINTS_QUERIES[self.name]["matrix"])
+        plan = ENDPOINTS_RESPONSES[self.name]["directions"]["data"]["plan"]
+
+        def request_callback(request):
+            aliases = re.findall(r"(p\d+): plan", json.loads(request.body)["query"])
+            return 200, {}, json.dumps({"data": {alias: plan for alias in aliases}})
+
+        responses.add_callback(
+            responses.POST,
+            "http://localhost:8080/otp/routers/default/index/graphql",
+            callback=request_callback,
+            content_type="application/json",
+        )
+        matrix = self.client.matrix(**query)
+
+        # 6 off-diagonal cells in batches of 4 queries
+        self.assertEqual(2, len(responses.calls))
+        self.assertIsInstance(matrix, Matrix)
+        self.assertEqual([[0, 178, 178], [178, 0, 178], [178, 178, 0]], matrix.durations)
+        self.assertEqual([[0, 1073, 1073], [1073, 0, 1073], [1073, 1073, 0]], matrix.distances)
+        self.assertEqual(6, len(matrix.raw["data"]))
+
+    @responses.activate
+    def test_matrix_graphql_error(self):
+        responses.add(
+            responses.POST,
+            "http://localhost:8080/otp/routers/default/index/graphql",
+            status=200,
+            json={"errors": [{"message": "Validation error"}], "data": None},
+            content_type="application/json",
+        )
+
+        with self.assertRaises(RouterApiError) as e:
+            self.client.matrix(**ENDPOINTS_QUERIES[self.name]["matrix"])
+        self.assertIn("Validation error", e.exception.message)
+
+    @responses.activate
+    def test_matrix_sources_destinations(self):
+        query = deepcopy(ENDPOINTS_QUERIES[self.name]["matrix"])
+        query["sources"] = [0]
+        query["destinations"] = [1, 2]
+
+        responses.add(
+            responses.POST,
+            "http://localhost:8080/otp/routers/default/index/graphql",
+            status=200,
+            json={"data": {"p0": {"itineraries": []}, "p1": None}},
+            content_type="application/json",
+        )
+        matrix = self.client.matrix(**query)
+
+        self.assertEqual(1, len(responses.calls))
+        self.assertEqual([[None, None]], matrix.durations)
@@ -16,12 +16,16 @@
 #
 """Tests for the OSRM module."""
 
+import importlib.util
+import re
+import unittest
+import urllib.parse
 from copy import deepcopy
 
 import responses
 
 import tests as _test
-from routingpy import OSRM, convert
+from routingpy import OSRM, convert, utils
 from routingpy.direction import Direction, Directions
 from routingpy.matrix import Matrix
 from tests.test_helper import *
@@ -273,3 +277,82 @@ class OSRMTest(_test.TestCase):
             f"https://routing.openstreetmap.de/routed-bike/table/v1/{query['profile']}/8.688641,49.420577;8.680916,49.415776;8.780916,49.445776?annotations=distance%2Cduration&bearings=50%2C50%3B50%2C50%3B50%2C50&destinations=0%3B2&radiuses=500%3B500%3B500&sources=1%3B2",
             responses.calls[0].request.url,
         )
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "NumPy is not installed")
+    @responses.activate
+    def test_matrix_numpy_locations(self):
+        import numpy as np
+
+        query = deepcopy(ENDPOINTS_QUERIES[self.name]["matrix"])
+        query.pop("fallback_speed", None)  # set by test_full_matrix
+        query["locations"] = np.array(query["locations"])
+        query["sources"] = np.array([1, 2])
+        query["destinations"] = np.array([0, 2])
+
+        responses.add(
+            responses.GET,
+            re.compile(r"https://routing.openstreetmap.de/routed-bike/table/v1/.*"),
+            status=200,
+            json=ENDPOINTS_RESPONSES["osrm"]["matrix"],
+            content_type="application/json",
+        )
+
+        self.client.matrix(**query)
+
+        self.assertURLEqual(
+            f"https://routing.openstreetmap.de/routed-bike/table/v1/{query['profile']}/8.688641,49.420577;8.680916,49.415776;8.780916,49.445776?annotations=distance%2Cduration&bearings=50%2C50%3B50%2C50%3B50%2C50&destinations=0%3B2&radiuses=500%3B500%3B500&sources=1%3B2",
+            responses.calls[0].request.url,
+        )
+
+    @responses.activate
+    def test_matrix_polyline6_locations(self):
+        responses.add(
+            responses.GET,
+            re.compile(r"https://routing.openstreetmap.de/routed-bike/table/v1/driving/.*"),
+            status=200,
+            json=ENDPOINTS_RESPONSES["osrm"]["matrix"],
+            content_type="application/json",
+        )
+        locations = [[8.6 + i / 1000, 49.4 + i / 3000] for i in range(150)]
+
+        self.client.matrix(locations, annotations=["duration"])
+
+        # the plain path would be longer than 2000 characters
+        path = urllib.parse.urlparse(responses.calls[0].request.url).path
+        self.assertRegex(path, r"^/routed-bike/table/v1/driving/polyline6\(.+\)$")
+        polyline = urllib.parse.unquote(path[len("/routed-bike/table/v1/driving/polyline6(") : -1])
+        self.assertEqual(
+            [tuple(round(c, 6) for c in location) for location in locations],
+            utils.decode_polyline6(polyline),
+        )
+
+    @responses.activate
+    def test_directions_polyline_locations(self):
+        query = ENDPOINTS_QUERIES[self.name]["directions"]
+        responses.add(
+            responses.GET,
+            re.compile(r"https://routing.openstreetmap.de/routed-bike/route/v1/.*"),
+            status=200,
+            json=ENDPOINTS_RESPONSES["osrm"]["directions_geojson"],
+            content_type="application/json",
+        )
+
+        OSRM(locations_encoding="polyline").directions(
+            query["locations"], query["profile"], geometries="geojson"
+        )
+        self.assertEqual(
+            "/routed-bike/route/v1/{}/polyline(smslH__%60t@~%5Cfo@ozD_pR)".format(query["profile"]),
+            urllib.parse.urlparse(responses.calls[0].request.url).path,
+        )
+
+        OSRM(locations_encoding="plain").directions(
+            query["locations"], query["profile"], geometries="geojson"
+        )
+        self.assertTrue(
+            responses.calls[1]
+            .request.url.split("?")[0]
+            .endswith("8.688641,49.420577;8.680916,49.415776;8.780916,49.445776")
+        )
+
+        with self.assertRaises(ValueError):
+            OSRM(locations_encoding="geojson")
@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 GIS OPS UG
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+#
+"""Tests for the osrm_flatbuffers module and OSRM's FlatBuffers responses."""
+
+import struct
+
+import responses
+
+import tests as _test
+from routingpy import OSRM, osrm_flatbuffers, utils
+from routingpy.direction import Direction, Directions
+from routingpy.exceptions import FlatBuffersParseError, RouterApiError
+from routingpy.matrix import Matrix
+
+CONTENT_TYPE = "application/x-flatbuffers;schema=osrm.engine.api.fbresult"
+
+
+class _Builder(object):
+    """Writes FlatBuffers front to back: the root offset first, then every table followed by its children.
+    Fields are given as {field id: (kind, value)}, every field takes a 4 byte slot in its table."""
+
+    def __init__(self):
+        self.buf = bytearray(4)
+
+    def finish(self, fields):
+        struct.pack_into("<I", self.buf, 0, self.table(fields))
+        return bytes(self.buf)
+
+    def table(self, fields):
+        n_fields = max(fields) + 1 if fields else 0
+        vtable = len(self.buf)
+        vtable_size = 4 + 2 * n_fields + (2 * n_fields) % 4
+        self.buf += bytes(vtable_size)
+        table = len(self.buf)
+        struct.pack_into("<HH", self.buf, vtable, vtable_size, 4 + 4 * n_fields)
+        self.buf += struct.pack("<i", table - vtable) + bytes(4 * n_fields)
+
+        for field, (kind, value) in sorted(fields.items()):
+            slot = table + 4 + 4 * field
+            struct.pack_into("<H", self.buf, vtable + 4 + 2 * field, slot - table)
+            if kind in ("<f", "<H", "<?"):
+                struct.pack_into(kind, self.buf, slot, value)
+            else:
+                struct.pack_into("<I", self.buf, slot, getattr(self, kind)(value) - slot)
+        return table
+
+    def string(self, value):
+        pos = len(self.buf)
+        data = value.encode("utf-8")
+        self.buf += struct.pack("<I", len(data)) + data + bytes(4 - len(data) % 4)
+        return pos
+
+    def floats(self, values):
+        pos = len(self.buf)
+        self.buf += struct.pack("<I{}f".format(len(values)), len(values), *values)
+        return pos
+
+    def positions(self, values):
+        pos = self.floats([c for coord in values for c in coord])
+        struct.pack_into("<I", self.buf, pos, len(values))
+        return pos
+
+    def tables(self, values):
+        pos = len(self.buf)
+        self.buf += struct.pack("<I", len(values)) + bytes(4 * len(values))
+        for idx, fields in enumerate(values):
+            slot = pos + 4 + 4 * idx
+            struct.pack_into("<I", self.buf, slot, self.table(fields) - slot)
+        return pos
+
+
+GEOMETRY = [[8.5, 49.25], [8.75, 49.5]]
+
+
+def _route(distance, duration, **geometry):
+    fields = {0: ("<f", distance), 1: ("<f", duration), 2: ("<f", 1.5), 3: ("string", "routability")}
+    if "polyline" in geometry:
+        fields[5] = ("string", geometry["polyline"])
+    else:
+        fields[6] = ("positions", geometry["coordinates"])
+    return fields
+
+
+ROUTES = _Builder().finish(
+    {
+        2: ("string", "20240101"),
+        3: ("tables", [{1: ("<f", 2.5)}]),  # waypoints, not read
+        4: (
+            "tables",
+            [
+                _route(1000.5, 100.25, polyline=utils.encode_polyline6(GEOMETRY)),
+                _route(2000, 200, polyline=utils.encode_polyline6(GEOMETRY[::-1])),
+            ],
+        ),
+    }
+)
+
+ROUTE_GEOJSON = _Builder().finish({4: ("tables", [_route(1000, 100, coordinates=GEOMETRY)])})
+
+TABLE = _Builder().finish(
+    {
+        5: (
+            "table",
+            {
+                0: ("floats", [0, 1.5, 2.5, 3.5, 0, 5.5]),
+                1: ("<H", 2),
+                2: ("<H", 3),
+                3: ("floats", [0, 10, 20, 30, 0, 50]),
+                5: ("floats", []),  # fallback_speed_cells, not read
+            },
+        )
+    }
+)
+
+ERROR = _Builder().finish(
+    {0: ("<?", True), 1: ("table", {0: ("string", "NoTable"), 1: ("string", "No table found")})}
+)
+
+
+class OSRMFlatBuffersTest(_test.TestCase):
+    def setUp(self):
+        self.client = OSRM()
+
+    def test_decode_route(self):
+        routes = osrm_flatbuffers.decode_route(ROUTES)
+
+        self.assertEqual(2, len(routes))
+        self.assertEqual(1000.5, routes[0]["distance"])
+        self.assertEqual(200, routes[1]["duration"])
+        self.assertEqual(
+            [(8.75, 49.5), (8.5, 49.25)], utils.decode_polyline6(routes[1]["polyline"], is3d=False)
+        )
+        self.assertIsNone(routes[0]["coordinates"])
+
+        self.assertEqual(GEOMETRY, osrm_flatbuffers.decode_route(ROUTE_GEOJSON)[0]["coordinates"])
+
+    def test_decode_table(self):
+        rows, cols, durations, distances = osrm_flatbuffers.decode_table(TABLE)
+
+        self.assertEqual((2, 3), (rows, cols))
+        self.assertEqual([0, 1.5, 2.5, 3.5, 0, 5.5], list(durations))
+        self.assertEqual([0, 10, 20, 30, 0, 50], list(distances))
+
+        rows, cols, durations, distances = osrm_flatbuffers.decode_table(
+            _Builder().finish({5: ("table", {0: ("floats", [0]), 1: ("<H", 1), 2: ("<H", 1)})})
+        )
+        self.assertIsNone(distances)
+
+    def test_invalid(self):
+        with self.assertRaises(RouterApiError) as error:
+            osrm_flatbuffers.decode_table(ERROR)
+        self.assertEqual("NoTable", error.exception.status)
+
+        for body in (TABLE[:-8], b"\x00\x01"):
+            with self.assertRaises(FlatBuffersParseError):
+                osrm_flatbuffers.decode_table(body)
+
+        with self.assertRaises(FlatBuffersParseError):
+            osrm_flatbuffers.decode_table(ROUTES)
+
+    @responses.activate
+    def test_directions_flatbuffers(self):
+        responses.add(
+            responses.GET,
+            "https://routing.openstreetmap.de/routed-bike/route/v1/driving/8.5,49.25;8.75,49.5.flatbuffers",
+            status=200,
+            body=ROUTES,
+            content_type=CONTENT_TYPE,
+        )
+
+        route = self.client.directions(GEOMETRY, geometries="polyline6", format="flatbuffers")
+        self.assertIsInstance(route, Direction)
+        self.assertEqual(GEOMETRY, [list(coord) for coord in route.geometry])
+        self.assertEqual(100, route.duration)
+        self.assertEqual(1000, route.distance)
+        self.assertEqual(ROUTES, route.raw)
+
+        routes = self.client.directions(
+            GEOMETRY, geometries="polyline6", alternatives=True, format="flatbuffers"
+        )
+        self.assertIsInstance(routes, Directions)
+        self.assertEqual([1000, 2000], [route.distance for route in routes])
+
+        with self.assertRaises(ValueError):
+            self.client.directions(GEOMETRY, format="xml")
+
+    @responses.activate
+    def test_matrix_flatbuffers(self):
+        responses.add(
+            responses.GET,
+            "https://routing.openstreetmap.de/routed-bike/table/v1/driving/8.5,49.25;8.75,49.5.flatbuffers",
+            status=200,
+            body=TABLE,
+            content_type=CONTENT_TYPE,
+        )
+
+        matrix = self.client.matrix(
+            GEOMETRY, sources=[0, 1], destinations=[0, 1, 1], format="flatbuffers"
+        )
+
+        self.assertIsInstance(matrix, Matrix)
+        self.assertEqual([[0, 1.5, 2.5], [3.5, 0, 5.5]], matrix.durations)
+        self.assertEqual([[0, 10, 20], [30, 0, 50]], matrix.distances)
+        self.assertEqual(2, len(matrix.durations))
+        self.assertEqual(5.5, matrix.durations[-1][-1])
+        self.assertEqual([1.5, 2.5], matrix.durations[0][1:])
+        self.assertEqual([[30, 0, 50]], matrix.distances[1:])
+        self.assertEqual(TABLE, matrix.raw)
+        with self.assertRaises(IndexError):
+            matrix.durations[0][3]
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 GIS OPS UG
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+#
+"""Tests for the scheduler module."""
+
+import threading
+import time
+
+import responses
+
+import tests as _test
+from routingpy import Valhalla
+from routingpy.exceptions import Timeout
+from routingpy.scheduler import PriorityScheduler, classify_by_endpoint
+from tests.test_helper import *
+
+
+class PrioritySchedulerTest(_test.TestCase):
+    def setUp(self):
+        self.order = []
+
+    def enqueue(self, scheduler, name, url, priority=None, deadline=None):
+        """Starts a thread requesting a slot and waits until it's queued."""
+        queued = sum(scheduler.queued(p) for p in scheduler.priorities)
+
+        def request():
+            if priority is None:
+                ticket = scheduler.acquire(url)
+            else:
+                with scheduler.priority(priority, deadline):
+                    ticket = scheduler.acquire(url)
+            self.order.append(name)
+            scheduler.release(ticket)
+
+        thread = threading.Thread(target=request)
+        thread.start()
+        while sum(scheduler.queued(p) for p in scheduler.priorities) == queued:
+            time.sleep(0.001)
+        return thread
+
+    def test_interactive_overtakes_batch(self):
+        scheduler = PriorityScheduler(max_concurrency=1)
+        ticket = scheduler.acquire("/route")
+
+        threads = [
+            self.enqueue(scheduler, "tile 1", "/sources_to_targets"),
+            self.enqueue(scheduler, "tile 2", "/sources_to_targets"),
+            self.enqueue(scheduler, "route", "/route"),
+        ]
+        self.assertEqual(2, scheduler.queued("batch"))
+        self.assertEqual(1, scheduler.queued("interactive"))
+
+        scheduler.release(ticket)
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(["route", "tile 1", "tile 2"], self.order)
+
+    def test_deadline_order(self):
+        scheduler = PriorityScheduler(max_concurrency=1)
+        ticket = scheduler.acquire("/route")
+
+        threads = [
+            self.enqueue(scheduler, "late", "/route", "interactive", deadline=10),
+            self.enqueue(scheduler, "none", "/route", "interactive"),
+            self.enqueue(scheduler, "early", "/route", "interactive", deadline=5),
+        ]
+        scheduler.release(ticket)
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(["early", "late", "none"], self.order)
+
+    def test_deadline_passed(self):
+        scheduler = PriorityScheduler(max_concurrency=1)
+        ticket = scheduler.acquire("/route")
+
+        with self.assertRaises(Timeout):
+            with scheduler.priority("interactive", deadline=0.05):
+                scheduler.acquire("/route")
+
+        self.assertEqual(0, scheduler.queued("interactive"))
+        scheduler.release(ticket)
+        scheduler.release(scheduler.acquire("/route"))
+
+    def test_client_deadline(self):
+        scheduler = PriorityScheduler(max_concurrency=1)
+        router = Valhalla("https://valhalla.test", scheduler=scheduler)
+        ticket = scheduler.acquire("/route")
+
+        begin = time.monotonic()
+        with self.assertRaises(Timeout):
+            with scheduler.priority("interactive", deadline=10):
+                router.directions(**ENDPOINTS_QUERIES["valhalla"]["directions"], deadline=0.2)
+
+        # the call's deadline is earlier than the priority context's
+        self.assertLess(time.monotonic() - begin, 1)
+        self.assertEqual(0, scheduler.queued("interactive"))
+        scheduler.release(ticket)
+        self.assertEqual(0, scheduler.in_flight("interactive"))
+
+    def test_quotas(self):
+        scheduler = PriorityScheduler(max_concurrency=2, quotas={"batch": 1})
+        batch_ticket = scheduler.acquire("/table/v1/driving/1,2;3,4")
+
+        thread = self.enqueue(scheduler, "tile", "/table/v1/driving/1,2;3,4")
+        # the batch quota is exhausted, but interactive requests still get a slot
+        interactive_ticket = scheduler.acquire("/route")
+        self.assertEqual(1, scheduler.in_flight("interactive"))
+        self.assertEqual(1, scheduler.queued("batch"))
+
+        scheduler.release(batch_ticket)
+        thread.join()
+        scheduler.release(interactive_ticket)
+        self.assertEqual(["tile"], self.order)
+
+        with self.assertRaises(ValueError):
+            PriorityScheduler(quotas={"realtime": 1})
+
+    def test_classify_by_endpoint(self):
+        self.assertEqual("batch", classify_by_endpoint("/sources_to_targets"))
+        self.assertEqual("batch", classify_by_endpoint("/table/v1/driving/1,2;3,4?sources=0"))
+        self.assertEqual("batch", classify_by_endpoint("/maps/api/distancematrix/json?origins=1,2"))
+        self.assertEqual("batch", classify_by_endpoint("/v2/matrix/driving-car"))
+        self.assertEqual("interactive", classify_by_endpoint("/route"))
+        self.assertEqual("interactive", classify_by_endpoint("/route/v1/driving/1,2;3,4"))
+
+    @responses.activate
+    def test_client(self):
+        responses.add(
+            responses.POST,
+            "https://valhalla.test/route",
+            status=200,
+            json=ENDPOINTS_RESPONSES["valhalla"]["directions"],
+            content_type="application/json",
+        )
+        scheduler = PriorityScheduler(max_concurrency=1)
+        router = Valhalla("https://valhalla.test", scheduler=scheduler)
+
+        with scheduler.priority("batch"):
+            router.directions(**ENDPOINTS_QUERIES["valhalla"]["directions"])
+        router.directions(**ENDPOINTS_QUERIES["valhalla"]["directions"])
+
+        self.assertEqual(2, len(responses.calls))
+        self.assertEqual(0, scheduler.in_flight("batch"))
+        self.assertEqual(0, scheduler.in_flight("interactive"))
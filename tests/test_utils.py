@@ -47,6 +47,36 @@ class UtilsTest(_test.TestCase):
         decoded = [(49.420577, 8.688641, 120.96), (49.415776, 8.680916, 1491.39)]
         self.assertEqual(decoded, utils.decode_polyline6(self.coords3d_6prec, True, order="latlng"))
 
+    def test_polylines5_decoding(self):
+        polylines = [
+            self.coords2d_5prec,
+            "",
+            utils.encode_polyline5([(8.68092, 49.41578), (8.7, 49.5)]),
+            utils.encode_polyline5([(8.7, 49.5)]),
+        ]
+        decoded = [(8.68864, 49.42058), (8.68092, 49.41578), (8.7, 49.5)]
+        self.assertEqual(decoded, utils.decode_polylines5(polylines))
+        self.assertEqual(
+            [(lat, lng) for lng, lat in decoded], utils.decode_polylines5(polylines, order="latlng")
+        )
+
+    def test_polyline5_encoding(self):
+        self.assertEqual(
+            self.coords2d_5prec, utils.encode_polyline5([(8.68864, 49.42058), (8.68092, 49.41578)])
+        )
+        # Google's reference example
+        self.assertEqual(
+            "_p~iF~ps|U_ulLnnqC_mqNvxq`@",
+            utils.encode_polyline5(
+                [(38.5, -120.2), (40.7, -120.95), (43.252, -126.453)], order="latlng"
+            ),
+        )
+
+    def test_polyline6_encoding(self):
+        coordinates = [(8.688641, 49.420577), (8.680916, 49.415776)]
+        self.assertEqual(self.coords2d_6prec, utils.encode_polyline6(coordinates))
+        self.assertEqual(coordinates, utils.decode_polyline6(utils.encode_polyline6(coordinates)))
+
     def test_get_ordinal(self):
         self.assertEqual(utils.get_ordinal(0), "th")
         self.assertEqual(utils.get_ordinal(1), "st")
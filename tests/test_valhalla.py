@@ -16,17 +16,22 @@
 #
 """Tests for the Valhalla module."""
 
+import array
+import importlib.util
 import json
+import unittest
 from copy import deepcopy
 
 import responses
 
 import tests as _test
-from routingpy import Valhalla
+from routingpy import Valhalla, utils
 from routingpy.direction import Direction
+from routingpy.exceptions import JSONParseError
 from routingpy.expansion import Expansions
 from routingpy.isochrone import Isochrone, Isochrones
 from routingpy.matrix import Matrix
+from routingpy.parse_pool import ParsePool
 from routingpy.valhalla_attributes import (
     MatchedEdge,
     MatchedPoint,
@@ -172,6 +177,77 @@ class ValhallaTest(_test.TestCase):
         self.assertIsInstance(matrix.distances, list)
         self.assertIsInstance(matrix.raw, dict)
 
+    @responses.activate
+    def test_matrix_concise(self):
+        query = deepcopy(ENDPOINTS_QUERIES[self.name]["matrix"])
+        query["units"] = "km"
+        verbose = ENDPOINTS_RESPONSES[self.name]["matrix"]["sources_to_targets"]
+        concise = {
+            "sources_to_targets": {
+                "durations": [[cell["time"] for cell in row] for row in verbose] + [[None, 5]],
+                "distances": [[cell["distance"] / 1000 for cell in row] for row in verbose]
+                + [[None, 1.5]],
+            }
+        }
+
+        responses.add(
+            responses.POST,
+            "https://api.mapbox.com/valhalla/v1/sources_to_targets",
+            status=200,
+            json=concise,
+            content_type="application/json",
+        )
+
+        matrix = self.client.matrix(**query, verbose=False)
+
+        self.assertFalse(json.loads(responses.calls[0].request.body.decode("utf-8"))["verbose"])
+        self.assertEqual([[0, 100], [100, 0], [None, 5]], matrix.durations)
+        self.assertEqual([[0, 100], [100, 0], [None, 1500]], matrix.distances)
+
+    @responses.activate
+    def test_matrix_buffer_locations(self):
+        query = deepcopy(ENDPOINTS_QUERIES[self.name]["matrix"])
+        expected = ENDPOINTS_EXPECTED[self.name]["matrix"]
+        coordinates = array.array("d", [c for location in query["locations"] for c in location])
+        query["locations"] = memoryview(coordinates).cast("B").cast("d", [len(query["locations"]), 2])
+
+        responses.add(
+            responses.POST,
+            "https://api.mapbox.com/valhalla/v1/sources_to_targets",
+            status=200,
+            json=ENDPOINTS_RESPONSES[self.name]["matrix"],
+            content_type="application/json",
+        )
+
+        self.client.matrix(**query)
+
+        self.assertEqual(json.loads(responses.calls[0].request.body.decode("utf-8")), expected)
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "NumPy is not installed")
+    @responses.activate
+    def test_matrix_numpy_locations(self):
+        import numpy as np
+
+        query = deepcopy(ENDPOINTS_QUERIES[self.name]["matrix"])
+        query["locations"] = np.array(query["locations"])
+        query["sources"] = np.array([2])
+        expected = deepcopy(ENDPOINTS_EXPECTED[self.name]["matrix"])
+        expected["sources"] = expected["sources"][2:]
+
+        responses.add(
+            responses.POST,
+            "https://api.mapbox.com/valhalla/v1/sources_to_targets",
+            status=200,
+            json=ENDPOINTS_RESPONSES[self.name]["matrix"],
+            content_type="application/json",
+        )
+
+        self.client.matrix(**query)
+
+        body = json.loads(responses.calls[0].request.body.decode("utf-8"))
+        self.assertEqual(body["sources"], expected["sources"])
+        self.assertEqual(body["targets"], expected["targets"])
+
     @responses.activate
     def test_few_sources_destinations_matrix(self):
         query = deepcopy(ENDPOINTS_QUERIES[self.name]["matrix"])
@@ -245,3 +321,119 @@ class ValhallaTest(_test.TestCase):
             self.assertIsInstance(pt, MatchedPoint)
             self.assertEqual(pt.match_type, "matched")
             self.assertGreaterEqual(pt.edge_index, 0)
+
+    @responses.activate
+    def test_trace_attributes_chunks(self):
+        # trace point i is matched to the edge with id 100 + i // 3, except for point 10
+        def match(request):
+            body = json.loads(request.body)
+            trace = [round(point["lon"] * 1000) for point in body["shape"]]
+            first, last = trace[0] // 3, trace[-1] // 3
+            points = [
+                {"lon": idx / 1000, "lat": 0.0, "type": "matched", "edge_index": idx // 3 - first}
+                for idx in trace
+            ]
+            for point in points:
+                if point["lon"] == 0.01:
+                    point.pop("edge_index")
+                    point["type"] = "unmatched"
+            edges = [
+                {
+                    "id": 100 + edge,
+                    "use": "road",
+                    "sidewalk": "both",
+                    "begin_shape_index": edge - first,
+                    "end_shape_index": edge - first + 1,
+                    "end_node": {"admin_index": 0 if first == 0 else 1},
+                }
+                for edge in range(first, last + 1)
+            ]
+            response = {
+                "shape": utils.encode_polyline6([[node / 1000, 0] for node in range(first, last + 2)]),
+                "edges": edges,
+                "matched_points": points,
+                "admins": [{"country_code": "DE"}]
+                if first == 0
+                else [{"country_code": "FR"}, {"country_code": "DE"}],
+                "units": "kilometers",
+            }
+            return 200, {}, json.dumps(response)
+
+        responses.add_callback(
+            responses.POST,
+            "https://api.mapbox.com/valhalla/v1/trace_attributes",
+            callback=match,
+            content_type="application/json",
+        )
+
+        matched = self.client.trace_attributes(
+            [[idx / 1000, 0] for idx in range(40)],
+            filters=["edge.id", "edge.names"],
+            filters_action="exclude",
+            chunk_size=12,
+            chunk_overlap=4,
+        )
+
+        self.assertEqual(5, len(responses.calls))
+        for call in responses.calls:
+            body = json.loads(call.request.body)
+            self.assertLessEqual(len(body["shape"]), 12)
+            self.assertEqual(["edge.names"], body["filters"]["attributes"])
+
+        self.assertEqual(list(range(100, 114)), [edge.edge_id for edge in matched.matched_edges])
+        for edge in matched.matched_edges:
+            node = edge.edge_id - 100
+            self.assertEqual([(node / 1000, 0), ((node + 1) / 1000, 0)], edge.geometry)
+
+        self.assertEqual(40, len(matched.matched_points))
+        for idx, point in enumerate(matched.matched_points):
+            self.assertEqual(None if idx == 10 else idx // 3, point.edge_index)
+
+        self.assertEqual([{"country_code": "DE"}, {"country_code": "FR"}], matched.raw["admins"])
+        self.assertEqual({0}, {edge["end_node"]["admin_index"] for edge in matched.raw["edges"]})
+        self.assertEqual(15, len(utils.decode_polyline6(matched.raw["shape"])))
+
+        with self.assertRaises(ValueError):
+            self.client.trace_attributes([[0, 0], [1, 1]], chunk_size=12, chunk_overlap=6)
+
+    @responses.activate
+    def test_parse_pool_invalid_json(self):
+        responses.add(
+            responses.POST,
+            "https://api.mapbox.com/valhalla/v1/expansion",
+            status=200,
+            body="<html>Bad gateway</html>",
+            content_type="text/html",
+        )
+
+        with ParsePool(max_workers=1) as pool:
+            client = Valhalla("https://api.mapbox.com/valhalla/v1", parse_pool=pool)
+            with self.assertRaises(JSONParseError):
+                client.expansion(**ENDPOINTS_QUERIES[self.name]["expansion"])
+
+    @responses.activate
+    def test_parse_pool(self):
+        query = ENDPOINTS_QUERIES[self.name]["expansion"]
+        responses.add(
+            responses.POST,
+            "https://api.mapbox.com/valhalla/v1/expansion",
+            status=200,
+            json=ENDPOINTS_RESPONSES[self.name]["expansion"],
+            content_type="application/json",
+        )
+
+        with ParsePool(max_workers=1) as pool:
+            client = Valhalla("https://api.mapbox.com/valhalla/v1", parse_pool=pool)
+            expansion = client.expansion(**query)
+
+        expected = self.client.parse_expansion_json(
+            ENDPOINTS_RESPONSES[self.name]["expansion"],
+            query["locations"],
+            query["expansion_properties"],
+            query.get("interval_type", "time"),
+        )
+
+        self.assertIsInstance(expansion, Expansions)
+        self.assertIsNone(expansion.raw)
+        self.assertEqual([e.geometry for e in expected], [e.geometry for e in expansion])
+        self.assertEqual([e.duration for e in expected], [e.duration for e in expansion])
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 GIS OPS UG
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+#
+"""Tests for the valhalla_pbf module and Valhalla's protobuf responses."""
+
+import json
+import struct
+
+import responses
+
+import tests as _test
+from routingpy import Valhalla, utils, valhalla_pbf
+from routingpy.direction import Direction
+from routingpy.exceptions import ProtobufParseError
+from routingpy.isochrone import Isochrones
+from routingpy.matrix import Matrix
+from routingpy.parse_pool import ParsePool
+
+
+def _varint(value):
+    out = bytearray()
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _key(number, wire_type):
+    return _varint(number << 3 | wire_type)
+
+
+def _message(number, *fields):
+    payload = b"".join(fields)
+    return _key(number, 2) + _varint(len(payload)) + payload
+
+
+def _string(number, value):
+    return _message(number, value.encode("utf-8"))
+
+
+def _float(number, value):
+    return _key(number, 5) + struct.pack("<f", value)
+
+
+def _double(number, value):
+    return _key(number, 1) + struct.pack("<d", value)
+
+
+def _uint(number, value):
+    return _key(number, 0) + _varint(value)
+
+
+def _packed_uints(number, values):
+    return _message(number, *[_varint(value) for value in values])
+
+
+def _packed_floats(number, values):
+    return _message(number, struct.pack("<{}f".format(len(values)), *values))
+
+
+def _packed_sints(number, values):
+    return _packed_uints(number, [value << 1 if value >= 0 else (~value << 1) | 1 for value in values])
+
+
+SHAPES = [[(8.688641, 49.420577), (8.680916, 49.415776)], [(8.680916, 49.415776), (8.780916, 49.445776)]]
+
+ROUTE = b"".join(
+    [
+        _message(1, _uint(1, 2)),  # options, skipped
+        _message(
+            3,  # directions
+            _message(
+                1,  # routes
+                *[
+                    _message(
+                        1,  # legs
+                        _uint(2, idx),  # leg_id, skipped
+                        _message(5, _float(1, 1.234), _double(2, 100.5), _uint(5, 1)),  # summary
+                        _message(6, _string(1, "Turn left")),  # maneuver, skipped
+                        _string(7, utils.encode_polyline6(shape)),
+                    )
+                    for idx, shape in enumerate(SHAPES)
+                ],
+            ),
+        ),
+        _message(20, _string(1, "warnings")),  # info, skipped
+    ]
+)
+
+# 2 sources x 2 targets, the last cell without a path
+MATRIX = _message(
+    5,
+    _packed_uints(2, [0, 1234, 1500, 100000000]),
+    _packed_floats(3, [0, 100.7, 120, valhalla_pbf.MAX_COST]),
+    _packed_uints(4, [0, 0, 1, 1]),
+)
+
+RING = [(8.681, 49.42), (8.686, 49.42), (8.686, 49.424), (8.681, 49.42)]
+
+ISOCHRONE = _message(
+    6,
+    *[
+        _message(
+            1,  # intervals from the largest to the smallest
+            _uint(1, 0),
+            _float(2, minutes),
+            _message(
+                3, _message(2, _packed_sints(1, [round(c * 1e6) for coord in RING for c in coord]))
+            ),
+        )
+        for minutes in (10, 5)
+    ],
+)
+
+
+class ValhallaPbfTest(_test.TestCase):
+    def setUp(self):
+        self.client = Valhalla("https://api.mapbox.com/valhalla/v1")
+
+    def test_decode_route(self):
+        legs = valhalla_pbf.decode_route(ROUTE)
+
+        self.assertEqual(2, len(legs))
+        self.assertEqual(SHAPES[1], utils.decode_polyline6(legs[1]["shape"]))
+        self.assertEqual(100.5, legs[0]["time"])
+        self.assertAlmostEqual(1.234, legs[0]["length"], places=6)
+
+    def test_decode_matrix(self):
+        times, distances = valhalla_pbf.decode_matrix(MATRIX)
+        self.assertEqual([0, 1234, 1500, 100000000], distances)
+        self.assertEqual(valhalla_pbf.MAX_COST, times[3])
+
+        # unpacked repeated fields
+        times, distances = valhalla_pbf.decode_matrix(
+            _message(5, _uint(2, 7), _uint(2, 8), _float(3, 1.5), _float(3, 2.5))
+        )
+        self.assertEqual([7, 8], distances)
+        self.assertEqual([1.5, 2.5], list(times))
+
+    def test_decode_isochrone(self):
+        intervals = valhalla_pbf.decode_isochrone(ISOCHRONE)
+
+        self.assertEqual([10, 5], [value for value, _ in intervals])
+        self.assertEqual([[list(coord) for coord in RING]], intervals[0][1][0])
+
+    def test_truncated(self):
+        for decode, body in (
+            (valhalla_pbf.decode_route, ROUTE[:-3]),
+            (valhalla_pbf.decode_matrix, MATRIX[:-1]),
+            (valhalla_pbf.decode_isochrone, b"\x32\xff"),
+        ):
+            with self.assertRaises(ProtobufParseError):
+                decode(body)
+
+    @responses.activate
+    def test_directions_pbf(self):
+        responses.add(
+            responses.POST,
+            "https://api.mapbox.com/valhalla/v1/route",
+            status=200,
+            body=ROUTE,
+            content_type="application/x-protobuf",
+        )
+
+        route = self.client.directions([SHAPES[0][0], SHAPES[1][1]], "auto", format="pbf")
+
+        self.assertEqual("pbf", json.loads(responses.calls[0].request.body)["format"])
+        self.assertIsInstance(route, Direction)
+        self.assertEqual(SHAPES[0] + SHAPES[1], route.geometry)
+        self.assertEqual(201, route.duration)
+        self.assertEqual(2468, route.distance)
+        self.assertEqual(ROUTE, route.raw)
+
+        with self.assertRaises(ValueError):
+            self.client.directions([SHAPES[0][0], SHAPES[1][1]], "auto", format="osrm")
+
+    @responses.activate
+    def test_matrix_pbf(self):
+        responses.add(
+            responses.POST,
+            "https://api.mapbox.com/valhalla/v1/sources_to_targets",
+            status=200,
+            body=MATRIX,
+            content_type="application/x-protobuf",
+        )
+
+        matrix = self.client.matrix(SHAPES[0], "auto", format="pbf")
+
+        self.assertIsInstance(matrix, Matrix)
+        self.assertEqual([[0, 100], [120, None]], matrix.durations)
+        self.assertEqual([[0, 1234], [1500, None]], matrix.distances)
+
+    @responses.activate
+    def test_isochrones_pbf(self):
+        responses.add(
+            responses.POST,
+            "https://api.mapbox.com/valhalla/v1/isochrone",
+            status=200,
+            body=ISOCHRONE,
+            content_type="application/x-protobuf",
+        )
+
+        isochrones = self.client.isochrones(RING[0], "auto", [300, 600], polygons=True, format="pbf")
+        self.assertIsInstance(isochrones, Isochrones)
+        self.assertEqual([300, 600], [isochrone.interval for isochrone in isochrones])
+        self.assertEqual([[list(coord) for coord in RING]], isochrones[0].geometry)
+
+        isochrones = self.client.isochrones(RING[0], "auto", [300, 600], format="pbf")
+        self.assertEqual([list(coord) for coord in RING], isochrones[1].geometry)
+
+    @responses.activate
+    def test_parse_pool_pbf(self):
+        responses.add(
+            responses.POST,
+            "https://api.mapbox.com/valhalla/v1/sources_to_targets",
+            status=200,
+            body=MATRIX,
+            content_type="application/x-protobuf",
+        )
+
+        with ParsePool(max_workers=1) as pool:
+            client = Valhalla("https://api.mapbox.com/valhalla/v1", parse_pool=pool)
+            matrix = client.matrix(SHAPES[0], "auto", format="pbf")
+
+        self.assertEqual([[0, 1234], [1500, None]], matrix.distances)